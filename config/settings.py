@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 from pathlib import Path
 from config.keys import DJANGO_SECRET_KEY
+import os
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -86,12 +87,40 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# 로컬 개발은 SQLite, 크롤링 워커 여러 개가 동시에 저장할 때는 PostgreSQL (DB_ENGINE=postgres)
+#   docker run -d --name crawling-postgres -e POSTGRES_PASSWORD=postgres -e POSTGRES_DB=crawling -p 5432:5432 postgres:16
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+
+if DB_ENGINE == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'youtube_crawling.db_backends.postgresql_pool',  # psycopg_pool 커넥션 풀을 쓰는 postgresql 백엔드
+            'NAME': os.environ.get('POSTGRES_DB', 'crawling'),
+            'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', 'postgres'),
+            'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),  # 연결을 요청/태스크마다 새로 열지 않고 재사용(초)
+            'CONN_HEALTH_CHECKS': True,  # 재사용 전에 끊긴 연결인지 확인
+            'OPTIONS': {
+                'pool': {  # 워커 프로세스당 커넥션 풀
+                    'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 1)),
+                    'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+                    'timeout': 30,  # 풀이 가득 찼을 때 연결을 기다리는 최대 시간(초)
+                },
+            },
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'OPTIONS': {
+                'timeout': 20,  # 다른 쓰기가 끝나기를 기다리는 시간(초), 짧으면 "database is locked"
+            },
+        }
     }
-}
 
 
 # Password validation
@@ -142,4 +171,80 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers.DatabaseScheduler'
+CELERY_IMPORTS = ['youtube_crawling.longform_tasks']  # 태스크 모듈 이름이 tasks.py가 아니라서 직접 등록
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # 영상 태스크가 길어서 미리 여러 개 가져가지 않도록
+
+# 크롤링 파이프라인 큐: 큐별로 워커를 따로 띄워서 머신마다 동시성을 조절
+#   celery -A config worker -Q crawl_discovery -c 2
+#   celery -A config worker -Q crawl_videos -c 4      # 머신을 늘리면 수평 확장
+#   celery -A config worker -Q crawl_finalize -c 1    # DB 쓰기는 한 곳에서만
+CRAWLER_TASK_QUEUES = {
+    'discover': 'crawl_discovery',
+    'video': 'crawl_videos',
+    'finalize': 'crawl_finalize',
+}
+CRAWLER_VIDEO_TASK_RATE_LIMIT = None  # 워커 하나당 영상 태스크 실행 속도 제한 (예: '30/m'), None이면 제한 없음
+CELERY_TASK_ROUTES = {
+    'youtube_crawling.longform_tasks.crawl_channels_task': {'queue': CRAWLER_TASK_QUEUES['discover']},
+    'youtube_crawling.longform_tasks.discover_channel_task': {'queue': CRAWLER_TASK_QUEUES['discover']},
+    'youtube_crawling.longform_tasks.crawl_video_task': {'queue': CRAWLER_TASK_QUEUES['video']},
+    'youtube_crawling.longform_tasks.finalize_channel_task': {'queue': CRAWLER_TASK_QUEUES['finalize']},
+}
+CELERY_TASK_ANNOTATIONS = {
+    'youtube_crawling.longform_tasks.crawl_video_task': {'rate_limit': CRAWLER_VIDEO_TASK_RATE_LIMIT},
+}
 
+# 크롤러 설정
+CRAWLER_WORKERS = 4  # 동시에 띄울 크롬 드라이버(워커) 수
+CRAWLER_VIDEO_MAX_RETRIES = 2  # 드라이버가 죽었을 때 영상 하나당 재시도 횟수
+CRAWLER_PAGE_BUDGET = 40  # 영상 한 개당 전체 대기 시간 예산(초)
+CRAWLER_WAIT_TIMEOUTS = {  # 단계별 최대 대기 시간(초), 조건이 만족되면 바로 다음 단계로 진행
+    'page_load': 15,
+    'metadata': 10,
+    'scroll': 10,
+    'expand': 5,
+    'merch_shelf': 3,
+}
+CRAWLER_BACKEND = 'selenium'  # 'selenium' 또는 'http' (ytInitialData JSON 파싱, 필요할 때만 Selenium 사용)
+CRAWLER_HTTP_POOL_SIZE = 10  # HTTP 백엔드 커넥션 풀 크기
+CRAWLER_HTTP_TIMEOUT = 10  # HTTP 백엔드 요청 타임아웃(초)
+CRAWLER_HTTP_SELENIUM_FALLBACK = True  # JSON에 제품 섹션은 있는데 읽지 못하면 Selenium으로 다시 확인 (섹션이 없으면 제품 0개)
+CRAWLER_ASYNC_CONCURRENCY = 32  # 비동기 크롤링(crawl_channel_videos_async)에서 동시에 진행할 영상 수
+CRAWLER_RATE_LIMIT = True  # 모든 페이지 요청을 호스트별 속도 제한(토큰 버킷 + AIMD)을 거쳐서 보냄
+CRAWLER_RATE_REDIS_URL = CELERY_BROKER_URL  # 워커/머신 간 제한 상태 공유 (연결 안 되면 프로세스 안에서만 제한)
+CRAWLER_RATE_INITIAL = 2.0  # 호스트별 시작 요청 속도(초당)
+CRAWLER_RATE_MIN = 0.2  # 차단 신호가 계속 와도 이 밑으로는 안 내림
+CRAWLER_RATE_MAX = 20.0  # 응답이 정상이어도 이 위로는 안 올림
+CRAWLER_RATE_INCREASE = 0.1  # 정상 응답이 이어질 때 초마다 올리는 속도 (additive increase)
+CRAWLER_RATE_DECREASE = 0.5  # 429/동의 페이지/ytInitialData 없음이 오면 속도에 곱하는 값 (multiplicative decrease)
+CRAWLER_RATE_BLOCK_COOLDOWN = 30  # 차단 신호 후 해당 호스트 요청을 멈추는 시간(초)
+CRAWLER_RATE_MAX_IN_FLIGHT = 8  # 호스트별 동시에 처리 중인 최대 요청 수 (전체 워커 합계)
+CRAWLER_RATE_LEASE_SECONDS = 120  # 요청 슬롯 유지 시간 (워커가 죽어도 이 시간 뒤에 슬롯 반환)
+CRAWLER_INCREMENTAL = True  # 이미 저장된 영상은 다시 전체 크롤링하지 않음
+CRAWLER_INCREMENTAL_STOP_AFTER_KNOWN = 30  # 저장된 영상이 이만큼 연속으로 나오면 채널 스크롤 중단
+CRAWLER_DISCOVERY = 'http'  # 'http': browse continuation 토큰으로 채널 영상 ID 수집 (실패하면 스크롤) / 'dom': 스크롤만 사용
+CRAWLER_DISCOVERY_LIMIT = None  # 채널에서 최신 영상 N개만 수집 (None이면 전부)
+CRAWLER_DISCOVERY_SINCE_DAYS = None  # 최근 N일 안에 업로드된 영상만 수집 (None이면 전부)
+CRAWLER_DISCOVERY_MAX_PAGES = 500  # continuation 요청 최대 횟수 (한 번에 보통 30개)
+CRAWLER_DISCOVERY_IDLE_TIMEOUT = 5  # 스크롤 방식에서 새 영상이 붙기를 기다리는 최대 시간(초)
+CRAWLER_REFRESH_AFTER_DAYS = 7  # 저장된 영상의 조회수/구독자 수를 갱신하는 주기(일), None이면 갱신 안 함
+CRAWLER_DB_BATCH_SIZE = 20  # 영상 몇 개를 모아서 DB에 한 번에 저장할지
+CRAWLER_DB_WRITE_RETRIES = 3  # 저장 중 deadlock/잠금 에러가 나면 다시 시도하는 횟수
+CRAWLER_HISTORY = True  # 저장할 때 (영상, 수집일)별 조회수/구독자 수/가격 이력과 채널별 일간 집계도 쌓음
+CRAWLER_SKIP_UNCHANGED = True  # 저장된 content_hash 와 같은 영상/제품은 다시 쓰지 않음 (조회수/구독자 수만 바뀌면 그 필드만 갱신)
+CRAWLER_CSV_COMPACT = False  # 크롤링 후 채널/추출일별 CSV 파티션을 채널별 CSV 한 개로 합칠지
+CRAWLER_EXPORT_FORMATS = ['csv']  # 'csv', 'parquet' (parquet은 pyarrow 필요)
+CRAWLER_CHECKPOINTS = True  # 채널 크롤링 진행 상황을 DB에 기록해서 워커가 재시작되면 이어서 진행
+CRAWLER_JOB_MAX_AGE_HOURS = 24  # 이보다 오래된 진행 중 작업은 버리고 새로 시작
+CRAWLER_JOB_MAX_ATTEMPTS = 3  # 영상 하나당 최대 시도 횟수
+CRAWLER_CLAIM_LEASE_MINUTES = 5  # 가져간 실행의 heartbeat가 이 시간 넘게 끊기면 죽은 것으로 보고 영상을 다시 가져감
+CRAWLER_RETRY_BACKOFF_MINUTES = 10  # 실패 영상 재시도 대기 시간(분), 시도할 때마다 2배
+CRAWLER_METRICS_DIR = BASE_DIR / 'crawling_metrics'  # 크롤링 실행별 단계 시간/카운터 JSON 저장 폴더 (/metrics 로 조회)
+CRAWLER_CHROMEDRIVER_PATH = None  # 크롬 드라이버 경로 (None이면 워커 프로세스당 한 번 ChromeDriverManager로 설치)
+CRAWLER_BROWSER_POOL_SIZE = CRAWLER_WORKERS  # 워커 프로세스에 보관할 유휴 크롬 세션 수
+CRAWLER_BROWSER_WARM_SESSIONS = 1  # Celery 워커 프로세스가 뜰 때 미리 띄워둘 크롬 세션 수
+CRAWLER_BROWSER_MAX_PAGES = 200  # 세션 하나가 이만큼 페이지를 열면 닫고 새로 띄움
+CRAWLER_BROWSER_MAX_RSS_MB = 1500  # 세션(크롬 자식 프로세스 포함) 메모리가 이보다 크면 새로 띄움
+CRAWLER_RESOURCE_PROFILE = 'text'  # 'text': 이미지/미디어/폰트/광고 요청 차단, 자동재생 끔 / 'off': 전부 로드
+CRAWLER_HTML_PARSER = None  # 'selectolax', 'lxml', 'html.parser' (None이면 설치된 것 중 가장 빠른 파서)
+CRAWLER_HTML_SUBTREE = True  # 시청 페이지 전체 대신 메타데이터/제품 섹션 노드만 브라우저에서 꺼내서 파싱
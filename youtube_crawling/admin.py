@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import YouTubeVideo, YouTubeProduct
+from .models import YouTubeVideo, YouTubeProduct, VideoSnapshot, ProductPriceSnapshot, ChannelDailyStats, CrawlJob, CrawlJobVideo
 
 # 제품 정보를 영상 상세 페이지에서 함께 보기 위해 Inline 설정
 class YouTubeProductInline(admin.TabularInline):
@@ -15,3 +15,28 @@ class YouTubeVideoAdmin(admin.ModelAdmin):
 @admin.register(YouTubeProduct)
 class YouTubeProductAdmin(admin.ModelAdmin):
     list_display = ('product_name', 'product_price', 'product_image_link', 'product_merchant', 'product_merchant_link')
+
+@admin.register(VideoSnapshot)
+class VideoSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('video', 'extracted_date', 'view_count', 'subscriber_count', 'product_count')
+    list_filter = ('extracted_date',)
+
+@admin.register(ProductPriceSnapshot)
+class ProductPriceSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('product_name', 'video', 'extracted_date', 'product_price')
+    list_filter = ('extracted_date',)
+
+@admin.register(ChannelDailyStats)
+class ChannelDailyStatsAdmin(admin.ModelAdmin):
+    list_display = ('channel_name', 'date', 'video_count', 'total_views', 'subscriber_count', 'product_count', 'avg_product_price')
+    list_filter = ('channel_name',)
+
+@admin.register(CrawlJob)
+class CrawlJobAdmin(admin.ModelAdmin):
+    list_display = ('channel_name', 'channel_url', 'status', 'created_at', 'finished_at')
+    list_filter = ('status',)
+
+@admin.register(CrawlJobVideo)
+class CrawlJobVideoAdmin(admin.ModelAdmin):
+    list_display = ('video_id', 'job', 'status', 'attempts', 'next_attempt_at')
+    list_filter = ('status',)
@@ -0,0 +1,84 @@
+"""
+영상 페이지 수집 방식 비교: 스레드 풀(http_youtube_info) vs asyncio(http_youtube_info_async)
+
+CPU 시간 대비 처리량(videos per CPU-second)을 같이 보여줘서 코어 하나로 얼마나 처리하는지 비교한다.
+fixture 서버가 같은 프로세스에서 돌기 때문에 CPU 시간에는 서버 쪽 비용도 포함된다 (두 방식에 똑같이).
+측정 전에 방식마다 한 번씩 돌려서 첫 호출의 import/초기화 비용은 빼고 비교한다.
+--latency 로 응답 지연을 주면 실제 네트워크처럼 기다리는 시간이 생긴다.
+
+    python -m youtube_crawling.benchmarks.bench_async --videos 200 --threads 4 --concurrency 32
+    python -m youtube_crawling.benchmarks.bench_async --videos 200 --latency 0.05
+"""
+from youtube_crawling.benchmarks.bench_crawler import StageMeter
+from youtube_crawling.benchmarks.fixtures import generate, fixture_video_ids
+from youtube_crawling.benchmarks.fixture_server import FixtureServer
+
+from youtube_crawling.longform_async import create_async_client, http_youtube_info_async
+from youtube_crawling.longform_http_extractor import http_youtube_info
+from concurrent.futures import ThreadPoolExecutor
+import argparse, asyncio, logging, os, tempfile
+
+
+async def crawl_async(urls: list[str], concurrency: int, frames: list):
+    """
+    결과는 frames 에 담는다. asyncio.run 이 끝날 때 (Python 3.11) SIGINT 핸들러를 되돌리면서 메인 태스크의
+    repr 을 만드는데, 반환값이 DataFrame 목록이면 그 repr 비용이 측정에 섞인다.
+    """
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(client, url):
+        async with slots:
+            return await http_youtube_info_async(client, url)
+
+    async with create_async_client(concurrency) as client:
+        frames.extend(await asyncio.gather(*(one(client, url) for url in urls)))
+
+
+def run(fixture_dir: str, limit: int, threads: int, concurrency: int, latency: float = 0.0) -> dict:
+    video_ids = fixture_video_ids(fixture_dir)[:limit]
+    results, rows = {}, {}
+    with FixtureServer(fixture_dir, latency) as server:
+        urls = [server.watch_url(video_id) for video_id in video_ids]
+
+        warmup = urls[:threads]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(http_youtube_info, warmup))
+        asyncio.run(crawl_async(warmup, concurrency, []))
+
+        with StageMeter(f"threads({threads})", len(urls)) as m:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                frames = list(pool.map(http_youtube_info, urls))
+        results[m.name], rows[m.name] = m.result, sum(len(df) for df in frames)
+
+        with StageMeter(f"asyncio({concurrency})", len(urls)) as m:
+            frames = []
+            asyncio.run(crawl_async(urls, concurrency, frames))
+        results[m.name], rows[m.name] = m.result, sum(len(df) for df in frames)
+
+    for name, result in results.items():
+        result["rows"] = rows[name]
+        result["items_per_cpu_s"] = result["items"] / result["cpu_s"] if result["cpu_s"] else 0.0
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="fixture 폴더 (없으면 합성 fixture를 임시로 생성)")
+    parser.add_argument("--videos", type=int, default=200)
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=4, help="스레드 풀 크기 (CRAWLER_WORKERS)")
+    parser.add_argument("--concurrency", type=int, default=32, help="asyncio 동시 요청 수 (CRAWLER_ASYNC_CONCURRENCY)")
+    parser.add_argument("--latency", type=float, default=0.0, help="fixture 서버 응답 지연(초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_dir = args.fixtures
+        if not fixture_dir:
+            fixture_dir = os.path.join(tmp, "fixtures")
+            generate(fixture_dir, args.videos, args.products)
+        results = run(fixture_dir, args.videos, args.threads, args.concurrency, args.latency)
+
+    print(f"{'mode':<16}{'rows':>8}{'wall(s)':>10}{'cpu(s)':>10}{'videos/s':>10}{'videos/cpu-s':>14}")
+    for name, r in results.items():
+        print(f"{name:<16}{r['rows']:>8}{r['wall_s']:>10.2f}{r['cpu_s']:>10.2f}{r['items_per_s']:>10.1f}{r['items_per_cpu_s']:>14.1f}")
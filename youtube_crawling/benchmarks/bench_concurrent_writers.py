@@ -0,0 +1,82 @@
+"""
+여러 크롤링 워커가 동시에 upsert_frames 를 호출할 때의 저장 처리량과 실패 수
+
+워커(스레드)마다 자기 영상 + 모든 워커가 같이 쓰는 영상(--shared)을 섞어서 저장하므로
+같은 row를 동시에 갱신하는 충돌도 포함된다. DB_ENGINE 으로 SQLite / PostgreSQL 을 비교한다.
+
+    python -m youtube_crawling.benchmarks.bench_concurrent_writers --writers 8
+
+    docker run -d --name crawling-postgres -e POSTGRES_PASSWORD=postgres -e POSTGRES_DB=crawling -p 5432:5432 postgres:16
+    DB_ENGINE=postgres python -m youtube_crawling.benchmarks.bench_concurrent_writers --writers 8
+"""
+from youtube_crawling.benchmarks.common import synthetic_video_frames, test_database
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from youtube_crawling.longform_crawler import upsert_frames
+from youtube_crawling import longform_metrics as metrics
+import argparse, logging, os, random, tempfile, threading, time
+
+
+def writer(frames: list, batch_size: int, stats: dict, lock: threading.Lock):
+    saved = failed = 0
+    try:
+        for start in range(0, len(frames), batch_size):
+            batch = frames[start:start + batch_size]
+            try:
+                _, products = upsert_frames(batch)
+                saved += products
+            except DatabaseError as e:
+                failed += len(batch)
+                logging.getLogger(__name__).warning(f"⚠️ 저장 실패: {e}")
+    finally:
+        connection.close()  # 스레드별 연결 반환 (풀이면 풀로)
+    with lock:
+        stats["saved"] += saved
+        stats["failed_videos"] += failed
+
+
+def run(n_writers: int, videos_per_writer: int, shared: int, products: int, batch_size: int) -> dict:
+    shared_frames = synthetic_video_frames(shared, products, seed=1, id_prefix="shared")
+    workloads = []
+    for w in range(n_writers):
+        frames = synthetic_video_frames(videos_per_writer, products, seed=w, id_prefix=f"w{w:02d}_") + shared_frames
+        random.Random(w).shuffle(frames)
+        workloads.append(frames)
+
+    metrics.start_run()
+    stats, lock = {"saved": 0, "failed_videos": 0}, threading.Lock()
+    with test_database():
+        threads = [threading.Thread(target=metrics.bind(writer), args=(frames, batch_size, stats, lock)) for frames in workloads]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats["seconds"] = time.perf_counter() - started
+
+    retries = sum(c["value"] for c in metrics.current().to_dict()["counters"] if c["name"] == "db_write_retries_total")
+    stats["retries"] = retries
+    stats["rows"] = sum(len(df) for frames in workloads for df in frames)
+    return stats
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--videos", type=int, default=200, help="워커 하나가 저장할 자기 영상 수")
+    parser.add_argument("--shared", type=int, default=20, help="모든 워커가 같이 저장하는 영상 수 (충돌)")
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=20, help="upsert 한 번에 넣을 영상 수 (CRAWLER_DB_BATCH_SIZE)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if connection.vendor == "sqlite":
+            # 메모리 DB 대신 실제 파일로 만들어야 SQLite 쓰기 잠금이 운영 환경과 같게 동작함
+            connection.settings_dict["TEST"]["NAME"] = os.path.join(tmp, "bench.sqlite3")
+        stats = run(args.writers, args.videos, args.shared, args.products, args.batch)
+
+    print(f"DB: {connection.vendor} ({settings.DATABASES['default']['ENGINE']}), 워커 {args.writers}개")
+    print(f"rows {stats['rows']:,}  저장된 제품 {stats['saved']:,}  실패 영상 {stats['failed_videos']}  재시도 {stats['retries']}")
+    print(f"{stats['seconds']:.2f}s  {stats['rows'] / stats['seconds'] if stats['seconds'] else 0:,.0f} rows/s")
@@ -0,0 +1,196 @@
+"""
+실제 유튜브 없이 fixture 페이지로 크롤러 hot path 단계별 성능 측정
+
+단계: get_all_video_ids / base_youtube_info / extract_products_from_dom / http_youtube_info / save_to_db
+지표: wall time, CPU time(크롬 자식 프로세스 포함), peak RSS(자식 포함), 처리량
+
+    python -m youtube_crawling.benchmarks.bench_crawler --videos 10
+    python -m youtube_crawling.benchmarks.bench_crawler --fixtures ./bench_fixtures --save-baseline baseline.json
+    python -m youtube_crawling.benchmarks.bench_crawler --baseline baseline.json --max-regression 0.25
+
+--baseline 과 비교해서 어떤 단계의 영상당 wall time이 max-regression 이상 느려지면 exit code 1
+"""
+from youtube_crawling.benchmarks.common import test_database
+from youtube_crawling.benchmarks.fixtures import generate, fixture_video_ids
+from youtube_crawling.benchmarks.fixture_server import FixtureServer
+
+from youtube_crawling.longform_crawler import (
+    create_driver, get_all_video_ids, base_youtube_info, extract_products_from_dom, save_to_db,
+)
+from youtube_crawling.longform_http_extractor import http_youtube_info
+from youtube_crawling.longform_parser import parse_watch_page
+import pandas as pd
+import psutil
+import argparse, json, logging, os, sys, tempfile, threading, time
+
+
+# ---------- ⬇️ 현재 프로세스 + 자식 프로세스(크롬, 드라이버) 전체 ----------
+def process_tree() -> list[psutil.Process]:
+    proc = psutil.Process()
+    try:
+        return [proc, *proc.children(recursive=True)]
+    except psutil.Error:
+        return [proc]
+
+
+def tree_cpu_seconds() -> float:
+    total = 0.0
+    for p in process_tree():
+        try:
+            times = p.cpu_times()
+            total += times.user + times.system
+        except psutil.Error:
+            continue
+    return total
+
+
+def tree_rss_bytes() -> int:
+    total = 0
+    for p in process_tree():
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            continue
+    return total
+
+
+# ---------- ⬇️ 단계 하나의 wall/CPU/peak RSS 측정 ----------
+class StageMeter:
+    def __init__(self, name: str, items: int = 1, unit: str = "videos"):
+        self.name, self.items, self.unit = name, items, unit
+        self.result = {}
+
+    def _sample(self):
+        while not self._stop.wait(0.05):
+            self._peak = max(self._peak, tree_rss_bytes())
+
+    def __enter__(self):
+        self._peak = tree_rss_bytes()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+        self._cpu = tree_cpu_seconds()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall
+        cpu = tree_cpu_seconds() - self._cpu
+        self._stop.set()
+        self._sampler.join()
+        self.result = {
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "peak_rss_mb": self._peak / 1e6,
+            "items": self.items,
+            "unit": self.unit,
+            "wall_per_item_s": wall / max(self.items, 1),
+            "items_per_s": self.items / wall if wall else 0.0,
+        }
+        return False
+
+
+# ---------- ⬇️ 같은 단계를 여러 번 나눠 잰 결과 합치기 ----------
+def accumulate(results: dict, name: str, result: dict):
+    prev = results.get(name)
+    if prev is None:
+        results[name] = dict(result)
+        return
+    prev["wall_s"] += result["wall_s"]
+    prev["cpu_s"] += result["cpu_s"]
+    prev["peak_rss_mb"] = max(prev["peak_rss_mb"], result["peak_rss_mb"])
+    prev["items"] += result["items"]
+    prev["wall_per_item_s"] = prev["wall_s"] / prev["items"]
+    prev["items_per_s"] = prev["items"] / prev["wall_s"] if prev["wall_s"] else 0.0
+
+
+def run(fixture_dir: str, limit: int, skip_selenium: bool) -> dict:
+    video_ids = fixture_video_ids(fixture_dir)[:limit]
+    results = {}
+    frames = []
+
+    with FixtureServer(fixture_dir) as server:
+        if not skip_selenium:
+            with create_driver() as driver:
+                with StageMeter("get_all_video_ids", len(video_ids)) as m:
+                    found = get_all_video_ids(driver, f"{server.base_url}/@bench")
+                results[m.name] = m.result
+                logging.getLogger(__name__).warning(f"채널 페이지에서 {len(found)}개 영상 발견")
+
+                with StageMeter("base_youtube_info", len(video_ids)) as m:
+                    for video_id in video_ids:
+                        frames.append(base_youtube_info(driver, server.watch_url(video_id)))
+                results[m.name] = m.result
+
+                # 페이지 로딩은 빼고 제품 추출만 영상별로 측정해서 합산
+                for video_id in video_ids:
+                    driver.get(server.watch_url(video_id))
+                    doc = parse_watch_page(driver)
+                    with StageMeter("extract_products_from_dom", 1) as m:
+                        extract_products_from_dom(driver, doc)
+                    accumulate(results, m.name, m.result)
+
+        with StageMeter("http_youtube_info", len(video_ids)) as m:
+            http_frames = [http_youtube_info(server.watch_url(video_id)) for video_id in video_ids]
+        results[m.name] = m.result
+        frames = frames or http_frames
+
+    data = pd.concat([df for df in frames if df is not None and not df.empty], ignore_index=True)
+    with test_database():
+        with StageMeter("save_to_db", len(data), unit="rows") as m:
+            save_to_db(data)
+        results[m.name] = m.result
+    return results
+
+
+# ---------- ⬇️ 기준값과 비교해서 느려진 단계 찾기 ----------
+def find_regressions(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    regressions = []
+    for stage, current in results.items():
+        base = baseline.get(stage)
+        if not base or not base.get("wall_per_item_s"):
+            continue
+        ratio = current["wall_per_item_s"] / base["wall_per_item_s"]
+        if ratio > 1 + max_regression:
+            regressions.append(f"{stage}: {base['wall_per_item_s']:.4f}s -> {current['wall_per_item_s']:.4f}s ({ratio:.2f}배)")
+    return regressions
+
+
+def print_report(results: dict):
+    print(f"{'stage':<28}{'wall(s)':>10}{'cpu(s)':>10}{'peakRSS(MB)':>13}{'per item(s)':>13}{'items/s':>10}")
+    for stage, r in results.items():
+        print(f"{stage:<28}{r['wall_s']:>10.3f}{r['cpu_s']:>10.3f}{r['peak_rss_mb']:>13.1f}{r['wall_per_item_s']:>13.4f}{r['items_per_s']:>10.1f}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="fixture 폴더 (없으면 합성 fixture를 임시로 생성)")
+    parser.add_argument("--videos", type=int, default=10)
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--http-only", action="store_true", help="Selenium 단계 생략")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="허용하는 느려짐 비율 (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", help="이번 결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_dir = args.fixtures
+        if not fixture_dir:
+            fixture_dir = os.path.join(tmp, "fixtures")
+            generate(fixture_dir, args.videos, args.products)
+        results = run(fixture_dir, args.videos, args.http_only)
+
+    print_report(results)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = find_regressions(results, json.load(f), args.max_regression)
+        if regressions:
+            print("❌ 성능 저하 감지:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print("✅ 기준 대비 성능 저하 없음")
@@ -0,0 +1,44 @@
+"""
+채널 영상 ID 수집 방식(CRAWLER_DISCOVERY)별 비교: browse continuation(http) vs 스크롤(dom)
+
+채널 페이지 fixture만 만들어서 영상 수가 많은 채널(예: 2,000개)도 빠르게 준비한다.
+
+    python -m youtube_crawling.benchmarks.bench_discovery --videos 2000
+    python -m youtube_crawling.benchmarks.bench_discovery --videos 2000 --limit 100
+"""
+from youtube_crawling.benchmarks.common import timer
+from youtube_crawling.benchmarks.fixtures import write_channel_page
+from youtube_crawling.benchmarks.fixture_server import FixtureServer
+
+from youtube_crawling.longform_crawler import create_driver
+from youtube_crawling.longform_discovery import DiscoveryCollector, discover_video_urls_http, discover_video_urls_dom
+import argparse, logging, tempfile
+
+
+def run(n_videos: int, limit: int = None, skip_dom: bool = False) -> dict:
+    results, found = {}, {}
+    with tempfile.TemporaryDirectory() as tmp:
+        write_channel_page(tmp, [f"bench{v:06d}" for v in range(n_videos)])
+        with FixtureServer(tmp) as server:
+            channel_url = f"{server.base_url}/@bench"
+            with timer(results, "http"):
+                found["http"] = discover_video_urls_http(channel_url, DiscoveryCollector(limit=limit)) or []
+            if not skip_dom:
+                with create_driver() as driver:
+                    with timer(results, "dom"):
+                        found["dom"] = discover_video_urls_dom(driver, channel_url, DiscoveryCollector(limit=limit))
+    return {name: {"seconds": results[name], "videos": len(found[name])} for name in results}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, default=2000)
+    parser.add_argument("--limit", type=int, help="최신 영상 N개만")
+    parser.add_argument("--http-only", action="store_true", help="스크롤(dom) 방식 생략")
+    args = parser.parse_args()
+
+    results = run(args.videos, args.limit, args.http_only)
+    print(f"{'method':<8}{'videos':>8}{'seconds':>10}{'videos/s':>10}")
+    for name, r in results.items():
+        print(f"{name:<8}{r['videos']:>8}{r['seconds']:>10.2f}{r['videos'] / r['seconds'] if r['seconds'] else 0:>10.1f}")
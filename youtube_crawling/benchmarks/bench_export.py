@@ -0,0 +1,55 @@
+"""
+CSV(utf-8-sig) 와 Parquet(dictionary/int64/date32) 내보내기의 파일 크기, 쓰기/읽기 시간 비교
+
+    python -m youtube_crawling.benchmarks.bench_export --videos 5000 --products 5
+"""
+from youtube_crawling.benchmarks.common import synthetic_video_frames, timer
+
+from youtube_crawling.longform_crawler import preprocess_df
+from youtube_crawling.longform_export import PartitionedParquetWriter
+import pandas as pd
+import argparse, logging, os, tempfile
+
+
+def dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def run(n_videos: int, products: int):
+    df = preprocess_df(pd.concat(synthetic_video_frames(n_videos, products), ignore_index=True))
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "channel.csv")
+        parquet_dir = os.path.join(tmp, "parquet")
+
+        with timer(results, "csv_write"):
+            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+        with timer(results, "csv_read"):
+            pd.read_csv(csv_path, encoding="utf-8-sig")
+
+        with timer(results, "parquet_write"):
+            writer = PartitionedParquetWriter(parquet_dir, "벤치마크채널")
+            writer.write(df)
+            writer.close()
+        with timer(results, "parquet_read"):
+            pd.read_parquet(parquet_dir)
+
+        sizes = {"csv": os.path.getsize(csv_path), "parquet": dir_size(parquet_dir)}
+
+    print(f"{len(df)} rows (영상 {n_videos}개 × 제품 {products}개)")
+    print(f"{'format':<10}{'size(MB)':>10}{'write(s)':>10}{'read(s)':>10}")
+    for fmt in ("csv", "parquet"):
+        print(f"{fmt:<10}{sizes[fmt] / 1e6:>10.2f}{results[fmt + '_write']:>10.3f}{results[fmt + '_read']:>10.3f}")
+    print(f"크기 {sizes['csv'] / sizes['parquet']:.1f}배, 읽기 {results['csv_read'] / results['parquet_read']:.1f}배")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, default=5000)
+    parser.add_argument("--products", type=int, default=5)
+    args = parser.parse_args()
+    run(args.videos, args.products)
@@ -0,0 +1,98 @@
+"""
+이력 테이블 벤치마크: 같은 영상들을 여러 날 다시 크롤링했다고 보고 저장할 때 이력(CRAWLER_HISTORY) 비용과
+채널 추세 조회 시간을 잰다. 추세는 (1) CSV 파티션 전체를 읽어서 집계, (2) VideoSnapshot 을 바로 집계,
+(3) 미리 집계한 ChannelDailyStats 조회를 비교한다.
+
+    python -m youtube_crawling.benchmarks.bench_history --videos 500 --days 30
+"""
+from youtube_crawling.benchmarks.common import synthetic_video_frames, test_database, timer
+
+from django.conf import settings
+from django.db.models import Count, Max, Sum
+from youtube_crawling.longform_crawler import upsert_frames, preprocess_df
+from youtube_crawling.longform_history import channel_trend
+from youtube_crawling.models import VideoSnapshot
+from datetime import date, timedelta
+import pandas as pd
+import argparse, logging, os, tempfile
+
+CHANNEL = "벤치마크채널"
+
+
+def daily_frames(n_videos: int, products: int, days: int) -> list[tuple[str, list[pd.DataFrame]]]:
+    start = date(2025, 6, 1)
+    batches = []
+    for day in range(days):
+        extracted = (start + timedelta(days=day)).strftime("%Y%m%d")
+        frames = synthetic_video_frames(n_videos, products, seed=day)
+        for df in frames:
+            df["extracted_date"] = extracted
+        batches.append((extracted, frames))
+    return batches
+
+
+def save_days(batches, batch_size: int, history: bool) -> None:
+    settings.CRAWLER_HISTORY = history
+    for _, frames in batches:
+        for start in range(0, len(frames), batch_size):
+            upsert_frames(frames[start:start + batch_size])
+
+
+def csv_trend(directory: str) -> pd.DataFrame:
+    frames = [pd.read_csv(os.path.join(directory, name)) for name in sorted(os.listdir(directory))]
+    df = pd.concat(frames, ignore_index=True).drop_duplicates(["youtube_id", "extracted_date"])
+    return df.groupby("extracted_date").agg(video_count=("youtube_id", "size"), total_views=("view_count", "sum"))
+
+
+def snapshot_trend() -> list[dict]:
+    return list(
+        VideoSnapshot.objects.filter(video__channel_name=CHANNEL).values("extracted_date").annotate(
+            video_count=Count("id"), total_views=Sum("view_count"),
+            subscriber_count=Max("subscriber_count"), product_count=Sum("product_count"),
+        ).order_by("extracted_date")
+    )
+
+
+def run(n_videos: int, products: int, days: int, batch_size: int, repeat: int) -> dict:
+    batches = daily_frames(n_videos, products, days)
+    results = {}
+    for history in (False, True):
+        with test_database():
+            with timer(results, f"save:history={'on' if history else 'off'}"):
+                save_days(batches, batch_size, history)
+            if not history:
+                continue
+            with tempfile.TemporaryDirectory() as tmp:
+                # 크롤링이 남기는 채널/추출일별 CSV 파티션과 같은 모양
+                for extracted, frames in batches:
+                    preprocess_df(pd.concat(frames, ignore_index=True)).to_csv(os.path.join(tmp, f"{extracted}.csv"), index=False)
+                with timer(results, "trend:csv"):
+                    for _ in range(repeat):
+                        csv_trend(tmp)
+            with timer(results, "trend:snapshots"):
+                for _ in range(repeat):
+                    snapshot_trend()
+            with timer(results, "trend:daily_stats"):
+                for _ in range(repeat):
+                    trend = channel_trend(CHANNEL)
+            results["days"] = len(trend)
+    settings.CRAWLER_HISTORY = True
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, default=500)
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20, help="추세 조회 반복 횟수")
+    args = parser.parse_args()
+
+    results = run(args.videos, args.products, args.days, args.batch, args.repeat)
+    rows = args.videos * args.products * args.days
+    for name in ("save:history=off", "save:history=on"):
+        print(f"{name:<22}{results[name]:>8.2f}s  {rows / results[name]:>10,.0f} rows/s")
+    for name in ("trend:csv", "trend:snapshots", "trend:daily_stats"):
+        print(f"{name:<22}{results[name] / args.repeat * 1000:>8.1f}ms/조회  ({results['days']}일)")
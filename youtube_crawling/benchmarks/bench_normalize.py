@@ -0,0 +1,57 @@
+"""
+row 정규화 비교: 예전 preprocess_df(row마다 .apply) vs normalize_frame(컬럼 단위 벡터 연산)
+
+합성 영상 row를 재표본해서 원하는 크기(기본 100만 row)를 만들고, 두 결과가 같은지도 확인한다.
+
+    python -m youtube_crawling.benchmarks.bench_normalize --rows 1000000
+    python -m youtube_crawling.benchmarks.bench_normalize --rows 1000000 --skip-legacy
+"""
+from youtube_crawling.benchmarks.common import synthetic_video_frames, timer
+
+from youtube_crawling.testing import legacy_preprocess_df
+from youtube_crawling.longform_normalize import normalize_frame
+import pandas as pd
+import argparse, logging
+
+
+def synthetic_rows(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    base = pd.concat(synthetic_video_frames(2000, 5, seed=seed), ignore_index=True)
+    return base.sample(n=n_rows, replace=True, random_state=seed).reset_index(drop=True)
+
+
+def mismatched_columns(legacy: pd.DataFrame, vectorized: pd.DataFrame) -> list[str]:
+    columns = ["view_count", "subscribers", "product_price", "description", "upload_date", "extracted_date"]
+    return [
+        column for column in columns
+        if legacy[column].tolist() != vectorized[column].tolist()
+    ]
+
+
+def run(n_rows: int, skip_legacy: bool) -> dict:
+    df = synthetic_rows(n_rows)
+    results, outputs = {}, {}
+    with timer(results, "normalize_frame"):
+        outputs["normalize_frame"] = normalize_frame(df)
+    if not skip_legacy:
+        with timer(results, "legacy_apply"):
+            outputs["legacy_apply"] = legacy_preprocess_df(df)
+        mismatched = mismatched_columns(outputs["legacy_apply"], outputs["normalize_frame"])
+        if mismatched:
+            logging.getLogger(__name__).warning(f"⚠️ 결과가 다른 컬럼: {', '.join(mismatched)}")
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--skip-legacy", action="store_true", help="예전 .apply 방식 생략 (오래 걸림)")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.skip_legacy)
+    print(f"{args.rows:,} rows")
+    print(f"{'method':<18}{'seconds':>10}{'rows/s':>14}")
+    for name, seconds in results.items():
+        print(f"{name:<18}{seconds:>10.2f}{args.rows / seconds if seconds else 0:>14,.0f}")
+    if "legacy_apply" in results:
+        print(f"속도 {results['legacy_apply'] / results['normalize_frame']:.1f}배")
@@ -0,0 +1,102 @@
+"""
+한국어 숫자/날짜 파서 마이크로벤치마크: 예전 str.replace 방식 vs longform_numbers (캐시 없음 / 캐시)
+
+구독자 수처럼 같은 채널에서 반복되는 문자열이 많으므로 입력은 적은 수의 값을 반복해서 만든다.
+실패한 입력은 이유별(parse_failure_total) 개수로 보여준다.
+
+    python -m youtube_crawling.benchmarks.bench_numbers --calls 200000
+"""
+from youtube_crawling.benchmarks.common import timer
+
+from youtube_crawling.longform_crawler import parse_view_count, parse_subscriber_count, parse_price, format_date
+from youtube_crawling.longform_numbers import cache_clear, cache_info
+from youtube_crawling import longform_metrics as metrics
+from datetime import datetime
+import argparse, logging, random, re
+
+
+# ---------- ⬇️ longform_numbers 이전 구현 (비교용) ----------
+def legacy_parse_count(text: str) -> int:
+    try:
+        if not text:
+            return 0
+        cleaned = text.replace("조회수", "").replace("구독자", "").replace("회", "").replace("명", "").replace(",", "").strip()
+        if "천" in cleaned:
+            return int(float(cleaned.replace("천", "")) * 1000)
+        elif "만" in cleaned:
+            return int(float(cleaned.replace("만", "")) * 10000)
+        return int(cleaned)
+    except ValueError:
+        return 0
+
+
+def legacy_parse_price(price_text: str) -> int:
+    cleaned_price = re.sub(r'[₩,\s]', '', price_text or "")
+    if re.search(r'\d', cleaned_price):
+        return int(re.sub(r'[^\d]', '', cleaned_price))
+    return 0
+
+
+def legacy_format_date(date_str: str):
+    if match := re.search(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?', date_str):
+        return datetime(*map(int, match.groups()))
+    elif match := re.search(r'(\d{4})(\d{2})(\d{2})', date_str):
+        return datetime(*map(int, match.groups()))
+    return date_str
+
+
+def sample_inputs(n_calls: int, distinct: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    pools = {
+        "view_count": [f"조회수 {rng.randint(100, 9_999_999):,}회" for _ in range(distinct)] + ["조회수 없음", "조회수 1.2억회"],
+        "subscribers": [f"구독자 {rng.randint(1, 999)}.{rng.randint(0, 9)}만명" for _ in range(max(1, distinct // 20))] + ["구독자 수 없음"],
+        "product_price": [f"₩{rng.randint(1000, 500000):,}" for _ in range(distinct)] + ["무료"],
+        "date": [f"2024. {rng.randint(1, 12)}. {rng.randint(1, 28)}." for _ in range(distinct // 5)] + ["날짜 없음"],
+    }
+    return {field: [rng.choice(pool) for _ in range(n_calls)] for field, pool in pools.items()}
+
+
+IMPLEMENTATIONS = {
+    "view_count": (legacy_parse_count, parse_view_count),
+    "subscribers": (legacy_parse_count, parse_subscriber_count),
+    "product_price": (legacy_parse_price, parse_price),
+    "date": (legacy_format_date, format_date),
+}
+
+
+def run(n_calls: int, distinct: int) -> dict:
+    inputs = sample_inputs(n_calls, distinct)
+    results = {}
+    metrics.start_run()
+    for field, (legacy, current) in IMPLEMENTATIONS.items():
+        values = inputs[field]
+        with timer(results, f"{field}:legacy"):
+            for text in values:
+                legacy(text)
+        cache_clear()
+        with timer(results, f"{field}:cold"):
+            for text in values[:distinct]:
+                current(text)
+        with timer(results, f"{field}:cached"):
+            for text in values:
+                current(text)
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=2_000, help="필드별 서로 다른 입력 문자열 수")
+    args = parser.parse_args()
+
+    results = run(args.calls, args.distinct)
+    print(f"{'field:impl':<24}{'calls':>10}{'seconds':>10}{'calls/s':>14}")
+    for name, seconds in results.items():
+        calls = min(args.distinct, args.calls) if name.endswith(":cold") else args.calls
+        print(f"{name:<24}{calls:>10}{seconds:>10.3f}{calls / seconds if seconds else 0:>14,.0f}")
+    for name, info in cache_info().items():
+        print(f"cache {name}: hits={info.hits} misses={info.misses} size={info.currsize}")
+    for counter in metrics.current().to_dict()["counters"]:
+        if counter["name"] == "parse_failure_total":
+            print(f"실패 {counter['labels']}: {counter['value']}")
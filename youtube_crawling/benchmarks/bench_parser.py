@@ -0,0 +1,118 @@
+"""
+HTML 파서(CRAWLER_HTML_PARSER)와 subtree 모드(CRAWLER_HTML_SUBTREE)별 시청 페이지 파싱 비교
+
+지표: 페이지당 파싱 + 셀렉터 조회 시간, peak RSS, 파싱한 HTML 크기
+기본은 fixture 폴더의 시청 페이지 HTML(합성 또는 record로 저장한 것)을 그대로 읽고,
+subtree HTML은 SUBTREE_SCRIPT 와 같은 규칙으로 여기서 잘라낸다 (크롬/드라이버 없음).
+--browser 를 주면 크롬으로 fixture 페이지를 열어 렌더링된 page_source와 subtree HTML을 받아서 비교한다.
+
+    python -m youtube_crawling.benchmarks.bench_parser --videos 10
+    python -m youtube_crawling.benchmarks.bench_parser --fixtures ./bench_fixtures --parsers html.parser selectolax
+    python -m youtube_crawling.benchmarks.bench_parser --videos 10 --browser
+"""
+from youtube_crawling.benchmarks.common import timer  # noqa: F401  (django.setup 먼저)
+from youtube_crawling.benchmarks.fixtures import generate, fixture_video_ids
+from youtube_crawling.benchmarks.fixture_server import FixtureServer
+from youtube_crawling.benchmarks.bench_crawler import StageMeter
+
+from django.core.exceptions import ImproperlyConfigured
+from youtube_crawling.longform_crawler import create_driver, select_first_text, extract_products_from_html
+from youtube_crawling.longform_parser import PARSERS, WATCH_SUBTREE_SELECTORS, parse_html, watch_page_html
+from youtube_crawling.longform_readiness import wait_for_document_ready, wait_for_any
+from bs4 import BeautifulSoup
+import argparse, logging, os, tempfile
+
+# base_youtube_info 에서 읽는 필드들
+FIELD_SELECTORS = [
+    ["#title yt-formatted-string", "yt-formatted-string[class*='ytd-watch-metadata']"],
+    ["ytd-channel-name a", "#channel-name a"],
+    ["yt-formatted-string#owner-sub-count", "#subscriber-count"],
+    ["span.view-count", "#view-count"],
+    ["#info-strings yt-formatted-string", "#upload-info .date"],
+    ["ytd-expander#description yt-formatted-string", "#description"],
+    ["yt-formatted-string#info"],
+]
+
+
+def subtree_html(html: str) -> str:
+    """SUBTREE_SCRIPT 와 같은 규칙: 선택된 노드 중 다른 노드 안에 있는 것은 빼고 outerHTML만 이어붙임"""
+    roots = []
+    soup = BeautifulSoup(html, "html.parser")
+    for selector in WATCH_SUBTREE_SELECTORS:
+        for node in soup.select(selector):
+            if not any(root is node or root in node.parents or node in root.parents for root in roots):
+                roots.append(node)
+    return f"<html><body>{''.join(map(str, roots))}</body></html>" if roots else html
+
+
+def load_pages(fixture_dir: str, video_ids: list[str]) -> dict:
+    pages = {"full": [], "subtree": []}
+    for video_id in video_ids:
+        with open(os.path.join(fixture_dir, f"watch_{video_id}.html"), encoding="utf-8") as f:
+            html = f.read()
+        pages["full"].append(html)
+        pages["subtree"].append(subtree_html(html))
+    return pages
+
+
+def capture_pages(server: FixtureServer, video_ids: list[str]) -> dict:
+    pages = {"full": [], "subtree": []}
+    with create_driver() as driver:
+        for video_id in video_ids:
+            driver.get(server.watch_url(video_id))
+            wait_for_document_ready(driver, 15)
+            wait_for_any(driver, ["ytd-watch-metadata #title yt-formatted-string"], 10)
+            pages["full"].append(watch_page_html(driver, subtree=False))
+            pages["subtree"].append(watch_page_html(driver, subtree=True))
+    return pages
+
+
+def parse_and_lookup(html: str, parser: str) -> int:
+    doc = parse_html(html, parser)
+    found = sum(1 for selectors in FIELD_SELECTORS if select_first_text(doc, selectors))
+    return found + len(extract_products_from_html(doc))
+
+
+def run(pages: dict, parsers: list[str]) -> dict:
+    results = {}
+    for source, htmls in pages.items():
+        for parser in parsers:
+            try:
+                with StageMeter(f"{parser}/{source}", len(htmls), unit="pages") as m:
+                    found = sum(parse_and_lookup(html, parser) for html in htmls)
+            except ImproperlyConfigured as e:
+                logging.getLogger(__name__).warning(f"{parser} 건너뜀: {e}")
+                continue
+            results[m.name] = {**m.result, "found": found, "kb_per_page": sum(map(len, htmls)) / len(htmls) / 1000}
+    return results
+
+
+def print_report(results: dict):
+    print(f"{'parser/source':<26}{'KB/page':>10}{'ms/page':>10}{'peakRSS(MB)':>13}{'found':>8}")
+    for name, r in results.items():
+        print(f"{name:<26}{r['kb_per_page']:>10.1f}{r['wall_per_item_s'] * 1000:>10.2f}{r['peak_rss_mb']:>13.1f}{r['found']:>8}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="fixture 폴더 (없으면 합성 fixture를 임시로 생성)")
+    parser.add_argument("--videos", type=int, default=10)
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--parsers", nargs="+", default=list(PARSERS), choices=list(PARSERS))
+    parser.add_argument("--browser", action="store_true", help="크롬으로 렌더링한 page_source로 비교 (드라이버 필요)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_dir = args.fixtures
+        if not fixture_dir:
+            fixture_dir = os.path.join(tmp, "fixtures")
+            generate(fixture_dir, args.videos, args.products)
+        video_ids = fixture_video_ids(fixture_dir)[:args.videos]
+        if args.browser:
+            with FixtureServer(fixture_dir) as server:
+                pages = capture_pages(server, video_ids)
+        else:
+            pages = load_pages(fixture_dir, video_ids)
+
+    print_report(run(pages, args.parsers))
@@ -0,0 +1,92 @@
+"""
+매일 다시 크롤링할 때 DB 쓰기량: content_hash 비교(CRAWLER_SKIP_UNCHANGED) 켬/끔
+
+1일차에 영상을 저장한 뒤, 2일차에는 조회수/구독자 수만 바뀐 같은 영상과 제품 일부(--changed 비율)의 가격이
+바뀐 결과를 다시 저장한다. 쓰기량은 SQLite는 바뀐 row 수(total_changes), PostgreSQL은 WAL 바이트로 잰다.
+이력 테이블(CRAWLER_HISTORY)은 두 경우 모두 같으므로 끄고 잰다.
+
+    python -m youtube_crawling.benchmarks.bench_recrawl --videos 1000
+    DB_ENGINE=postgres python -m youtube_crawling.benchmarks.bench_recrawl --videos 1000
+"""
+from youtube_crawling.benchmarks.common import synthetic_video_frames, test_database, timer
+
+from django.conf import settings
+from django.db import connection
+from youtube_crawling.longform_crawler import upsert_frames
+from youtube_crawling import longform_metrics as metrics
+import argparse, logging, random
+
+
+def write_volume() -> int:
+    if connection.vendor == "sqlite":
+        connection.ensure_connection()
+        return connection.connection.total_changes
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_current_wal_insert_lsn() - '0/0'::pg_lsn")
+        return int(cursor.fetchone()[0])
+
+
+def recrawled(frames: list, changed: float, seed: int = 1) -> list:
+    """조회수/구독자 수/추출일은 모두 바뀌고, 제품 가격은 changed 비율만 바뀐 2일차 결과"""
+    rng = random.Random(seed)
+    result = []
+    for df in frames:
+        df = df.copy()
+        df["extracted_date"] = "20250602"
+        df["view_count"] = f"조회수 {rng.randint(1000, 9_999_999):,}회"
+        df["subscribers"] = f"구독자 {rng.randint(1, 999)}.{rng.randint(0, 9)}만명"
+        mask = [rng.random() < changed for _ in range(len(df))]
+        df.loc[mask, "product_price"] = [f"₩{rng.randint(1000, 500000):,}" for _ in range(sum(mask))]
+        result.append(df)
+    return result
+
+
+def save(frames: list, batch_size: int):
+    for start in range(0, len(frames), batch_size):
+        upsert_frames(frames[start:start + batch_size])
+
+
+def counter_totals() -> dict:
+    totals = {}
+    for counter in metrics.current().to_dict()["counters"]:
+        if counter["name"] in ("db_rows_written_total", "db_rows_unchanged_total"):
+            labels = counter["labels"]
+            key = ":".join(filter(None, [counter["name"].removeprefix("db_rows_").removesuffix("_total"), labels.get("table"), labels.get("fields")]))
+            totals[key] = totals.get(key, 0) + counter["value"]
+    return totals
+
+
+def run(n_videos: int, products: int, changed: float, batch_size: int) -> dict:
+    day1 = synthetic_video_frames(n_videos, products)
+    day2 = recrawled(day1, changed)
+    settings.CRAWLER_HISTORY = False
+    results = {}
+    for skip in (False, True):
+        settings.CRAWLER_SKIP_UNCHANGED = skip
+        label = "hash" if skip else "always"
+        with test_database():
+            save(day1, batch_size)
+            metrics.start_run()
+            before = write_volume()
+            with timer(results, f"{label}:seconds"):
+                save(day2, batch_size)
+            results[f"{label}:volume"] = write_volume() - before
+            results[f"{label}:rows"] = counter_totals()
+    settings.CRAWLER_HISTORY = settings.CRAWLER_SKIP_UNCHANGED = True
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--changed", type=float, default=0.05, help="2일차에 가격이 바뀌는 제품 비율")
+    parser.add_argument("--batch", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run(args.videos, args.products, args.changed, args.batch)
+    unit = "바뀐 row" if connection.vendor == "sqlite" else "WAL 바이트"
+    print(f"DB: {connection.vendor}, 영상 {args.videos}개 x 제품 {args.products}개, 가격 변경 {args.changed:.0%}")
+    for label in ("always", "hash"):
+        print(f"{label:<8}{results[f'{label}:seconds']:>8.2f}s  {unit} {results[f'{label}:volume']:>12,}  {results[f'{label}:rows']}")
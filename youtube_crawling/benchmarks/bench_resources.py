@@ -0,0 +1,83 @@
+"""
+리소스 차단 프로필(CRAWLER_RESOURCE_PROFILE)별 시청 페이지 로딩 비교
+
+지표: 페이지당 전송 바이트/요청 수(fixture 서버 기준), 페이지 준비 시간(driver.get ~ 메타데이터 렌더링),
+      제품 이미지 src를 읽을 수 있었던 비율 (차단해도 src 값은 남아있어야 함)
+
+    python -m youtube_crawling.benchmarks.bench_resources --videos 10
+    python -m youtube_crawling.benchmarks.bench_resources --fixtures ./bench_fixtures --profiles off text
+"""
+from youtube_crawling.benchmarks.common import timer  # noqa: F401  (django.setup 먼저)
+from youtube_crawling.benchmarks.fixtures import generate, fixture_video_ids
+from youtube_crawling.benchmarks.fixture_server import FixtureServer
+
+from youtube_crawling.longform_browser import RESOURCE_PROFILES, launch_driver, quit_driver
+from youtube_crawling.longform_crawler import extract_products_from_dom
+from youtube_crawling.longform_parser import parse_watch_page
+from youtube_crawling.longform_readiness import wait_for_document_ready, wait_for_any
+import argparse, logging, os, statistics, tempfile, time
+
+
+def measure_profile(server: FixtureServer, video_ids: list[str], profile: str) -> dict:
+    driver = launch_driver(profile)
+    page_bytes, page_requests, ready_times = [], [], []
+    products = images = 0
+    try:
+        # 첫 페이지는 크롬 자체 초기화가 섞이므로 버림
+        driver.get(server.watch_url(video_ids[0]))
+        for video_id in video_ids:
+            driver.get("about:blank")
+            server.reset_counter()
+            started = time.perf_counter()
+            driver.get(server.watch_url(video_id))
+            wait_for_document_ready(driver, 15)
+            wait_for_any(driver, ["ytd-watch-metadata #title yt-formatted-string"], 10)
+            ready_times.append(time.perf_counter() - started)
+            # 늦게 끝나는 요청(영상 스트림 등)까지 세기 위해 잠깐 더 기다림
+            time.sleep(0.5)
+            page_bytes.append(server.bytes_served)
+            page_requests.append(server.requests_served)
+
+            found = extract_products_from_dom(driver, parse_watch_page(driver))
+            products += len(found)
+            images += sum(1 for p in found if p.get("imageUrl"))
+    finally:
+        quit_driver(driver)
+
+    return {
+        "bytes_per_page": statistics.mean(page_bytes),
+        "requests_per_page": statistics.mean(page_requests),
+        "ready_ms_mean": statistics.mean(ready_times) * 1000,
+        "ready_ms_max": max(ready_times) * 1000,
+        "image_src_ratio": images / products if products else 1.0,
+    }
+
+
+def print_report(results: dict):
+    print(f"{'profile':<10}{'KB/page':>12}{'req/page':>10}{'ready ms':>10}{'max ms':>10}{'img src':>9}")
+    for profile, r in results.items():
+        print(
+            f"{profile:<10}{r['bytes_per_page'] / 1000:>12.1f}{r['requests_per_page']:>10.1f}"
+            f"{r['ready_ms_mean']:>10.1f}{r['ready_ms_max']:>10.1f}{r['image_src_ratio']:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="fixture 폴더 (없으면 합성 fixture를 임시로 생성)")
+    parser.add_argument("--videos", type=int, default=10)
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--profiles", nargs="+", default=list(RESOURCE_PROFILES), choices=list(RESOURCE_PROFILES))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_dir = args.fixtures
+        if not fixture_dir:
+            fixture_dir = os.path.join(tmp, "fixtures")
+            generate(fixture_dir, args.videos, args.products)
+        video_ids = fixture_video_ids(fixture_dir)[:args.videos]
+        with FixtureServer(fixture_dir) as server:
+            results = {profile: measure_profile(server, video_ids, profile) for profile in args.profiles}
+
+    print_report(results)
@@ -0,0 +1,85 @@
+"""
+save_to_db 벤치마크: 예전 update_or_create 방식과 bulk upsert 방식의 rows/sec 비교
+
+    python -m youtube_crawling.benchmarks.bench_save_to_db --videos 200 --products 5
+"""
+from youtube_crawling.benchmarks.common import test_database, synthetic_video_frames, timer
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from youtube_crawling.models import YouTubeVideo, YouTubeProduct
+from youtube_crawling.longform_crawler import (
+    save_to_db, format_date, parse_subscriber_count, parse_view_count, parse_price,
+    clean_description, validate_url,
+)
+import argparse, logging
+
+
+# ---------- ⬇️ 비교 기준: 영상/제품 한 건씩 update_or_create 하던 예전 방식 ----------
+def legacy_save_to_db(data) -> int:
+    saved_count = 0
+    with transaction.atomic():
+        for video_id, video_group in data.groupby('youtube_id'):
+            first_row = video_group.iloc[0]
+            video_obj, _ = YouTubeVideo.objects.update_or_create(
+                video_id=video_id,
+                defaults={
+                    "extracted_date": format_date(first_row.get("extracted_date", "")),
+                    "upload_date": format_date(first_row.get("upload_date", "")),
+                    "channel_name": first_row.get("channel_name", ""),
+                    "subscriber_count": parse_subscriber_count(first_row.get("subscribers", "0")),
+                    "title": first_row.get("title", ""),
+                    "view_count": parse_view_count(first_row.get("view_count", "0")),
+                    "video_url": validate_url(first_row.get("video_url", "")),
+                    "product_count": int(first_row.get("product_count", 0)),
+                    "description": clean_description(first_row.get("description", "")),
+                }
+            )
+            for _, row in video_group.iterrows():
+                YouTubeProduct.objects.update_or_create(
+                    video=video_obj,
+                    product_name=row.get("product_name", "").strip(),
+                    defaults={
+                        "product_price": parse_price(row.get("product_price", "0")),
+                        "product_image_link": validate_url(row.get("product_image_url", "")),
+                        "product_merchant": row.get("product_merchant", ""),
+                        "product_merchant_link": validate_url(row.get("product_merchant_url", "")),
+                    }
+                )
+                saved_count += 1
+    return saved_count
+
+
+def run(n_videos: int, products: int, batch: int):
+    frames = synthetic_video_frames(n_videos, products)
+    total_rows = sum(len(df) for df in frames)
+    results, queries = {}, {}
+
+    with test_database():
+        for label in ("legacy_insert", "legacy_update"):
+            with CaptureQueriesContext(connection) as ctx, timer(results, label):
+                for df in frames:
+                    legacy_save_to_db(df)
+            queries[label] = len(ctx.captured_queries)
+
+        YouTubeVideo.objects.all().delete()
+        for label in ("bulk_insert", "bulk_update"):
+            with CaptureQueriesContext(connection) as ctx, timer(results, label):
+                for start in range(0, len(frames), batch):
+                    save_to_db(frames[start:start + batch])
+            queries[label] = len(ctx.captured_queries)
+
+    print(f"영상 {n_videos}개 × 제품 {products}개 = {total_rows} rows, bulk 배치 {batch}개 영상")
+    print(f"{'mode':<15}{'seconds':>10}{'rows/sec':>12}{'queries':>10}")
+    for label, seconds in results.items():
+        print(f"{label:<15}{seconds:>10.3f}{total_rows / seconds:>12.0f}{queries[label]:>10}")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, default=200)
+    parser.add_argument("--products", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=20)
+    args = parser.parse_args()
+    run(args.videos, args.products, args.batch)
@@ -0,0 +1,36 @@
+# ---------- ⬇️ 벤치마크 공용 도구: Django 설정, 테스트 DB, 합성 데이터 ----------
+import os
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from contextlib import contextmanager
+from django.conf import settings
+from django.db import connection
+import time
+
+# 로컬 fixture 서버는 막힐 일이 없으므로 요청 속도 제한(longform_ratelimit)을 끄고 크롤러 자체 성능만 잰다
+settings.CRAWLER_RATE_LIMIT = False
+
+from youtube_crawling.testing import synthetic_video_frames  # noqa: F401  (벤치마크 공용 합성 데이터)
+
+
+# ---------- ⬇️ 실제 DB를 건드리지 않도록 테스트 DB를 만들고 끝나면 삭제 ----------
+@contextmanager
+def test_database():
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=False)
+    try:
+        yield connection
+    finally:
+        connection.close()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+# ---------- ⬇️ 실행 시간 측정 ----------
+@contextmanager
+def timer(results: dict, name: str):
+    started = time.perf_counter()
+    yield
+    results[name] = time.perf_counter() - started
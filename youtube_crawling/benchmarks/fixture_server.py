@@ -0,0 +1,136 @@
+"""
+fixture 폴더를 유튜브처럼 보이게 서빙하는 로컬 HTTP 서버
+
+    /watch?v=<id>       -> watch_<id>.html
+    /<채널>/videos       -> channel_videos.html
+    /<채널>              -> channel_videos.html (채널명 조회용 og:title)
+    POST /youtubei/v1/browse -> channel_videos.json 의 다음 30개 (continuation 토큰 = 시작 위치)
+    /static/<파일>       -> 확장자별 크기의 더미 바이트 (썸네일, 폰트, 영상 스트림 흉내)
+
+보낸 바이트 수를 세므로 리소스 차단 전후의 페이지당 전송량을 비교할 수 있다.
+"""
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import json, os, threading, time
+
+from youtube_crawling.testing import channel_browse_response
+
+STATIC_SIZES = {
+    ".jpg": 25_000,
+    ".webp": 25_000,
+    ".woff2": 60_000,
+    ".mp4": 1_000_000,
+}
+STATIC_TYPES = {
+    ".jpg": "image/jpeg",
+    ".webp": "image/webp",
+    ".woff2": "font/woff2",
+    ".mp4": "video/mp4",
+}
+
+
+def make_handler(fixture_dir: str, counter: dict, latency: float = 0.0):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # 유튜브처럼 keep-alive 연결 재사용
+        disable_nagle_algorithm = True  # 헤더와 본문을 따로 쓸 때 delayed ACK(40ms) 대기 방지
+
+        def send_body(self, body: bytes, content_type: str):
+            if latency:
+                time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            with counter["lock"]:
+                counter["bytes"] += len(body)
+                counter["requests"] += 1
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            if parsed.path.startswith("/static/"):
+                ext = os.path.splitext(parsed.path)[1]
+                if ext not in STATIC_SIZES:
+                    self.send_error(404)
+                    return
+                self.send_body(b"\0" * STATIC_SIZES[ext], STATIC_TYPES[ext])
+                return
+            if parsed.path == "/watch":
+                video_id = parse_qs(parsed.query).get("v", [""])[0]
+                file_name = f"watch_{video_id}.html"
+            else:
+                file_name = "channel_videos.html"
+            path = os.path.join(fixture_dir, file_name)
+            if not os.path.exists(path):
+                self.send_error(404)
+                return
+            with open(path, "rb") as f:
+                body = f.read()
+            self.send_body(body, "text/html; charset=utf-8")
+
+        def do_POST(self):
+            if urlparse(self.path).path != "/youtubei/v1/browse":
+                self.send_error(404)
+                return
+            path = os.path.join(fixture_dir, "channel_videos.json")
+            if not os.path.exists(path):
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            token = json.loads(self.rfile.read(length) or b"{}").get("continuation")
+            with open(path, encoding="utf-8") as f:
+                video_ids = json.load(f)
+            body = json.dumps(channel_browse_response(video_ids, token)).encode("utf-8")
+            self.send_body(body, "application/json")
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+class FixtureHTTPServer(ThreadingHTTPServer):
+    # 기본 listen backlog(5)로는 동시 연결이 많은 asyncio 모드에서 SYN 재전송(1초) 대기가 생겨 측정이 왜곡됨
+    request_queue_size = 128
+
+
+class FixtureServer:
+    """
+    with 블록 안에서만 127.0.0.1 임의 포트로 fixture를 서빙.
+    latency(초)를 주면 응답마다 그만큼 늦게 보내서 실제 유튜브 응답 시간을 흉내 낸다 (루프백은 지연이 0이라 CPU만 비교됨).
+    """
+
+    def __init__(self, fixture_dir: str, latency: float = 0.0):
+        self.counter = {"lock": threading.Lock(), "bytes": 0, "requests": 0}
+        self.server = FixtureHTTPServer(("127.0.0.1", 0), make_handler(fixture_dir, self.counter, latency))
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def watch_url(self, video_id: str) -> str:
+        return f"{self.base_url}/watch?v={video_id}"
+
+    @property
+    def bytes_served(self) -> int:
+        return self.counter["bytes"]
+
+    @property
+    def requests_served(self) -> int:
+        return self.counter["requests"]
+
+    def reset_counter(self):
+        with self.counter["lock"]:
+            self.counter["bytes"] = 0
+            self.counter["requests"] = 0
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
+        return False
@@ -0,0 +1,123 @@
+"""
+벤치마크용 fixture 페이지
+
+- generate: 시청 페이지/채널 /videos 페이지와 같은 셀렉터 구조를 가진 합성 HTML 생성
+- record:   실제 유튜브 시청 페이지를 그대로 저장 (watch_<id>.html, 채널 페이지는 저장한 영상으로 합성)
+
+    python -m youtube_crawling.benchmarks.fixtures generate --out ./bench_fixtures --videos 20
+    python -m youtube_crawling.benchmarks.fixtures record --out ./bench_fixtures \
+        --channel https://www.youtube.com/@채널 --videos 20
+"""
+from youtube_crawling.testing import channel_browse_items, watch_page_html
+import argparse, json, os, random, re
+
+
+# ---------- ⬇️ 스크롤하면 30개씩 더 붙는 채널 /videos 페이지 (ytInitialData에는 첫 30개 + continuation 토큰) ----------
+def channel_page_html(video_ids: list[str], batch: int = 30) -> str:
+    initial = {
+        "metadata": {"channelMetadataRenderer": {"title": "벤치마크채널"}},
+        "contents": {"twoColumnBrowseResultsRenderer": {"tabs": [{"tabRenderer": {"content": {
+            "richGridRenderer": {"contents": channel_browse_items(video_ids, 0, batch)},
+        }}}]}},
+    }
+    ytcfg = {"INNERTUBE_API_KEY": "bench", "INNERTUBE_CONTEXT": {"client": {"clientName": "WEB", "clientVersion": "2.0", "hl": "ko"}}}
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8">
+<meta property="og:title" content="벤치마크채널"><title>벤치마크채널</title></head>
+<body>
+<div id="contents"></div>
+<script>var ytcfg = {{set: function () {{}}}}; ytcfg.set({json.dumps(ytcfg)});</script>
+<script>var ytInitialData = {json.dumps(initial, ensure_ascii=False)};</script>
+<script>
+  var ids = {json.dumps(video_ids)}, shown = 0, container = document.getElementById('contents');
+  function more() {{
+    ids.slice(shown, shown + {batch}).forEach(function (id) {{
+      var row = document.createElement('div');
+      row.style.height = '200px';
+      row.innerHTML = '<a id="video-title-link" href="/watch?v=' + id + '">' + id + '</a>';
+      container.appendChild(row);
+    }});
+    shown += {batch};
+    // 실제 채널 페이지처럼 더 불러올 영상이 남아있는 동안만 continuation 스피너를 둠
+    var spinner = document.querySelector('ytd-continuation-item-renderer');
+    if (shown < ids.length && !spinner) {{
+      document.body.appendChild(document.createElement('ytd-continuation-item-renderer'));
+    }} else if (shown >= ids.length && spinner) {{
+      spinner.remove();
+    }}
+  }}
+  more();
+  window.addEventListener('scroll', function () {{
+    if (window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 10) {{ setTimeout(more, 300); }}
+  }});
+</script>
+</body></html>"""
+
+
+def write_channel_page(out_dir: str, video_ids: list[str]):
+    with open(os.path.join(out_dir, "channel_videos.html"), "w", encoding="utf-8") as f:
+        f.write(channel_page_html(video_ids))
+    # fixture 서버가 browse continuation 요청에 답할 때 쓰는 영상 목록
+    with open(os.path.join(out_dir, "channel_videos.json"), "w", encoding="utf-8") as f:
+        json.dump(video_ids, f)
+
+
+def generate(out_dir: str, n_videos: int, products_per_video: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    video_ids = [f"bench{v:06d}" for v in range(n_videos)]
+    for i, video_id in enumerate(video_ids):
+        # 제품 섹션이 없는 영상도 섞어둠
+        count = products_per_video if i % 3 else 0
+        with open(os.path.join(out_dir, f"watch_{video_id}.html"), "w", encoding="utf-8") as f:
+            f.write(watch_page_html(video_id, count, rng))
+    write_channel_page(out_dir, video_ids)
+    return video_ids
+
+
+# ---------- ⬇️ 실제 페이지 저장 ----------
+def record(out_dir: str, channel_url: str, n_videos: int) -> list[str]:
+    from youtube_crawling.longform_http_extractor import get_http_session
+
+    os.makedirs(out_dir, exist_ok=True)
+    session = get_http_session()
+    channel_html = session.get(channel_url.rstrip("/") + "/videos", timeout=10).text
+    video_ids = list(dict.fromkeys(re.findall(r'"videoId":"([\w-]{11})"', channel_html)))[:n_videos]
+    # 저장한 영상만 가리키도록 채널 페이지는 합성 버전으로 저장
+    write_channel_page(out_dir, video_ids)
+    for video_id in video_ids:
+        page = session.get(f"https://www.youtube.com/watch?v={video_id}", timeout=10).text
+        with open(os.path.join(out_dir, f"watch_{video_id}.html"), "w", encoding="utf-8") as f:
+            f.write(page)
+    return video_ids
+
+
+def fixture_video_ids(fixture_dir: str) -> list[str]:
+    return sorted(
+        name[len("watch_"):-len(".html")]
+        for name in os.listdir(fixture_dir)
+        if name.startswith("watch_") and name.endswith(".html")
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+    gen = sub.add_parser("generate")
+    gen.add_argument("--out", required=True)
+    gen.add_argument("--videos", type=int, default=20)
+    gen.add_argument("--products", type=int, default=5)
+    rec = sub.add_parser("record")
+    rec.add_argument("--out", required=True)
+    rec.add_argument("--channel", required=True)
+    rec.add_argument("--videos", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        ids = generate(args.out, args.videos, args.products)
+    else:
+        import django
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+        django.setup()
+        ids = record(args.out, args.channel, args.videos)
+    print(f"{len(ids)}개 영상 fixture 저장: {args.out}")
@@ -0,0 +1,104 @@
+# --------- 그 외 import한 목록 ---------------
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base, creation
+import logging, threading
+
+try:
+    import psycopg
+    from psycopg_pool import ConnectionPool
+except ImportError:  # PostgreSQL 커넥션 풀을 쓸 때만 필요
+    psycopg = ConnectionPool = None
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+# 프로세스(워커)마다 (alias, DB 이름)별 풀 하나
+_pools = {}
+_pools_lock = threading.Lock()
+
+DEFAULT_POOL_OPTIONS = {"min_size": 1, "max_size": 10, "timeout": 30}
+
+
+# ---------- ⬇️ 풀 관리 ----------
+def get_pool(key: tuple, conn_params: dict, options: dict) -> "ConnectionPool":
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(
+                    kwargs=conn_params,
+                    check=ConnectionPool.check_connection,
+                    name=f"{key[0]}:{key[1]}",
+                    open=True,
+                    **{**DEFAULT_POOL_OPTIONS, **options},
+                )
+                _pools[key] = pool
+                logger.info(f"🏊 PostgreSQL 커넥션 풀 생성: {pool.name} (최대 {pool.max_size}개)")
+    return pool
+
+
+def close_all_pools():
+    """테스트 DB 삭제 전이나 워커 종료 때 풀에 남은 연결을 모두 닫는다."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+# ---------- ⬇️ 테스트 DB 삭제 (풀에 남은 연결이 있으면 DROP DATABASE 가 실패함) ----------
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        close_all_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+# ---------- ⬇️ 연결을 새로 열고 닫는 대신 풀에서 빌리고 돌려주는 PostgreSQL 백엔드 ----------
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    Django 4.2 postgresql 백엔드와 같고, 연결만 psycopg_pool 에서 가져온다.
+    OPTIONS['pool'] 은 ConnectionPool 인자 (min_size, max_size, timeout, max_idle ...).
+    CONN_MAX_AGE 동안은 스레드가 연결을 계속 쓰고, 닫을 때 풀로 돌려준다.
+    """
+
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        if ConnectionPool is None:
+            raise ImproperlyConfigured("PostgreSQL 커넥션 풀에는 psycopg 3과 psycopg_pool이 필요합니다. (pip install 'psycopg[binary]' psycopg_pool)")
+        super().__init__(*args, **kwargs)
+        self._pool = None
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        self._pool = get_pool(
+            (self.alias, self.settings_dict["NAME"]), conn_params, self.settings_dict["OPTIONS"].get("pool", {}),
+        )
+        self.Database = PooledDatabase(self._pool)
+        return super().get_new_connection(conn_params)
+
+    def _close(self):
+        if self.connection is None or self._pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            # 트랜잭션이 남아있으면 풀이 rollback 하고, 깨진 연결은 버린다
+            self._pool.putconn(self.connection)
+
+
+# ---------- ⬇️ super().get_new_connection 의 Database.connect 를 풀에서 빌리기로 바꿈 ----------
+class PooledDatabase:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def connect(self, **conn_params):
+        return self.pool.getconn()
+
+    def __getattr__(self, name):
+        return getattr(psycopg, name)
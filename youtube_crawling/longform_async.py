@@ -0,0 +1,233 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling.longform_crawler import (
+    DBBatchWriter, build_export_sinks, close_sinks, crawl_single_video, discover_channel, video_id_from_url, write_record,
+)
+from youtube_crawling.longform_checkpoints import get_resumable_job, create_job, claim_videos, claim_heartbeat, mark_done, finish_run
+from youtube_crawling.longform_export import safe_channel_name
+from youtube_crawling.longform_http_extractor import CONSENT_COOKIES, HEADERS, watch_html_rows
+from youtube_crawling.longform_ratelimit import athrottled_request
+from youtube_crawling import longform_metrics as metrics
+# --------- 그 외 import한 목록 ---------------
+from asgiref.sync import sync_to_async
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import date
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+import pandas as pd
+import asyncio, contextvars, functools, itertools, logging, uuid
+
+try:
+    import httpx
+except ImportError:  # 비동기 크롤링 모드에서만 필요
+    httpx = None
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+# httpx는 요청마다 INFO 로그를 남겨서 동시 요청이 많으면 로그 포맷팅이 CPU를 절반 가까이 씀
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+# ---------- ⬇️ 연결 풀을 작게 나눠서 요청을 번갈아 보내는 transport ----------
+class ShardedTransport:
+    """
+    httpcore 연결 풀은 요청을 배정할 때마다 (대기 중인 요청 수 x 연결 수) 만큼 훑어서
+    동시 요청이 32개쯤 되면 이벤트 루프 CPU 대부분을 여기서 쓴다. 연결 POOL_SIZE개짜리 풀 여러 개로 나눈다.
+    """
+    POOL_SIZE = 4
+
+    def __init__(self, concurrency: int, retries: int = 3):
+        count = max(1, -(-concurrency // self.POOL_SIZE))
+        limits = httpx.Limits(max_connections=self.POOL_SIZE, max_keepalive_connections=self.POOL_SIZE)
+        ssl_context = httpx.create_ssl_context()  # 인증서 로딩이 풀마다 수십 ms라서 한 번만
+        self.pools = [httpx.AsyncHTTPTransport(verify=ssl_context, retries=retries, limits=limits) for _ in range(count)]
+        self._next = itertools.cycle(self.pools)
+
+    async def handle_async_request(self, request):
+        return await next(self._next).handle_async_request(request)
+
+    async def aclose(self):
+        for pool in self.pools:
+            await pool.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+# ---------- ⬇️ 프로세스 하나에서 여러 요청을 동시에 보내는 비동기 HTTP 클라이언트 ----------
+def create_async_client(concurrency: int) -> "httpx.AsyncClient":
+    if httpx is None:
+        raise ImproperlyConfigured("비동기 크롤링에는 httpx가 필요합니다. (pip install httpx)")
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        cookies=CONSENT_COOKIES,
+        timeout=getattr(settings, "CRAWLER_HTTP_TIMEOUT", 10),
+        follow_redirects=True,
+        transport=ShardedTransport(concurrency, retries=3),  # 연결 실패만 재시도
+    )
+
+
+# ---------- ⬇️ 시청 페이지 HTML 가져오기 ----------
+async def fetch_watch_html_async(client, video_url: str) -> str | None:
+    try:
+        response = await athrottled_request(client, "GET", video_url, expect_initial_data=True)
+        response.raise_for_status()
+        return response.text
+    except httpx.HTTPError as e:
+        logger.warning(f"⚠️ 시청 페이지 요청 실패: {video_url} - {e}")
+        return None
+
+
+# ---------- ⬇️ HTTP(JSON) 백엔드와 같은 결과를 비동기로 ----------
+async def http_youtube_info_async(client, video_url: str, fallback=None) -> pd.DataFrame:
+    """
+    http_youtube_info 와 같은 규칙으로 row DataFrame을 만든다.
+    fallback은 await 할 수 있는 함수 (video_url -> DataFrame).
+    """
+    with metrics.span("http_fetch", mode="async"):
+        html = await fetch_watch_html_async(client, video_url)
+    with metrics.span("json_parse"):
+        rows, fallback_reason = watch_html_rows(video_url, html, fallback_allowed=fallback is not None)
+
+    if fallback_reason == "no_initial_data":
+        metrics.incr("http_fallback_total", reason=fallback_reason)
+        logger.warning(f"⚠️ ytInitialData 없음, Selenium으로 대체: {video_url}")
+        return await fallback(video_url) if fallback else pd.DataFrame()
+    if fallback_reason == "merch_shelf_unparsed":
+        metrics.incr("http_fallback_total", reason=fallback_reason)
+        logger.warning(f"⚠️ 제품 섹션을 JSON에서 읽지 못해 Selenium으로 대체: {video_url}")
+        return await fallback(video_url)
+    return pd.DataFrame(rows)
+
+
+# ---------- ⬇️ Selenium 대체 경로: 브라우저 풀 크기만큼의 전용 스레드에서 실행 ----------
+def selenium_fallback(executor: ThreadPoolExecutor):
+    """
+    기본 executor(asyncio.to_thread)는 limiter의 Redis 호출도 쓰므로, 몇 초씩 걸리는 Selenium 작업이
+    그 스레드를 다 잡고 있으면 HTTP 요청까지 멈춘다. 그래서 따로 만든 executor에서만 돌린다.
+    """
+    async def fallback(video_url: str) -> pd.DataFrame:
+        loop = asyncio.get_running_loop()
+        with metrics.span("selenium_fallback", mode="async"):
+            call = functools.partial(crawl_single_video, video_id_from_url(video_url), "selenium")
+            return await loop.run_in_executor(executor, contextvars.copy_context().run, call)
+    return fallback
+
+
+async def crawl_video_async(client, index: int, video_id: str, total: int, fallback=None) -> tuple[int, str, pd.DataFrame | None]:
+    video_url = f"https://www.youtube.com/watch?v={video_id}"
+    try:
+        with metrics.span("video_total", backend="async"):
+            df = await http_youtube_info_async(client, video_url, fallback)
+    except Exception as e:
+        metrics.incr("videos_failed_total")
+        logger.error(f"❌ ({index}/{total}) 영상 크롤링 중 에러 발생: {video_id} - {e}", exc_info=True)
+        return index, video_id, None
+    if df is None or df.empty:
+        logger.warning(f"⚠️ 데이터프레임이 비어 있음: {video_id}")
+    return index, video_id, df
+
+
+# ---------- ⬇️ 최대 concurrency개 영상을 동시에 진행하며 끝난 순서대로 내보내는 제너레이터 ----------
+async def iter_video_records_async(client, video_ids: list[str], concurrency: int):
+    """
+    iter_video_records 의 비동기 버전. 소비하는 쪽이 다음 결과를 가져갈 때만 새 영상을 시작하므로
+    싱크가 느리면 요청도 멈추고, 메모리에는 영상 concurrency개 분량만 머문다.
+    """
+    total = len(video_ids)
+    fallback = executor = None
+    if getattr(settings, "CRAWLER_HTTP_SELENIUM_FALLBACK", True):
+        executor = ThreadPoolExecutor(max_workers=getattr(settings, "CRAWLER_WORKERS", 1), thread_name_prefix="selenium-fallback")
+        fallback = selenium_fallback(executor)
+
+    pending = iter(enumerate(video_ids, start=1))
+    running = set()
+
+    def start_next():
+        for index, video_id in pending:
+            running.add(asyncio.create_task(crawl_video_async(client, index, video_id, total, fallback)))
+            return
+
+    for _ in range(max(1, concurrency)):
+        start_next()
+    try:
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                running.discard(task)
+                start_next()
+                index, video_id, df = task.result()
+                metrics.incr("videos_crawled_total" if df is not None and not df.empty else "videos_empty_total")
+                if df is not None and not df.empty:
+                    logger.info(f"✅ ({index}/{total}) 영상 크롤링 완료: {video_id}")
+                    yield index, video_id, df
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ---------- ⬇️ 유튜브 채널 전체를 이벤트 루프 하나로 크롤링 ----------
+async def crawl_channel_videos_async(channel_url: str, save_path: str, concurrency: int = None, incremental: bool = None, checkpoints: bool = None, limit: int = None, since: date = None):
+    """
+    crawl_channel_videos 와 같은 결과(DB, CSV/Parquet, 체크포인트, 지표)를 만든다.
+    영상 페이지는 비동기 HTTP로 동시에 가져오고, 채널 영상 수집/DB/파일 저장처럼 동기 코드는
+    sync_to_async 로 한 스레드에서 순서대로 실행한다 (이벤트 루프 안에서는 Django ORM을 직접 못 씀).
+    """
+    concurrency = concurrency or getattr(settings, "CRAWLER_ASYNC_CONCURRENCY", 32)
+    if incremental is None:
+        incremental = getattr(settings, "CRAWLER_INCREMENTAL", False)
+    if checkpoints is None:
+        checkpoints = getattr(settings, "CRAWLER_CHECKPOINTS", False)
+
+    run_metrics = metrics.start_run()
+    try:
+        with metrics.span("channel_total"):
+            await _crawl_channel_async(channel_url, save_path, concurrency, incremental, checkpoints, limit, since)
+    finally:
+        metrics.dump_run(run_metrics, safe_channel_name(channel_url.rstrip("/").split("/")[-1]))
+
+
+async def _crawl_channel_async(channel_url: str, save_path: str, concurrency: int, incremental: bool, checkpoints: bool, limit: int, since: date):
+    job = await sync_to_async(get_resumable_job)(channel_url) if checkpoints else None
+    if job is not None:
+        channel_name = job.channel_name
+    else:
+        channel_name, video_urls = await sync_to_async(discover_channel)(channel_url, incremental, limit, since)
+        if not video_urls:
+            return
+        video_ids = [video_id_from_url(url) for url in video_urls]
+        if checkpoints:
+            job = await sync_to_async(create_job)(channel_url, channel_name, video_ids)
+
+    owner = uuid.uuid4().hex
+    if job is not None:
+        video_ids = await sync_to_async(claim_videos)(job, owner)
+        if not video_ids:
+            await sync_to_async(finish_run)(job, [])
+            return
+
+    logger.info(f"총 {len(video_ids)}개 영상 비동기 크롤링 시작 (동시 요청 {min(concurrency, len(video_ids))}개)")
+
+    on_flush = (lambda saved_ids: mark_done(job, saved_ids)) if job is not None else None
+    sinks = [DBBatchWriter(on_flush=on_flush), *build_export_sinks(save_path, channel_name)]
+    crawled_count = 0
+    try:
+        with claim_heartbeat(job, owner) if job is not None else nullcontext():
+            async with create_async_client(concurrency) as client:
+                async for index, video_id, df in iter_video_records_async(client, video_ids, concurrency):
+                    await sync_to_async(write_record)(sinks, index, video_id, df)
+                    crawled_count += 1
+    finally:
+        await sync_to_async(close_sinks)(sinks)
+        if job is not None:
+            await sync_to_async(finish_run)(job, video_ids)
+    if crawled_count == 0:
+        logger.warning("⚠️ 크롤링 결과 데이터 없음")
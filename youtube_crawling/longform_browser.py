@@ -0,0 +1,274 @@
+# --------- 그 외 import한 목록 ---------------
+from contextlib import contextmanager
+from django.conf import settings
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+from webdriver_manager.chrome import ChromeDriverManager
+import psutil
+import atexit, logging, os, threading, time
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36'
+
+# ---------- ⬇️ 리소스 차단 프로필 ----------
+# 메타데이터 텍스트와 제품 이미지 src 속성만 있으면 되므로 이미지/미디어/폰트는 받지 않는다.
+# (요청만 막고 DOM은 그대로라서 <img>의 src 값은 읽을 수 있음)
+RESOURCE_PROFILES = {
+    "off": {
+        "arguments": [],
+        "prefs": {},
+        "blocked_urls": [],
+    },
+    "text": {
+        "arguments": [
+            "--autoplay-policy=user-gesture-required",  # 영상 자동재생 끄기
+            "--mute-audio",
+            "--blink-settings=imagesEnabled=false",
+        ],
+        "prefs": {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        },
+        "blocked_urls": [
+            # 영상 스트림 / 미디어
+            "*googlevideo.com/videoplayback*", "*.mp4*", "*.webm*", "*.m4a*",
+            # 이미지 (썸네일, 채널 아이콘)
+            "*i.ytimg.com/vi/*", "*yt3.ggpht.com/*", "*.jpg*", "*.jpeg*", "*.png*", "*.webp*", "*.gif*",
+            # 폰트
+            "*.woff*", "*.ttf*", "*.otf*", "*fonts.gstatic.com/*",
+            # 광고 / 추적
+            "*doubleclick.net/*", "*googlesyndication.com/*", "*youtube.com/api/stats/*", "*youtube.com/pagead/*",
+        ],
+    },
+}
+
+
+def resource_profile(name: str = None) -> dict:
+    name = name or getattr(settings, "CRAWLER_RESOURCE_PROFILE", "off")
+    if name not in RESOURCE_PROFILES:
+        logger.warning(f"⚠️ 알 수 없는 리소스 차단 프로필: {name}, 차단 없이 실행")
+        name = "off"
+    return RESOURCE_PROFILES[name]
+
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+# ---------- ⬇️ 크롬 드라이버 경로는 프로세스당 한 번만 찾기 ----------
+def resolve_driver_path() -> str:
+    """
+    ChromeDriverManager().install()은 버전 확인/다운로드를 하므로 느리고,
+    여러 태스크가 동시에 부르면 같은 파일을 동시에 받다가 꼬인다.
+    CRAWLER_CHROMEDRIVER_PATH가 있으면 그대로 쓴다.
+    """
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                _driver_path = getattr(settings, "CRAWLER_CHROMEDRIVER_PATH", None) or ChromeDriverManager().install()
+                logger.info(f"🔧 ChromeDriver 경로: {_driver_path}")
+    return _driver_path
+
+
+def build_chrome_options(profile: dict = None) -> webdriver.ChromeOptions:
+    profile = profile or resource_profile()
+    options = webdriver.ChromeOptions()
+    options.add_argument("--no-sandbox")           # 샌드박스 비활성화 (보안 기능 해제)
+    options.add_argument("--disable-dev-shm-usage")# 공유 메모리 사용 비활성화
+    options.add_argument("--disable-gpu")          # GPU 하드웨어 가속 비활성화
+    options.add_argument("--disable-extensions")   # 크롬 확장 프로그램 비활성화
+    options.add_argument("--disable-infobars")     # 정보 표시줄 비활성화
+    options.add_argument("--start-maximized")      # 브라우저 최대화
+    options.add_argument("--disable-notifications")# 알림 비활성화
+    options.add_argument('--ignore-certificate-errors')  # 인증서 오류 무시
+    options.add_argument('--ignore-ssl-errors')    # SSL 오류 무시
+    options.add_argument(f'user-agent={USER_AGENT}')
+    for argument in profile["arguments"]:
+        options.add_argument(argument)
+    if profile["prefs"]:
+        options.add_experimental_option("prefs", profile["prefs"])
+    return options
+
+
+# ---------- ⬇️ CDP로 URL 패턴 차단 (prefs로 못 막는 미디어/폰트/광고 요청) ----------
+def apply_url_blocking(driver, profile: dict):
+    if not profile["blocked_urls"]:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": profile["blocked_urls"]})
+    except WebDriverException as e:
+        logger.warning(f"⚠️ 리소스 차단 설정 실패: {e}")
+
+
+# ---------- ⬇️ 페이지 이동 횟수를 세는 크롬 드라이버 ----------
+class PooledChrome(webdriver.Chrome):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pages_loaded = 0
+        self.started_at = time.monotonic()
+
+    def get(self, url):
+        self.pages_loaded += 1
+        return super().get(url)
+
+
+def launch_driver(profile_name: str = None) -> PooledChrome:
+    profile = resource_profile(profile_name)
+    driver = PooledChrome(service=Service(resolve_driver_path()), options=build_chrome_options(profile))
+    apply_url_blocking(driver, profile)
+    logger.info("🟢 ChromeDriver 실행")
+    return driver
+
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+        logger.info("🛑 ChromeDriver 종료")
+    except Exception as e:
+        logger.warning(f"⚠️ 드라이버 종료 중 에러: {e}")
+
+
+# ---------- ⬇️ 드라이버 + 크롬 자식 프로세스 전체 메모리 ----------
+def driver_rss_mb(driver) -> float:
+    try:
+        proc = psutil.Process(driver.service.process.pid)
+        total = 0
+        for p in [proc, *proc.children(recursive=True)]:
+            try:
+                total += p.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / 1e6
+    except (psutil.Error, AttributeError):
+        return 0.0
+
+
+def is_alive(driver) -> bool:
+    try:
+        driver.execute_script("return 1;")
+        return True
+    except WebDriverException:
+        return False
+
+
+# ---------- ⬇️ 워커 프로세스 하나가 공유하는 크롬 세션 풀 ----------
+class BrowserPool:
+    """
+    사용이 끝난 세션을 닫지 않고 idle 목록에 보관했다가 다음 태스크에 넘겨준다.
+    max_pages 번 페이지를 열었거나 max_rss_mb 를 넘은 세션은 반납할 때 닫고 새로 띄운다.
+    동시에 빌려가는 세션 수는 제한하지 않고, 보관하는 idle 세션 수만 max_idle 로 제한한다.
+    """
+
+    def __init__(self, max_idle: int = None, max_pages: int = None, max_rss_mb: float = None):
+        self.max_idle = max_idle if max_idle is not None else getattr(settings, "CRAWLER_BROWSER_POOL_SIZE", 4)
+        self.max_pages = max_pages if max_pages is not None else getattr(settings, "CRAWLER_BROWSER_MAX_PAGES", 200)
+        self.max_rss_mb = max_rss_mb if max_rss_mb is not None else getattr(settings, "CRAWLER_BROWSER_MAX_RSS_MB", 1500)
+        self._idle = []
+        self._in_use = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def needs_recycle(self, driver) -> bool:
+        if self.max_pages and getattr(driver, "pages_loaded", 0) >= self.max_pages:
+            logger.info(f"♻️ 세션이 {driver.pages_loaded}개 페이지를 열어서 교체")
+            return True
+        if self.max_rss_mb:
+            rss = driver_rss_mb(driver)
+            if rss >= self.max_rss_mb:
+                logger.info(f"♻️ 세션 메모리 {rss:.0f}MB 초과로 교체")
+                return True
+        return False
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            if is_alive(driver):
+                with self._lock:
+                    self._in_use.add(driver)
+                return driver
+            quit_driver(driver)
+
+        driver = launch_driver()
+        with self._lock:
+            self._in_use.add(driver)
+        return driver
+
+    def release(self, driver, discard: bool = False):
+        with self._lock:
+            self._in_use.discard(driver)
+        if not discard and not self._closed and is_alive(driver) and not self.needs_recycle(driver):
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(driver)
+                    return
+        quit_driver(driver)
+
+    def warm(self, count: int):
+        """워커가 뜰 때 미리 세션을 띄워둔다"""
+        drivers = []
+        try:
+            for _ in range(min(count, self.max_idle)):
+                drivers.append(self.acquire())
+        finally:
+            for driver in drivers:
+                self.release(driver)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            drivers, self._idle = self._idle + list(self._in_use), []
+            self._in_use.clear()
+        for driver in drivers:
+            quit_driver(driver)
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> BrowserPool:
+    """프로세스마다 풀 하나 (Celery prefork 로 fork 된 자식은 부모의 풀을 쓰지 않음)"""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = BrowserPool()
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None and _pool_pid == os.getpid():
+        pool.close()
+
+
+atexit.register(close_pool)
+
+
+# ---------- ⬇️ 풀에서 세션을 빌려 쓰고 반납하는 함수 (create_driver 대체) ----------
+@contextmanager
+def browser_session():
+    pool = get_pool()
+    driver = pool.acquire()
+    discard = False
+    try:
+        yield driver
+    except WebDriverException as e:
+        logger.error(f"❌ WebDriver 예외 발생: {e}", exc_info=True)
+        discard = True
+        raise
+    finally:
+        pool.release(driver, discard=discard)
@@ -0,0 +1,176 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling.models import CrawlJob, CrawlJobVideo
+# --------- 그 외 import한 목록 ---------------
+from contextlib import contextmanager
+from datetime import timedelta
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+import logging, threading
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+
+def max_attempts() -> int:
+    return getattr(settings, "CRAWLER_JOB_MAX_ATTEMPTS", 3)
+
+
+def claim_lease() -> timedelta:
+    return timedelta(minutes=getattr(settings, "CRAWLER_CLAIM_LEASE_MINUTES", 5))
+
+
+# ---------- ⬇️ 이어서 진행할 수 있는 크롤링 작업 찾기 ----------
+def get_resumable_job(channel_url: str) -> CrawlJob | None:
+    """
+    같은 채널의 진행 중인 작업이 있으면 반환한다.
+    CRAWLER_JOB_MAX_AGE_HOURS 보다 오래된 작업은 중단 처리하고 새로 시작하게 한다.
+    """
+    job = (
+        CrawlJob.objects.filter(channel_url=channel_url, status=CrawlJob.STATUS_RUNNING)
+        .order_by("-created_at")
+        .first()
+    )
+    if job is None:
+        return None
+    max_age = timedelta(hours=getattr(settings, "CRAWLER_JOB_MAX_AGE_HOURS", 24))
+    if job.created_at < timezone.now() - max_age:
+        CrawlJob.objects.filter(channel_url=channel_url, status=CrawlJob.STATUS_RUNNING).update(
+            status=CrawlJob.STATUS_ABANDONED, finished_at=timezone.now()
+        )
+        logger.info(f"🗑️ 오래된 크롤링 작업 중단 처리: {job}")
+        return None
+    logger.info(f"⏯️ 이전 크롤링 작업 이어서 진행: {job}")
+    return job
+
+
+# ---------- ⬇️ 수집한 영상 ID 목록으로 새 작업 만들기 ----------
+def create_job(channel_url: str, channel_name: str, video_ids: list[str]) -> CrawlJob:
+    with transaction.atomic():
+        job = CrawlJob.objects.create(channel_url=channel_url, channel_name=channel_name or "")
+        CrawlJobVideo.objects.bulk_create(
+            [CrawlJobVideo(job=job, video_id=video_id, position=i) for i, video_id in enumerate(video_ids)],
+            ignore_conflicts=True,
+        )
+    logger.info(f"📝 크롤링 작업 생성: {job} (영상 {len(video_ids)}개)")
+    return job
+
+
+# ---------- ⬇️ 이번 실행에서 크롤링할 영상 가져오기 ----------
+def claimable() -> Q:
+    """
+    대기 중인 영상, 재시도 시각이 지난 실패 영상, 가져간 실행이 죽어서 heartbeat가 lease 넘게 끊긴 영상.
+    살아 있는 실행은 claim_heartbeat 로 lease 의 1/3 마다 updated_at 을 갱신한다.
+    """
+    now = timezone.now()
+    return (
+        Q(status=CrawlJobVideo.STATUS_PENDING)
+        | Q(status=CrawlJobVideo.STATUS_FAILED, attempts__lt=max_attempts(), next_attempt_at__lte=now)
+        | Q(status=CrawlJobVideo.STATUS_RUNNING, attempts__lt=max_attempts(), updated_at__lte=now - claim_lease())
+    )
+
+
+def claim_videos(job: CrawlJob, owner: str = "") -> list[str]:
+    """
+    가져올 수 있는 영상을 순서대로 '크롤링 중'으로 바꾸고 시도 횟수를 먼저 올려둔다.
+    (워커가 중간에 죽어도 시도로 기록됨) 겹쳐서 실행된 discover나 acks_late 재전달이
+    같은 영상을 두 번 가져가지 않도록, 다른 트랜잭션이 잡은 row는 건너뛰고(skip_locked)
+    UPDATE 때 조건을 다시 확인한 뒤 이번에 바꾼 row만 돌려준다.
+    owner 는 이번 실행의 ID로, heartbeat 가 자기가 가져간 영상만 갱신하는 데 쓴다.
+    """
+    claimed_at = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            job.videos.select_for_update(skip_locked=True).filter(claimable()).order_by("position").values_list("id", flat=True)
+        )
+        # QuerySet.update 는 auto_now 를 채우지 않으므로 updated_at 을 직접 넣고, 이 값으로 이번에 가져간 row를 구분
+        job.videos.filter(claimable(), id__in=ids).update(
+            status=CrawlJobVideo.STATUS_RUNNING, attempts=F("attempts") + 1, updated_at=claimed_at, claimed_by=owner,
+        )
+        video_ids = list(
+            job.videos.filter(id__in=ids, status=CrawlJobVideo.STATUS_RUNNING, updated_at=claimed_at)
+            .order_by("position").values_list("video_id", flat=True)
+        )
+    logger.info(f"📋 이번 실행에서 크롤링할 영상 {len(video_ids)}개")
+    return video_ids
+
+
+# ---------- ⬇️ 실행이 살아 있다고 알리기 (가져간 영상의 lease 연장) ----------
+def heartbeat(job_id: int, owner: str) -> int:
+    return CrawlJobVideo.objects.filter(job_id=job_id, status=CrawlJobVideo.STATUS_RUNNING, claimed_by=owner).update(
+        updated_at=timezone.now()
+    )
+
+
+@contextmanager
+def claim_heartbeat(job: CrawlJob, owner: str):
+    """
+    with 블록 동안 백그라운드 스레드에서 lease 의 1/3 마다 heartbeat 를 보낸다.
+    프로세스가 죽으면 heartbeat 도 멈추므로 lease 가 지나면 다음 실행이 남은 영상을 다시 가져간다.
+    """
+    stop = threading.Event()
+    interval = claim_lease().total_seconds() / 3
+
+    def beat():
+        try:
+            while not stop.wait(interval):
+                try:
+                    heartbeat(job.id, owner)
+                except DatabaseError as e:
+                    logger.warning(f"⚠️ 크롤링 작업 heartbeat 실패: {job} - {e}")
+        finally:
+            connection.close()  # 이 스레드가 연 DB 연결 정리
+
+    thread = threading.Thread(target=beat, name="claim-heartbeat", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+# ---------- ⬇️ DB 저장이 끝난 영상 완료 처리 ----------
+def mark_done(job: CrawlJob, video_ids: list[str]) -> int:
+    if not video_ids:
+        return 0
+    return job.videos.filter(video_id__in=video_ids).update(
+        status=CrawlJobVideo.STATUS_DONE, next_attempt_at=None
+    )
+
+
+# ---------- ⬇️ 실행이 끝났을 때 실패 영상 재시도 예약 및 작업 상태 갱신 ----------
+def finish_run(job: CrawlJob, claimed_ids: list[str]):
+    """
+    이번에 가져갔지만 완료되지 않은 영상은 실패로 두고, 시도 횟수에 따라 재시도 시각을 늦춘다.
+    (기본 10분, 20분, 40분 ...) 더 처리할 영상이 없으면 작업을 완료로 바꾼다.
+    """
+    now = timezone.now()
+    base_minutes = getattr(settings, "CRAWLER_RETRY_BACKOFF_MINUTES", 10)
+    failed = list(
+        job.videos.filter(video_id__in=claimed_ids)
+        .exclude(status=CrawlJobVideo.STATUS_DONE)
+        .only("id", "attempts")
+    )
+    for video in failed:
+        video.status = CrawlJobVideo.STATUS_FAILED
+        video.next_attempt_at = now + timedelta(minutes=base_minutes * 2 ** max(video.attempts - 1, 0))
+    if failed:
+        CrawlJobVideo.objects.bulk_update(failed, ["status", "next_attempt_at"])
+        logger.warning(f"⚠️ 실패한 영상 {len(failed)}개 재시도 예약")
+
+    # 다른 실행이 아직 크롤링 중인 영상이 있으면 작업을 끝내지 않음
+    remaining = job.videos.filter(
+        Q(status__in=[CrawlJobVideo.STATUS_PENDING, CrawlJobVideo.STATUS_RUNNING])
+        | Q(status=CrawlJobVideo.STATUS_FAILED, attempts__lt=max_attempts())
+    ).count()
+    if remaining == 0:
+        job.status = CrawlJob.STATUS_DONE
+        job.finished_at = now
+        job.save(update_fields=["status", "finished_at", "updated_at"])
+        logger.info(f"🏁 크롤링 작업 완료: {job}")
+    else:
+        logger.info(f"⏸️ 남은 영상 {remaining}개는 다음 실행에서 이어서 진행합니다: {job}")
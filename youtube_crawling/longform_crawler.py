@@ -1,321 +1,548 @@
 # --------- 프로젝트에서 import한 목록 ---------------
 from youtube_crawling.models import YouTubeVideo, YouTubeProduct
+from youtube_crawling.longform_readiness import (
+    StepBudget, wait_for_document_ready, wait_for_any, wait_for_network_idle,
+    scroll_until_present, click_first_clickable,
+)
+from youtube_crawling.longform_schema import build_video_rows
+from youtube_crawling.longform_normalize import normalize_frame
+from youtube_crawling.longform_history import history_enabled, rollup_channel_daily, snapshot_saved_videos, write_snapshots
+from youtube_crawling.longform_numbers import KoreanParseError, parse_count, parse_krw, parse_korean_date, report_failure
+from youtube_crawling import longform_metrics as metrics
+from youtube_crawling.longform_checkpoints import (
+    get_resumable_job, create_job, claim_videos, claim_heartbeat, mark_done, finish_run,
+)
+from youtube_crawling.longform_export import PartitionedCSVWriter, PartitionedParquetWriter, compact_csv, safe_channel_name
+from youtube_crawling.longform_http_extractor import http_youtube_info, fetch_watch_html, parse_watch_html
+from youtube_crawling.longform_browser import browser_session, get_pool
+from youtube_crawling.longform_parser import parse_watch_page
+from youtube_crawling.longform_discovery import DiscoveryCollector, discover_video_urls_http, discover_video_urls_dom
+from youtube_crawling.longform_ratelimit import throttled_get
 # --------- selenium에서 import한 목록 ---------------
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-# --------- webdriver에서 import한 목록 ---------------
-from webdriver_manager.chrome import ChromeDriverManager
-from contextlib import contextmanager # 드라이버 관리하는 태그
+from selenium.common.exceptions import WebDriverException
 # --------- 그 외 크롤링 코드를 위해 import한 목록 ---------------
-from bs4 import BeautifulSoup
-from datetime import datetime
-from django.db import transaction
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, date, timedelta
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, OperationalError, transaction
 import pandas as pd
-import logging, time, re, os, urllib.parse
+import hashlib, logging, re, os, queue, threading, time, urllib.parse, uuid
 
 
 # ---------- ⬇️ logging 설정 ----------
 
 logger = logging.getLogger(__name__)
 
-# ---------- ⬇️ DB에 저장하는 함수 ----------
-def save_to_db(data: pd.DataFrame):
-    if data is None or data.empty:
-        logger.warning("⚠️ 저장할 데이터가 없습니다.")
-        return 0
-    saved_count = 0
-    updated_count = 0
-    def validate_url(url: str) -> str:
+# ---------- ⬇️ DB upsert 시 갱신할 필드 ----------
+VIDEO_UPDATE_FIELDS = [
+    "extracted_date", "upload_date", "channel_name", "subscriber_count", "title",
+    "view_count", "video_url", "product_count", "description",
+]
+PRODUCT_UPDATE_FIELDS = [
+    "product_price", "product_image_link", "product_merchant", "product_merchant_link",
+]
+# 다시 크롤링해도 대부분 그대로인 필드는 content_hash 로 비교해서 바뀐 row만 다시 씀
+# (조회수/구독자 수/추출일은 매일 바뀌므로 해시에 넣지 않고 값끼리 직접 비교)
+VIDEO_COUNT_FIELDS = ["extracted_date", "subscriber_count", "view_count"]
+VIDEO_HASH_FIELDS = [field for field in VIDEO_UPDATE_FIELDS if field not in VIDEO_COUNT_FIELDS]
+PRODUCT_HASH_FIELDS = PRODUCT_UPDATE_FIELDS
+_to_date = YouTubeVideo._meta.get_field("extracted_date").to_python
+
+
+# ---------- ⬇️ 영상/제품 내용 해시 (같은 값이면 크롤링할 때마다 같은 해시) ----------
+def content_hash(values) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        if isinstance(value, (datetime, date)):  # pd.Timestamp 도 datetime
+            value = value.strftime("%Y-%m-%d")
+        digest.update(str(value).encode())
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+# ---------- ⬇️ DataFrame을 DB에 넣을 영상/제품 객체로 변환 ----------
+def build_db_objects(data: pd.DataFrame) -> tuple[dict, dict]:
+    """
+    반환값: ({video_id: YouTubeVideo}, {(video_id, product_name): 제품 필드 dict})
+    영상 정보는 영상의 첫 row, 같은 제품이 여러 번 나오면 마지막 값을 사용한다.
+    숫자/날짜/설명은 normalize_frame 결과를 그대로 쓴다 (CSV 싱크와 같은 값).
+    """
+    data = normalize_frame(data)
+    missing_id = data["youtube_id"].fillna("").astype(str) == ""
+    if missing_id.any():
+        logger.warning(f"⚠️ video_id 없는 row {int(missing_id.sum())}개, 건너뜁니다")
+        data = data[~missing_id]
+
+    videos = {}
+    for row in data.drop_duplicates("youtube_id", keep="first").to_dict("records"):
+        video_id = row["youtube_id"]
         try:
-            if not url:
-                return ""
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            return urllib.parse.quote(url, safe=':/?=&')
+            video = YouTubeVideo(
+                video_id=video_id,
+                extracted_date=row.get("extracted_date", ""),
+                upload_date=row.get("upload_date", ""),
+                channel_name=row.get("channel_name", ""),
+                subscriber_count=row.get("subscribers", 0),
+                title=row.get("title", ""),
+                view_count=row.get("view_count", 0),
+                video_url=validate_url(row.get("video_url", "")),
+                product_count=row.get("product_count", 0),  # HTML에서 추출한 제품 개수 사용
+                description=row.get("description", ""),
+            )
+            # bulk_create 는 한 번에 저장하므로 '날짜 없음' 같은 값이 하나라도 있으면 batch 전체가 실패함
+            # -> 저장 전에 row마다 필드 값을 확인(날짜는 date로 변환)하고 잘못된 영상만 뺀다
+            video.clean_fields(exclude=["content_hash"])
+            videos[video_id] = video
+        except ValidationError as e:
+            logger.error(f"❌ 영상 정보가 올바르지 않아 건너뜁니다 ({video_id}): {e.message_dict}")
         except Exception as e:
-            logger.error(f"❌ URL 검증 실패: {url}, 에러: {e}")
-            return ""
+            logger.error(f"❌ 영상 정보 처리 중 에러 발생 ({video_id}): {e}")
+
+    products = {}
+    if "product_name" in data:
+        data = data.assign(product_name=data["product_name"].fillna("").astype(str).str.strip())
+        data = data[(data["product_name"] != "") & data["youtube_id"].isin(list(videos))]
+        for row in data.drop_duplicates(["youtube_id", "product_name"], keep="last").to_dict("records"):
+            try:
+                fields = {
+                    "product_price": row.get("product_price", 0),
+                    "product_image_link": validate_url(row.get("product_image_url", "")),
+                    "product_merchant": row.get("product_merchant", ""),
+                    "product_merchant_link": validate_url(row.get("product_merchant_url", "")),
+                }
+                YouTubeProduct(product_name=row["product_name"], **fields).clean_fields(exclude=["video", "content_hash"])
+                products[(row["youtube_id"], row["product_name"])] = fields
+            except ValidationError as e:
+                logger.error(f"❌ 제품 정보가 올바르지 않아 건너뜁니다 ({row['product_name']}): {e.message_dict}")
+            except Exception as e:
+                logger.error(f"❌ 제품 정보 처리 중 에러 발생 ({row['product_name']}): {e}")
+    return videos, products
+
+
+# ---------- ⬇️ 영상/제품 bulk upsert (에러는 호출한 쪽으로 그대로 올림) ----------
+def upsert_frames(frames: list[pd.DataFrame]) -> tuple[list[str], int]:
+    """
+    영상은 video_id, 제품은 (video, product_name) 기준으로 저장된 content_hash 와 비교해서 바뀐 것만
+    INSERT ... ON CONFLICT DO UPDATE 로 쓰고, 같은 내용을 다시 저장하면 조회 2번으로 끝난다.
+    쿼리는 영상 수/제품 수와 상관없이 최대 6번(해시 조회 2번, 영상 upsert 2번, 새 영상 pk 조회, 제품 upsert)이고,
+    CRAWLER_HISTORY 가 켜져 있으면 이력 저장 2번과 채널/날짜별 집계 갱신이 더해진다.
+    워커 여러 개가 동시에 저장하다 deadlock/잠금 에러가 나면 CRAWLER_DB_WRITE_RETRIES 번까지 다시 시도한다.
+    반환값: (저장된 video_id 목록, 저장된 제품 수)
+    """
+    data = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    videos, products = build_db_objects(data)
+    if not videos:
+        return [], 0
+    retries = getattr(settings, "CRAWLER_DB_WRITE_RETRIES", 3)
+    attempt = 0
+    while True:
+        try:
+            product_count, touched = _upsert_objects(videos, products)
+            break
+        except OperationalError as e:
+            attempt += 1
+            if attempt > retries:
+                raise
+            metrics.incr("db_write_retries_total")
+            logger.warning(f"⚠️ DB 저장 충돌, {attempt}번째 다시 시도: {e}")
+            time.sleep(0.2 * 2 ** (attempt - 1))
+    if touched:
+        # 영상/제품은 이미 커밋됐으므로 집계가 실패해도 저장 결과는 돌려준다 (rollup_channel_daily 를 다시 돌리면 맞춰짐)
+        try:
+            with metrics.span("history_rollup"):
+                rollup_channel_daily(touched)
+        except DatabaseError as e:
+            metrics.incr("history_rollup_failures_total")
+            logger.error(f"❌ 채널/날짜별 집계 갱신 실패 (저장은 완료됨): {e}")
+    logger.info(f"✅ 총 {len(videos)}개의 영상과 {product_count}개의 제품이 저장되었습니다.")
+    return list(videos), product_count
+
+
+def _upsert_objects(videos: dict, products: dict) -> tuple[int, set]:
+    skip_unchanged = getattr(settings, "CRAWLER_SKIP_UNCHANGED", True)
+    for video in videos.values():
+        video.content_hash = content_hash(getattr(video, field) for field in VIDEO_HASH_FIELDS)
+    # 모든 워커가 같은 순서(키 순서)로 row 잠금을 잡아야 PostgreSQL에서 서로 기다리다 deadlock 나지 않음
+    with transaction.atomic():
+        existing = {}
+        if skip_unchanged:
+            existing = {
+                video_id: (pk, saved_hash, (extracted_date, subscriber_count, view_count))
+                for video_id, pk, saved_hash, extracted_date, subscriber_count, view_count in YouTubeVideo.objects.filter(
+                    video_id__in=list(videos),
+                ).values_list("video_id", "id", "content_hash", *VIDEO_COUNT_FIELDS)
+            }
+        # 내용이 바뀐 영상(또는 새 영상)은 전체, 조회수/구독자 수만 바뀐 영상은 그 필드만, 나머지는 건너뜀
+        full_writes, count_writes = [], []
+        for video_id in sorted(videos):
+            video = videos[video_id]
+            if video_id not in existing:
+                full_writes.append(video)
+                continue
+            _, saved_hash, saved_counts = existing[video_id]
+            if saved_hash != video.content_hash:
+                full_writes.append(video)
+            elif saved_counts != (_to_date(video.extracted_date), video.subscriber_count, video.view_count):
+                count_writes.append(video)
+        for objs, fields in ((full_writes, VIDEO_UPDATE_FIELDS + ["content_hash"]), (count_writes, VIDEO_COUNT_FIELDS)):
+            if objs:
+                YouTubeVideo.objects.bulk_create(objs, update_conflicts=True, unique_fields=["video_id"], update_fields=fields)
+
+        pk_by_video_id = {video_id: pk for video_id, (pk, _, _) in existing.items()}
+        if len(pk_by_video_id) < len(videos):
+            # update_conflicts 로는 pk가 채워지지 않아서 새로 넣은 영상만 한 번에 다시 조회
+            pk_by_video_id.update(
+                YouTubeVideo.objects.filter(video_id__in=[v for v in videos if v not in pk_by_video_id]).values_list("video_id", "id")
+            )
+        saved_product_hashes = {}
+        if existing:
+            saved_product_hashes = {
+                (video_pk, product_name): saved_hash
+                for video_pk, product_name, saved_hash in YouTubeProduct.objects.filter(
+                    video_id__in=[pk for pk, _, _ in existing.values()],
+                ).values_list("video_id", "product_name", "content_hash")
+            }
+        product_objs, unchanged_products = [], 0
+        for video_id, product_name in sorted(products):
+            if video_id not in pk_by_video_id:
+                continue
+            fields = products[(video_id, product_name)]
+            product_hash = content_hash(fields[field] for field in PRODUCT_HASH_FIELDS)
+            video_pk = pk_by_video_id[video_id]
+            if saved_product_hashes.get((video_pk, product_name)) == product_hash:
+                unchanged_products += 1
+                continue
+            product_objs.append(YouTubeProduct(video_id=video_pk, product_name=product_name, content_hash=product_hash, **fields))
+        if product_objs:
+            YouTubeProduct.objects.bulk_create(
+                product_objs,
+                update_conflicts=True,
+                unique_fields=["video", "product_name"],
+                update_fields=PRODUCT_UPDATE_FIELDS + ["content_hash"],
+            )
+        # 덮어쓰기 전 값은 남지 않으므로 같은 트랜잭션에서 (영상, 수집일)별 이력도 쌓음
+        touched = write_snapshots(videos, products, pk_by_video_id) if history_enabled() else set()
+
+    metrics.incr("db_rows_written_total", len(full_writes), table="video", fields="all")
+    metrics.incr("db_rows_written_total", len(count_writes), table="video", fields="counts")
+    metrics.incr("db_rows_unchanged_total", len(videos) - len(full_writes) - len(count_writes), table="video")
+    metrics.incr("db_rows_written_total", len(product_objs), table="product", fields="all")
+    metrics.incr("db_rows_unchanged_total", unchanged_products, table="product")
+    return len(product_objs) + unchanged_products, touched
+
+
+# ---------- ⬇️ DB에 저장하는 함수 (영상 여러 개를 한 번에 bulk upsert) ----------
+def save_to_db(data) -> int:
+    """data: DataFrame 하나 또는 영상별 DataFrame 목록. 저장된 제품 수를 반환한다."""
+    frames = [data] if isinstance(data, pd.DataFrame) else list(data or [])
+    frames = [df for df in frames if df is not None and not df.empty]
+    if not frames:
+        logger.warning("⚠️ 저장할 데이터가 없습니다.")
+        return 0
     try:
-        with transaction.atomic():
-            for video_id, video_group in data.groupby('youtube_id'):
-                if not video_id:
-                    logger.warning("⚠️ video_id 없음, 건너뜁니다")
-                    continue
-
-                first_row = video_group.iloc[0]
-                
-                try:
-                    # 날짜 변환
-                    extracted_date = format_date(first_row.get("extracted_date", ""))
-                    upload_date = format_date(first_row.get("upload_date", ""))
-                    
-                    # 숫자 데이터 변환
-                    subscriber_count = parse_subscriber_count(first_row.get("subscribers", "0"))
-                    view_count = parse_view_count(first_row.get("view_count", "0"))
-                    
-                    # HTML에서 추출한 제품 개수 사용 (첫 번째 행에서만 가져옴)
-                    product_count = int(first_row.get("product_count", 0))
-                    logger.info(f"✅ 비디오 {video_id}의 제품 개수: {product_count}개")
-                    
-                    # URL 검증
-                    video_url = validate_url(first_row.get("video_url", ""))
-                    
-                    # 영상 정보 생성 또는 업데이트
-                    video_obj, created = YouTubeVideo.objects.update_or_create(
-                        video_id=video_id,
-                        defaults={
-                            "extracted_date": extracted_date,
-                            "upload_date": upload_date,
-                            "channel_name": first_row.get("channel_name", ""),
-                            "subscriber_count": subscriber_count,
-                            "title": first_row.get("title", ""),
-                            "view_count": view_count,
-                            "video_url": video_url,
-                            "product_count": product_count,  # HTML에서 추출한 제품 개수 사용
-                            "description": clean_description(first_row.get("description", "")),
-                        }
-                    )
-                    if created:
-                        logger.info(f"✨ 새로운 영상 생성: {video_id}")
-                    else:
-                        logger.info(f"🔄 기존 영상 업데이트: {video_id}")
-                        updated_count += 1
-                    for _, row in video_group.iterrows():
-                        product_name = row.get("product_name", "").strip()
-                        if product_name:
-                            try:
-                                price = parse_price(row.get("product_price", "0"))
-                                product_image_link = validate_url(row.get("product_image_url", ""))
-                                product_merchant_link = validate_url(row.get("product_merchant_url", ""))
-                                product, created = YouTubeProduct.objects.update_or_create(
-                                    video=video_obj,
-                                    product_name=product_name,
-                                    defaults={
-                                        "product_price": price,
-                                        "product_image_link": product_image_link,
-                                        "product_merchant": row.get("product_merchant", ""),
-                                        "product_merchant_link": product_merchant_link
-                                    }
-                                )
-                                saved_count += 1
-                                if created:
-                                    logger.info(f"✨ 새로운 제품 정보 저장: {product_name} (가격: {price:,}원)")
-                                else:
-                                    logger.info(f"🔄 기존 제품 정보 업데이트: {product_name} (가격: {price:,}원)")
-                            except Exception as e:
-                                logger.error(f"❌ 제품 정보 저장 중 에러 발생 ({product_name}): {e}")
-                                continue
-                except Exception as e:
-                    logger.error(f"❌ 영상 정보 처리 중 에러 발생 ({video_id}): {e}")
-                    continue
+        _, saved_count = upsert_frames(frames)
     except Exception as e:
         logger.error(f"❌ DB 저장 중 에러 발생: {e}", exc_info=True)
         return 0
-    logger.info(f"✅ 총 {updated_count}개의 영상이 업데이트되었고, {saved_count}개의 제품이 저장되었습니다.")
     return saved_count
 
+
+# ---------- ⬇️ 영상별 DataFrame을 모아서 한 번에 DB에 저장 ----------
+class DBBatchWriter:
+    """
+    영상 batch_size개가 모이면 한 번에 저장, close()/with 블록 종료 시 남은 것도 저장.
+    write()/close()를 가진 크롤링 결과 싱크로도 쓰인다.
+    on_flush가 주어지면 저장에 성공한 video_id 목록으로 호출한다. (체크포인트 완료 처리용)
+    """
+
+    def __init__(self, batch_size: int = None, on_flush=None):
+        self.batch_size = batch_size or getattr(settings, "CRAWLER_DB_BATCH_SIZE", 20)
+        self.on_flush = on_flush
+        self.pending = []
+        self.saved_count = 0
+
+    def write(self, df: pd.DataFrame):
+        if df is None or df.empty:
+            return
+        self.pending.append(df)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        if not self.pending:
+            return 0
+        frames, self.pending = self.pending, []
+        try:
+            with metrics.span("save_to_db"):
+                video_ids, saved = upsert_frames(frames)
+        except Exception as e:
+            logger.error(f"❌ DB 저장 중 에러 발생: {e}", exc_info=True)
+            return 0
+        self.saved_count += saved
+        if self.on_flush and video_ids:
+            self.on_flush(video_ids)
+        return saved
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
 # ---------- ⬇️ CSV용으로 데이터 전처리하는 함수 ----------
 def preprocess_df(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df['view_count'] = df['view_count'].apply(parse_view_count)
-    df['subscribers'] = df['subscribers'].apply(parse_subscriber_count)
-    df['product_price'] = df['product_price'].apply(parse_price)
-    df['description'] = df['description'].apply(clean_description)
-    df['upload_date'] = df['upload_date'].apply(format_date)
-    df['extracted_date'] = df['extracted_date'].apply(format_date)
-    return df
+    """run_sinks 에서 이미 정규화된 DataFrame이 오면 그대로 반환된다."""
+    return normalize_frame(df)
 
 # ---------- ⬇️ CSV로 저장하는 함수 ----------
-def save_to_csv(df: pd.DataFrame, directory: str, channel_name: str) -> str:
-    df = preprocess_df(df)
+def save_to_csv(df: pd.DataFrame, directory: str, channel_name: str, writer: PartitionedCSVWriter = None) -> str:
+    """채널/추출일별 파티션 파일에 이어붙인다. 기존 파일을 다시 읽거나 다시 쓰지 않는다."""
     try:
-        # 디렉토리가 없으면 생성
-        os.makedirs(directory, exist_ok=True)
+        df = preprocess_df(df)
+        writer = writer or PartitionedCSVWriter(directory, channel_name)
+        paths = writer.write(df)
+        if not paths:
+            return None
+        for file_path in paths:
+            logger.info(f"💾 CSV 저장 완료: {file_path}")
+        return paths[0]
 
-        # URL 인코딩된 채널명을 디코딩
-        decoded_channel_name = urllib.parse.unquote(channel_name)
-        
-        # 채널명에서 특수문자 제거하고 공백을 언더스코어로 변경
-        safe_channel_name = "".join(c for c in decoded_channel_name.replace(" ", "_") if c.isalnum() or c in ('_',)).rstrip()
+    except Exception as e:
+        logger.error(f"❌ CSV 저장 실패: {e}", exc_info=True)
+        return None
 
-        # 파일명 생성
-        file_name = f"{safe_channel_name}.csv"
-        file_path = os.path.join(directory, file_name)
+# ---------- ⬇️ 영상이 끝날 때마다 CSV 파티션에 이어붙이는 싱크 ----------
+class CSVSink:
+    def __init__(self, directory: str, channel_name: str, compact: bool = None):
+        self.directory = directory
+        self.channel_name = channel_name
+        self.compact = getattr(settings, "CRAWLER_CSV_COMPACT", False) if compact is None else compact
+        self.writer = PartitionedCSVWriter(directory, channel_name)
 
-        # 누적 저장
-        if os.path.exists(file_path):
+    def write(self, df: pd.DataFrame):
+        save_to_csv(df, self.directory, self.channel_name, writer=self.writer)
+
+    def close(self):
+        if self.writer.rows_written == 0:
+            return
+        logger.info(f"✅ CSV 파일 저장 완료: {self.writer.channel_dir} ({self.writer.rows_written} rows)")
+        # 선택: 파티션 파일을 채널별 CSV 한 개로 합치기
+        if self.compact:
             try:
-                old_df = pd.read_csv(file_path)
-                combined_df = pd.concat([old_df, df], ignore_index=True)
+                compact_csv(self.directory, self.channel_name)
             except Exception as e:
-                logger.error(f"❌ 기존 CSV 읽기 실패: {file_path} - {e}")
-                combined_df = df
-        else:
-            combined_df = df
+                logger.error(f"❌ CSV 합치기 중 에러 발생: {e}", exc_info=True)
 
-        combined_df = combined_df.sort_values(by="extracted_date", ascending=False)
-        combined_df.to_csv(file_path, index=False, encoding='utf-8-sig')
-        logger.info(f"💾 CSV 저장 완료: {file_path}")
-        return file_path
+# ---------- ⬇️ CSV와 같은 row를 컬럼형(Parquet)으로 저장하는 싱크 ----------
+class ParquetSink:
+    def __init__(self, directory: str, channel_name: str):
+        self.writer = PartitionedParquetWriter(os.path.join(directory, "parquet"), channel_name)
+
+    def write(self, df: pd.DataFrame):
+        self.writer.write(preprocess_df(df))
+
+    def close(self):
+        paths = self.writer.close()
+        if paths:
+            logger.info(f"💾 Parquet 저장 완료: {self.writer.channel_dir} ({self.writer.rows_written} rows)")
+
+
+# ---------- ⬇️ 설정된 내보내기 형식에 맞는 싱크 목록 ----------
+def build_export_sinks(save_path: str, channel_name: str, formats: list[str] = None) -> list:
+    formats = formats or getattr(settings, "CRAWLER_EXPORT_FORMATS", ["csv"])
+    sinks = []
+    if "csv" in formats:
+        sinks.append(CSVSink(save_path, channel_name))
+    if "parquet" in formats:
+        sinks.append(ParquetSink(save_path, channel_name))
+    return sinks
 
-    except Exception as e:
-        logger.error(f"❌ CSV 저장 실패: {e}", exc_info=True)
-        return None
 
 # ---------- driver 한 번으로 정의 ----------
-@contextmanager
-def create_driver():
-    options = webdriver.ChromeOptions()
-    options.add_argument("--no-sandbox")           # 샌드박스 비활성화 (보안 기능 해제)
-    options.add_argument("--disable-dev-shm-usage")# 공유 메모리 사용 비활성화
-    options.add_argument("--disable-gpu")          # GPU 하드웨어 가속 비활성화
-    options.add_argument("--disable-extensions")   # 크롬 확장 프로그램 비활성화
-    options.add_argument("--disable-infobars")     # 정보 표시줄 비활성화
-    options.add_argument("--start-maximized")      # 브라우저 최대화
-    options.add_argument("--disable-notifications")# 알림 비활성화
-    options.add_argument('--ignore-certificate-errors')  # 인증서 오류 무시
-    options.add_argument('--ignore-ssl-errors')    # SSL 오류 무시
-    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36')
-    
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    logger.info("🟢 ChromeDriver 실행")
-    try:
-        yield driver
-    except Exception as e:
-        logger.error(f"❌ WebDriver 예외 발생: {e}", exc_info=True)
-        raise
-    finally:
-        driver.quit()
-        logger.info("🛑 ChromeDriver 종료")
+# 기존 이름 유지: 이제 매번 크롬을 새로 띄우지 않고 워커 프로세스의 세션 풀에서 빌려온다
+create_driver = browser_session
 
 
 # ---------- ⬇️ 유튜브 채널의 영상 전부 가지고 오는 함수 ----------
-def get_all_video_ids(driver, channel_url):
+def get_all_video_ids(driver, channel_url, known_ids=None, stop_after_known: int = None, limit: int = None, since: date = None):
+    """
+    채널 영상 URL을 화면 순서(최신순)대로 수집한다.
+    CRAWLER_DISCOVERY 가 'http'면 browse continuation 토큰을 따라가고 (브라우저 없음),
+    실패하거나 'dom'이면 /videos 탭을 스크롤하면서 새로 붙은 링크만 읽는다.
+    - limit: 최신 영상 N개까지만 / since: 이 날짜 이후 업로드된 영상만
+    - known_ids: 이미 DB에 있는 영상이 stop_after_known개 연속으로 나오면 그 뒤는 예전 영상이라고 보고 중단
+    """
+    return discover_videos(lambda: driver, channel_url, known_ids, stop_after_known, limit, since).video_urls
+
+
+def discover_videos(get_driver, channel_url, known_ids=None, stop_after_known: int = None, limit: int = None, since: date = None) -> DiscoveryCollector:
+    """
+    get_all_video_ids 와 같지만 수집 결과(DiscoveryCollector)를 그대로 돌려준다.
+    get_driver 는 DOM 방식으로 대체할 때만 불러서 HTTP로 끝나면 브라우저를 띄우지 않는다.
+    """
     logger.info(f"🔍 채널 영상 ID 수집 시작: {channel_url}")
+    if known_ids and stop_after_known is None:
+        stop_after_known = getattr(settings, "CRAWLER_INCREMENTAL_STOP_AFTER_KNOWN", 30)
+    if limit is None:
+        limit = getattr(settings, "CRAWLER_DISCOVERY_LIMIT", None)
+    if since is None and (since_days := getattr(settings, "CRAWLER_DISCOVERY_SINCE_DAYS", None)) is not None:
+        since = date.today() - timedelta(days=since_days)
 
-    def clean_youtube_url(url: str) -> str:
-        try:
-            if url.count('watch?v=') > 1:
-                video_id = url.split('watch?v=')[-1]
-                return f'https://www.youtube.com/watch?v={video_id}'
-            return url
-        except Exception as e:
-            logger.error(f"❌ URL 정리 중 에러 발생: {e}")
-            return url
+    def new_collector():
+        return DiscoveryCollector(limit=limit, since=since, known_ids=known_ids, stop_after_known=stop_after_known)
 
     try:
-        videos_url = channel_url.rstrip('/') + "/videos"
-        driver.get(videos_url)
-        time.sleep(3)  # 페이지 로딩을 위한 대기 시간 증가
+        video_urls = None
+        if getattr(settings, "CRAWLER_DISCOVERY", "http") == "http":
+            collector = new_collector()
+            video_urls = discover_video_urls_http(channel_url, collector)
+            if video_urls is None:
+                logger.info("채널 JSON을 읽지 못해 스크롤 방식으로 대체")
+        if video_urls is None:
+            collector = new_collector()
+            video_urls = discover_video_urls_dom(get_driver(), channel_url, collector)
+        if collector.stop_reason:
+            logger.info(f"⏹️ 영상 ID 수집 중단: {collector.stop_reason}")
 
-        video_urls = set()
-        last_height = driver.execute_script("return document.documentElement.scrollHeight")
-        
-        SCROLL_PAUSE_TIME = 3
-        MAX_RETRIES = 5
-        retries = 0
-
-        while True:
-            # 스크롤 다운
-            driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
-            time.sleep(SCROLL_PAUSE_TIME)
-            
-            # 영상 링크 수집
-            elements = driver.find_elements(By.CSS_SELECTOR, 'a#video-title-link')
-            for elem in elements:
-                href = elem.get_attribute("href")
-                if href and "watch?v=" in href:
-                    # URL 정리 함수 적용
-                    cleaned_url = clean_youtube_url(href)
-                    video_urls.add(cleaned_url)
-            new_height = driver.execute_script("return document.documentElement.scrollHeight")
-            if new_height == last_height:
-                retries += 1
-                if retries >= MAX_RETRIES:
-                    break
-            else:
-                retries = 0
-            last_height = new_height
         video_count = len(video_urls)
         if video_count > 0:
             logger.info(f"✅ 총 {video_count}개의 영상 URL 수집 완료")
         else:
             logger.warning("⚠️ 수집된 영상이 없습니다")
-        return list(video_urls)
+        return collector
     except Exception as e:
         logger.error(f"❌ 영상 ID 수집 중 에러 발생: {e}")
-        return []
+        return new_collector()
+
+
+# ---------- ⬇️ 영상 URL에서 video_id만 추출 ----------
+def video_id_from_url(url: str) -> str:
+    return url.split("watch?v=")[-1].split("&")[0]
+
+
+# ---------- ⬇️ 증분 수집용: 채널에서 찾은 영상만 DB에 있는지 확인 ----------
+class KnownVideoIds:
+    """
+    YouTubeVideo 전체를 읽지 않고, 수집 중인 페이지의 video_id 만 video_id__in 으로 조회해서 기억한다.
+    DiscoveryCollector.add_page 가 페이지마다 prefetch 를 부르므로 쿼리는 페이지당 한 번이다.
+    """
+
+    def __init__(self):
+        self.checked = {}  # video_id -> DB에 있는지
+
+    def prefetch(self, video_ids):
+        candidate_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id and video_id not in self.checked]
+        if not candidate_ids:
+            return
+        found = set(YouTubeVideo.objects.filter(video_id__in=candidate_ids).values_list("video_id", flat=True))
+        self.checked.update((video_id, video_id in found) for video_id in candidate_ids)
+
+    def __contains__(self, video_id) -> bool:
+        if video_id not in self.checked:
+            self.prefetch([video_id])
+        return self.checked.get(video_id, False)
+
+    def __bool__(self) -> bool:
+        return True
+
+
+# ---------- ⬇️ 증분 크롤링 계획: 새 영상 / 가볍게 갱신할 영상 / 건너뛸 영상 분류 ----------
+def plan_incremental_crawl(video_urls: list[str], refresh_after_days: int = None) -> tuple[list[str], list[str]]:
+    """
+    DB에 없는 영상은 전체 크롤링 대상(URL 목록),
+    DB에 있지만 마지막 수집일이 refresh_after_days일보다 오래된 영상은 갱신 대상(video_id 목록)으로 나눈다.
+    refresh_after_days가 None이면 이미 저장된 영상은 갱신하지 않고 건너뛴다.
+    """
+    if refresh_after_days is None:
+        refresh_after_days = getattr(settings, "CRAWLER_REFRESH_AFTER_DAYS", 7)
+    urls_by_id = {video_id_from_url(url): url for url in video_urls}
+    known = dict(
+        YouTubeVideo.objects.filter(video_id__in=list(urls_by_id)).values_list("video_id", "extracted_date")
+    )
+
+    new_urls, refresh_ids, skipped = [], [], 0
+    cutoff = date.today() - timedelta(days=refresh_after_days) if refresh_after_days is not None else None
+    for video_id, url in urls_by_id.items():
+        if video_id not in known:
+            new_urls.append(url)
+        elif cutoff is not None and known[video_id] <= cutoff:
+            refresh_ids.append(video_id)
+        else:
+            skipped += 1
+    logger.info(f"📋 증분 크롤링 계획: 새 영상 {len(new_urls)}개, 갱신 {len(refresh_ids)}개, 건너뜀 {skipped}개")
+    return new_urls, refresh_ids
+
+
+# ---------- ⬇️ 이미 저장된 영상은 HTTP로 조회수/구독자 수만 가볍게 갱신 ----------
+def refresh_known_videos(video_ids: list[str], workers: int = None) -> int:
+    if not video_ids:
+        return 0
+    workers = workers or getattr(settings, "CRAWLER_HTTP_POOL_SIZE", 10)
+
+    def _fetch(video_id):
+        html = fetch_watch_html(f"https://www.youtube.com/watch?v={video_id}")
+        return video_id, parse_watch_html(html) if html else None
+
+    today = date.today()
+    refreshed, refreshed_ids = 0, []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for video_id, info in executor.map(metrics.bind(_fetch), video_ids):
+            if info is None:
+                logger.warning(f"⚠️ 영상 정보 갱신 실패: {video_id}")
+                continue
+            updated = YouTubeVideo.objects.filter(video_id=video_id).update(
+                view_count=parse_view_count(info["view_count"]),
+                subscriber_count=parse_subscriber_count(info["subscribers"]),
+                extracted_date=today,
+            )
+            refreshed += updated
+            if updated:
+                refreshed_ids.append(video_id)
+    if refreshed_ids and history_enabled():
+        rollup_channel_daily(snapshot_saved_videos(refreshed_ids))
+    logger.info(f"🔄 기존 영상 {refreshed}개 조회수/구독자 수 갱신 완료")
+    return refreshed
 
 
 # ---------- ⬇️ 조회수 텍스트에서 숫자만 추출 (예: 조회수 1,234회 -> 1234) ----------
 def parse_view_count(text: str) -> int:
     try:
-        if not text:
-            return 0
-        cleaned = text.replace("조회수", "").replace("회", "").replace(",", "").strip()
-        if "천" in cleaned:
-            number = float(cleaned.replace("천", ""))
-            return int(number * 1000)
-        elif "만" in cleaned:
-            number = float(cleaned.replace("만", ""))
-            return int(number * 10000)
-        return int(cleaned)
-    except ValueError:
+        return parse_count(text, field="view_count")
+    except KoreanParseError as e:
+        report_failure(e)
         return 0
 
 
 # ---------- ⬇️ 구독자 수 텍스트를 숫자 형태로 변환 (예: 1.2만명 -> 12000) ----------
 def parse_subscriber_count(text: str) -> int:
     try:
-        if not text:
-            return 0
-        text = text.replace("구독자", "").replace("명", "").replace(",", "").strip()
-        if "천" in text:
-            number = float(text.replace("천", ""))
-            return int(number * 1000)
-        elif "만" in text:
-            number = float(text.replace("만", ""))
-            return int(number * 10000)
-        elif "억" in text:
-            number = float(text.replace("억", ""))
-            return int(number * 100000000)
-        return int(text) if text.strip().isdigit() else 0
-    except Exception:
+        return parse_count(text, field="subscribers")
+    except KoreanParseError as e:
+        report_failure(e)
         return 0
-    
-    
-# ---------- ⬇️ 가격 텍스트를 정수로 변환하는 함수 추가 ----------
+
+
+# ---------- ⬇️ 가격 텍스트를 정수로 변환 (예: ₩12,000 -> 12000) ----------
 def parse_price(price_text: str) -> int:
     try:
-        if not price_text or pd.isna(price_text):
-            return 0
-        cleaned_price = re.sub(r'[₩,\s]', '', price_text)
-        if re.search(r'\d', cleaned_price):
-            return int(re.sub(r'[^\d]', '', cleaned_price))
-        return 0
-    except Exception:
+        return parse_krw(price_text, field="product_price")
+    except KoreanParseError as e:
+        report_failure(e)
         return 0
 
 
-# ---------- ⬇️ 날짜를 YYYY-MM-DD 형식으로 변환 ----------
+# ---------- ⬇️ 날짜를 YYYY-MM-DD 형식으로 변환 (형식이 아니면 원래 문자열) ----------
 def format_date(date_str: str) -> datetime:
     try:
-        if match := re.search(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?', date_str):
-            year, month, day = match.groups()
-            return datetime(int(year), int(month), int(day))
-        elif match := re.search(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', date_str):
-            year, month, day = match.groups()
-            return datetime(int(year), int(month), int(day))
-        elif match := re.search(r'(\d{4})(\d{2})(\d{2})', date_str):
-            year, month, day = match.groups()
-            return datetime(int(year), int(month), int(day))
-        else:
-            return date_str
-    except Exception:
+        return parse_korean_date(date_str, field="date")
+    except KoreanParseError as e:
+        report_failure(e)
         return date_str
 
 
@@ -327,164 +554,127 @@ def clean_description(text: str) -> str:
     return text.strip()
 
     
-# ---------- 제품 정보 추출 ----------
-def extract_products_from_dom(driver, soup: BeautifulSoup) -> list[dict]:
-    products = []
-    retry_count = 3
+# ---------- ⬇️ 셀렉터 목록 중 처음으로 텍스트가 있는 요소의 텍스트 ----------
+def select_first_text(doc, selectors: list[str], strip_each: bool = False) -> str | None:
+    for selector in selectors:
+        elem = doc.select_one(selector)
+        if elem:
+            text = elem.text(strip=strip_each)
+            if text:
+                return text
+        metrics.incr("selector_miss_total", selector=selector)
+    return None
+
+
+# ---------- ⬇️ merch shelf 전체를 한 번에 읽어오는 스크립트 ----------
+# 아이템마다 find_elements/execute_script를 반복하지 않도록 제목, 가격, 판매처, 링크,
+# shadow DOM 안의 이미지 src까지 브라우저 안에서 모아서 JSON 배열 하나로 돌려준다.
+MERCH_ITEMS_SCRIPT = """
+var selectors = arguments[0];
+var items = [];
+for (var i = 0; i < selectors.length && !items.length; i++) {
+    items = Array.prototype.slice.call(document.querySelectorAll(selectors[i]));
+}
+function text(item, sels) {
+    for (var i = 0; i < sels.length; i++) {
+        var el = item.querySelector(sels[i]);
+        var value = el ? el.textContent.trim() : "";
+        if (value) return value;
+    }
+    return "";
+}
+return items.map(function (item) {
+    var link = item.querySelector("a.yt-simple-endpoint") || item.querySelector("a[href]");
+    var host = item.querySelector("yt-img-shadow");
+    var img = host && host.shadowRoot ? host.shadowRoot.querySelector("img#img") : null;
+    img = img || item.querySelector("img");
+    return {
+        title: text(item, [".product-item-title", ".title"]),
+        price: text(item, [".product-item-price", ".price"]),
+        merchant: text(item, [".product-item-merchant-text", ".merchant"]),
+        url: link ? (link.getAttribute("href") || link.textContent.trim()) : "",
+        imageUrl: img ? (img.getAttribute("src") || "") : ""
+    };
+});
+"""
+MERCH_ITEM_SELECTORS = [
+    "#items > ytd-merch-shelf-item-renderer",
+    "ytd-merch-shelf-renderer ytd-merch-shelf-item-renderer"
+]
+
+
+# ---------- ⬇️ 스크립트/HTML 파싱 결과를 제품 dict로 정리 ----------
+def build_product_info(raw: dict) -> dict | None:
+    """제품명과 가격이 모두 있을 때만 extract_products_from_dom 형식의 dict를 반환"""
+    title = (raw.get("title") or "").strip()
+    price = (raw.get("price") or "").strip()
+    if not title or not price:
+        logger.warning(f"⚠️ 제품명/가격이 없어 건너뜁니다: {title or '(제목 없음)'}")
+        return None
+    product_info = {"title": title, "price": price, "imageUrl": raw.get("imageUrl") or ""}
+    if raw.get("url"):
+        product_info["url"] = raw["url"]
+    merchant = (raw.get("merchant") or "").replace("!", "").strip()
+    if merchant:
+        product_info["merchant"] = merchant
+    if not product_info["imageUrl"]:
+        metrics.incr("shadow_image_miss_total")
+    return product_info
+
+
+# ---------- ⬇️ 스크립트 한 번으로 merch shelf 아이템 전체 추출 ----------
+def extract_products_from_script(driver) -> list[dict] | None:
+    """스크립트 호출이 실패하면 None (HTML 파싱 경로로 넘어가도록)"""
     try:
-        # 더보기 버튼 클릭 시도 (최대 3회 재시도)
-        for retry in range(retry_count):
-            try:
-                more_button = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "#expand"))
-                )
-                driver.execute_script("arguments[0].click();", more_button)
-                logger.info("✅ 더보기 버튼 클릭 성공")
-                time.sleep(2)
-                break
-            except Exception as e:
-                logger.info(f"더보기 버튼 클릭 실패 (재시도 {retry+1}/3): {e}")
-                time.sleep(1)
-        # 제품 아이템 찾기 - 셀렉터 2개만 사용, 각 셀렉터별 3회 재시도
-        product_selectors = [
-            "#items > ytd-merch-shelf-item-renderer",
-            "ytd-merch-shelf-renderer ytd-merch-shelf-item-renderer"
-        ]
-        product_items = []
-        for selector in product_selectors:
-            for retry in range(retry_count):
-                product_items = soup.select(selector)
-                if product_items:
-                    logger.info(f"✅ 제품 아이템 찾음: {selector}")
-                    break
-                else:
-                    logger.info(f"제품 아이템 못 찾음 (셀렉터: {selector}, 재시도 {retry+1}/3)")
-                    time.sleep(1)
-            if product_items:
-                break
-        total_items = len(product_items)
-        logger.info(f"총 {total_items}개의 제품 아이템을 찾았습니다.")
-        
-        # ---------- 제품 정보 추출 ----------
-        for item in product_items:
-            try:
-                product_info = {}
-                # 제품명 추출 - 셀렉터 2개, 각 3회 재시도
-                title_selectors = [
-                    ".product-item-title",
-                    ".title"
-                ]
-                title_text = None
-                for selector in title_selectors:
-                    for retry in range(retry_count):
-                        title_elem = item.select_one(selector)
-                        if title_elem and (title_text := title_elem.get_text(strip=True)):
-                            product_info["title"] = title_text
-                            logger.info(f"✅ 제품명 추출 성공: {title_text}")
-                            break
-                        else:
-                            time.sleep(0.5)
-                    if title_text:
-                        break
-                if not title_text:
-                    logger.warning("⚠️ 제품명을 찾을 수 없어 다음 아이템으로 넘어갑니다")
-                    continue
-
-                # ---------- 제품 링크 추출 ----------
-                link_selectors = [
-                    "a.yt-simple-endpoint",
-                    "a[href]"
-                ]
-                product_url = None
-                for selector in link_selectors:
-                    for retry in range(retry_count):
-                        link_elem = item.select_one(selector)
-                        if link_elem:
-                            if 'href' in link_elem.attrs:
-                                product_url = link_elem['href']
-                            else:
-                                product_url = link_elem.get_text(strip=True)
-                            if product_url:
-                                product_info["url"] = product_url
-                                logger.info(f"✅ 제품 링크 추출 성공: {product_url}")
-                                break
-                        else:
-                            time.sleep(0.5)
-                    if product_url:
-                        break
-
-                # ---------- 가격 추출 ----------
-                price_selectors = [
-                    ".product-item-price",
-                    ".price"
-                ]
-                price_text = None
-                for selector in price_selectors:
-                    for retry in range(retry_count):
-                        price_elem = item.select_one(selector)
-                        if price_elem and (price_text := price_elem.get_text(strip=True)):
-                            product_info["price"] = price_text
-                            logger.info(f"✅ 제품 가격 추출 성공: {price_text}")
-                            break
-                        else:
-                            time.sleep(0.5)
-                    if price_text:
-                        break
-                if not price_text:
-                    logger.warning("⚠️ 가격 정보를 찾을 수 없어 다음 아이템으로 넘어갑니다")
-                    continue
-
-                # ---------- 이미지 URL 추출 ----------
-                img_url = ""
-                try:
-                    selenium_items = driver.find_elements(By.CSS_SELECTOR, "ytd-merch-shelf-item-renderer")
-                    idx = product_items.index(item)
-                    selenium_item = selenium_items[idx]
-                    # shadow DOM 접근
-                    shadow_host = selenium_item.find_element(By.CSS_SELECTOR, "yt-img-shadow")
-                    img = driver.execute_script("return arguments[0].shadowRoot.querySelector('img#img')", shadow_host)
-                    if img:
-                        img_url = img.get_attribute("src")
-                except Exception as e:
-                    logger.warning(f"⚠️ shadow DOM 이미지 추출 실패: {e}")
-
-                if img_url:
-                    product_info["imageUrl"] = img_url
-                    logger.info(f"✅ 쇼핑 이미지 URL 추출 성공: {img_url}")
-                else:
-                    logger.warning("⚠️ 이미지를 찾을 수 없습니다")
-                    product_info["imageUrl"] = ""
-
-                # ---------- 판매처 추출 ----------
-                merchant_selectors = [
-                    ".product-item-merchant-text",
-                    ".merchant"
-                ]
-                merchant_text = None
-                for selector in merchant_selectors:
-                    for retry in range(retry_count):
-                        merchant_elem = item.select_one(selector)
-                        if merchant_elem and (merchant_text := merchant_elem.get_text(strip=True)):
-                            merchant_name = merchant_text.replace("!", "").strip()
-                            product_info["merchant"] = merchant_name
-                            logger.info(f"✅ 판매처 추출 성공: {merchant_name}")
-                            break
-                        else:
-                            time.sleep(0.5)
-                    if merchant_text:
-                        break
-                # 제품명과 가격이 있는 경우만 저장
-                if "title" in product_info and "price" in product_info:
-                    products.append(product_info)
-                    logger.info(f"✅ 제품 정보 추출 완료: {product_info['title']} ({product_info['price']})")
+        with metrics.span("merch_script"):
+            raw_items = driver.execute_script(MERCH_ITEMS_SCRIPT, MERCH_ITEM_SELECTORS)
+    except WebDriverException as e:
+        metrics.incr("merch_script_error_total")
+        logger.warning(f"⚠️ 제품 추출 스크립트 실패, HTML 파싱으로 대체합니다: {e}")
+        return None
+    if not isinstance(raw_items, list):
+        return None
+    return [info for info in map(build_product_info, raw_items) if info]
 
-            except Exception as e:
-                logger.error(f"❌ 제품 정보 추출 중 에러 발생: {str(e)}")
-                continue
 
+# ---------- ⬇️ (대체 경로) 파싱된 HTML에서 제품 정보 추출 ----------
+def extract_products_from_html(doc) -> list[dict]:
+    """shadow DOM은 page_source에 없어서 이미지 URL은 비어 있을 수 있다"""
+    product_items = []
+    for selector in MERCH_ITEM_SELECTORS:
+        product_items = doc.select(selector)
+        if product_items:
+            break
+    products = []
+    for item in product_items:
+        link_elem = item.select_one("a.yt-simple-endpoint") or item.select_one("a[href]")
+        img_elem = item.select_one("img[src]")
+        raw = {
+            "title": select_first_text(item, [".product-item-title", ".title"], strip_each=True),
+            "price": select_first_text(item, [".product-item-price", ".price"], strip_each=True),
+            "merchant": select_first_text(item, [".product-item-merchant-text", ".merchant"], strip_each=True),
+            "url": (link_elem.attr("href") or link_elem.text(strip=True)) if link_elem else "",
+            "imageUrl": (img_elem.attr("src") or "") if img_elem else "",
+        }
+        if info := build_product_info(raw):
+            products.append(info)
+    return products
+
+
+# ---------- 제품 정보 추출 ----------
+def extract_products_from_dom(driver, doc) -> list[dict]:
+    """
+    브라우저에서 스크립트 한 번으로 추출하고, 스크립트가 실패하거나 아무것도 못 찾았는데
+    파싱된 HTML(longform_parser)에는 제품 아이템이 있으면 그 결과를 사용한다.
+    """
+    try:
+        products = extract_products_from_script(driver)
+        if not products and doc is not None and doc.select_one(", ".join(MERCH_ITEM_SELECTORS)):
+            metrics.incr("merch_html_fallback_total")
+            products = extract_products_from_html(doc)
+        products = products or []
         logger.info(f"총 {len(products)}개의 제품 정보 추출 완료")
         return products
-
     except Exception as e:
         logger.error(f"❌ 전체 제품 추출 중 에러 발생: {e}")
         return []
@@ -493,183 +683,113 @@ def extract_products_from_dom(driver, soup: BeautifulSoup) -> list[dict]:
 def base_youtube_info(driver, video_url: str) -> pd.DataFrame:
     logger.info("Crawling video: %s", video_url)
     today_str = datetime.today().strftime('%Y%m%d')
-    retry_count = 3
+    budget = StepBudget()
     try:
-        driver.get(video_url)
-        time.sleep(5)
-        for _ in range(5):
-            driver.execute_script("window.scrollTo(0, window.scrollY + 500);")
-            time.sleep(3)
-        wait = WebDriverWait(driver, 20)
+        # ---------- 페이지 준비 대기 (고정 sleep 대신 조건이 만족되는 즉시 진행) ----------
+        with metrics.span("driver_get"):
+            throttled_get(driver, video_url, expect_initial_data=True)
+        with metrics.span("wait_page_load"):
+            wait_for_document_ready(driver, budget.timeout("page_load"))
+        with metrics.span("wait_metadata"):
+            metadata_elem = wait_for_any(driver, ["ytd-watch-metadata #title yt-formatted-string", "#title yt-formatted-string"], budget.timeout("metadata"))
+        if metadata_elem is None:
+            metrics.incr("wait_timeout_total", step="metadata")
+            logger.warning(f"⚠️ 영상 메타데이터 렌더링 대기 시간 초과: {video_url}")
+
+        # 설명란/제품 섹션은 스크롤해야 렌더링됨
+        with metrics.span("scroll"):
+            scroll_until_present(driver, ["ytd-merch-shelf-renderer", "ytd-comments#comments"], budget.timeout("scroll"))
 
         # ---------- 더보기 버튼 클릭 ----------
         expand_button_selectors = [
             "tp-yt-paper-button#expand", "#expand"
         ]
-        expand_clicked = False
-        for selector in expand_button_selectors:
-            for retry in range(retry_count):
-                try:
-                    more_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                    driver.execute_script("arguments[0].click();", more_button)
-                    logger.info(f"더보기 버튼 클릭 성공: {selector}")
-                    time.sleep(3)
-                    expand_clicked = True
-                    break
-                except Exception as e:
-                    logger.info(f"더보기 버튼 클릭 실패 (셀렉터: {selector}, 재시도 {retry+1}/3): {e}")
-                    time.sleep(1)
-            if expand_clicked:
-                break
+        with metrics.span("expand_click"):
+            if click_first_clickable(driver, expand_button_selectors, budget.timeout("expand")):
+                logger.info("더보기 버튼 클릭 성공")
+                wait_for_network_idle(driver, budget.timeout("expand"), idle_time=0.3)
+            else:
+                metrics.incr("selector_miss_total", selector="#expand")
+                logger.info("더보기 버튼을 찾지 못했습니다")
 
-        # 제품 섹션 (셀렉터 2개, 각 3회 재시도)
+        # 제품 섹션 (없는 영상이 많아서 짧게만 대기)
         product_selectors = [
             "ytd-merch-shelf-renderer",
             ".product-item"
         ]
-        product_section_found = False
-        for selector in product_selectors:
-            for retry in range(retry_count):
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    logger.info(f"제품 섹션 찾음: {selector}")
-                    product_section_found = True
-                    break
-                except Exception as e:
-                    logger.info(f"제품 섹션 못 찾음 (셀렉터: {selector}, 재시도 {retry+1}/3): {e}")
-                    time.sleep(1)
-            if product_section_found:
-                break
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        with metrics.span("wait_merch_shelf"):
+            merch_shelf = wait_for_any(driver, product_selectors, budget.timeout("merch_shelf"))
+        if merch_shelf is not None:
+            logger.info("제품 섹션 찾음")
+        else:
+            logger.info("제품 섹션 없음")
+        with metrics.span("parse_page_source"):
+            doc = parse_watch_page(driver)
 
         # 메타데이터 추출
         video_id = video_url.split("v=")[-1]
 
         # ---------- 제목 추출 ----------
-        title_selectors = [
+        title = select_first_text(doc, [
             "#title yt-formatted-string",
             "yt-formatted-string[class*='ytd-watch-metadata']"
-        ]
-        title = None
-        for selector in title_selectors:
-            for retry in range(retry_count):
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if title:
-                        break
-                time.sleep(0.5)
-            if title:
-                break
+        ], strip_each=True)
         title = title or "제목 없음"
         logger.info(f"제목: {title}")
 
         # ---------- 채널명 추출 ----------
-        channel_selectors = [
+        channel_name = select_first_text(doc, [
             "ytd-channel-name a",
             "#channel-name a"
-        ]
-        channel_name = None
-        for selector in channel_selectors:
-            for retry in range(retry_count):
-                channel_tag = soup.select_one(selector)
-                if channel_tag:
-                    channel_name = channel_tag.text.strip()
-                    break
-                time.sleep(0.5)
-            if channel_name:
-                break
+        ])
         channel_name = channel_name or "채널 없음"
 
         # ---------- 구독자 수 추출 ----------
-        sub_selectors = [
+        subscriber_count = select_first_text(doc, [
             "yt-formatted-string#owner-sub-count",
             "#subscriber-count"
-        ]
-        subscriber_count = None
-        for selector in sub_selectors:
-            for retry in range(retry_count):
-                sub_tag = soup.select_one(selector)
-                if sub_tag:
-                    subscriber_count = sub_tag.text.strip()
-                    break
-                time.sleep(0.5)
-            if subscriber_count:
-                break
+        ])
         subscriber_count = subscriber_count or "구독자 수 없음"
 
         # ---------- 조회수 추출 ----------
-        view_selectors = [
+        view_count = select_first_text(doc, [
             "span.view-count",
             "#view-count"
-        ]
-        view_count = None
-        for selector in view_selectors:
-            for retry in range(retry_count):
-                view_tag = soup.select_one(selector)
-                if view_tag:
-                    view_count = view_tag.text.strip()
-                    break
-                time.sleep(0.5)
-            if view_count:
-                break
+        ])
         view_count = view_count or "조회수 없음"
 
         # ---------- 업로드일 추출 ----------
-        date_selectors = [
+        upload_date = select_first_text(doc, [
             "#info-strings yt-formatted-string",
             "#upload-info .date"
-        ]
-        upload_date = None
-        for selector in date_selectors:
-            for retry in range(retry_count):
-                date_tag = soup.select_one(selector)
-                if date_tag:
-                    upload_date = date_tag.text.strip()
-                    break
-                time.sleep(0.5)
-            if upload_date:
-                break
+        ])
         upload_date = upload_date or "날짜 없음"
 
         # ---------- 설명란 추출 ----------
-        desc_selectors = [
+        description = select_first_text(doc, [
             "ytd-expander#description yt-formatted-string",
             "#description"
-        ]
-        description = None
-        for selector in desc_selectors:
-            for retry in range(retry_count):
-                desc_tag = soup.select_one(selector)
-                if desc_tag:
-                    description = desc_tag.text.strip()
-                    if description:
-                        break
-                time.sleep(0.5)
-            if description:
-                break
+        ])
         description = description or "설명 없음"
         logger.info(f"설명 길이: {len(description)} 글자")
-        # 제품 개수 (3회 재시도)
+        # 제품 개수
         product_count = 0
-        for retry in range(retry_count):
-            try:
-                product_count_elem = soup.select_one("yt-formatted-string#info")
-                if product_count_elem:
-                    text_content = product_count_elem.get_text()
-                    if match := re.search(r'(\d+)개\s*제품', text_content):
-                        product_count = int(match.group(1))
-                        logger.info(f"✅ HTML에서 제품 개수 추출 성공: {product_count}개")
-                        break
-                    else:
-                        logger.warning("⚠️ HTML에서 제품 개수를 찾을 수 없음")
+        try:
+            product_count_elem = doc.select_one("yt-formatted-string#info")
+            if product_count_elem:
+                text_content = product_count_elem.text()
+                if match := re.search(r'(\d+)개\s*제품', text_content):
+                    product_count = int(match.group(1))
+                    logger.info(f"✅ HTML에서 제품 개수 추출 성공: {product_count}개")
                 else:
-                    logger.warning("⚠️ 제품 개수 요소를 찾을 수 없음")
-            except Exception as e:
-                logger.error(f"❌ HTML에서 제품 개수 추출 실패: {e}")
-            time.sleep(0.5)
+                    logger.warning("⚠️ HTML에서 제품 개수를 찾을 수 없음")
+            else:
+                logger.warning("⚠️ 제품 개수 요소를 찾을 수 없음")
+        except Exception as e:
+            logger.error(f"❌ HTML에서 제품 개수 추출 실패: {e}")
         # 제품 정보 추출
-        products = extract_products_from_dom(driver, soup)
+        with metrics.span("extract_products"):
+            products = extract_products_from_dom(driver, doc)
         if products is None:
             products = []
             
@@ -679,49 +799,17 @@ def base_youtube_info(driver, video_url: str) -> pd.DataFrame:
         
         logger.info(f"✅ 최종 제품 개수: {product_count}개")
 
-        # 기본 데이터 세트
-        base_data = []
-        
-        # 250523 제품이 있는 경우, 각 제품별로 row 생성
-        if products:
-            for product in products:
-                row_data = {
-                    "youtube_id": video_id,
-                    "title": title,
-                    "channel_name": channel_name,
-                    "subscribers": subscriber_count,
-                    "view_count": view_count,
-                    "upload_date": upload_date,
-                    "extracted_date": today_str,
-                    "video_url": video_url,
-                    "description": description,
-                    "product_count": product_count,  # HTML에서 추출한 제품 개수 사용
-                    "product_name": product.get("title", ""),
-                    "product_price": product.get("price", ""),
-                    "product_image_url": product.get("imageUrl", ""),
-                    "product_merchant_url": product.get("url", ""),
-                    "product_merchant": product.get("merchant", "")
-                }
-                base_data.append(row_data)
-        else:
-            # 제품이 없는 경우 기본 정보만 저장
-            base_data.append({
-                "youtube_id": video_id,
-                "title": title,
-                "channel_name": channel_name,
-                "subscribers": subscriber_count,
-                "view_count": view_count,
-                "upload_date": upload_date,
-                "extracted_date": today_str,
-                "video_url": video_url,
-                "description": description,
-                "product_count": product_count,
-                "product_name": "",
-                "product_price": "",
-                "product_image_url": "",
-                "product_merchant_url": "",
-                "product_merchant": ""
-            })
+        # 제품이 있는 경우 각 제품별로 row 생성, 없으면 기본 정보만 저장
+        info = {
+            "title": title,
+            "channel_name": channel_name,
+            "subscribers": subscriber_count,
+            "view_count": view_count,
+            "upload_date": upload_date,
+            "description": description,
+            "product_count": product_count,  # HTML에서 추출한 제품 개수 사용
+        }
+        base_data = build_video_rows(video_id, video_url, info, products, today_str)
         logger.info(f"📦 수집된 데이터 행 개수: {len(base_data)}")
         return pd.DataFrame(base_data)
     except Exception as e:
@@ -741,7 +829,6 @@ def collect_video_data(driver, video_id: str, index: int = None, total: int = No
             return url
     base_url = clean_youtube_url(f"https://www.youtube.com/watch?v={video_id}")
     try:
-        driver.get(base_url)
         if index is not None and total is not None:
             logger.info(f"\n📹 ({index}/{total}) 크롤링 중: {video_id}")
 
@@ -756,6 +843,21 @@ def collect_video_data(driver, video_id: str, index: int = None, total: int = No
         logger.error(f"❌ 예외 발생 - collect_video_data(): {video_id} | 에러: {e}")
         return None
 
+# ---------- ⬇️ HTTP(JSON) 백엔드로 데이터 수집, 필요할 때만 Selenium 사용 ----------
+def collect_video_data_http(video_id: str, get_driver=None) -> pd.DataFrame:
+    base_url = f"https://www.youtube.com/watch?v={video_id.split('watch?v=')[-1]}"
+    fallback = (lambda url: base_youtube_info(get_driver(), url)) if get_driver else None
+    try:
+        df = http_youtube_info(base_url, fallback=fallback)
+        if df.empty:
+            logger.warning(f"⚠️ 데이터프레임이 비어 있음: {video_id}")
+        return df
+    except WebDriverException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 예외 발생 - collect_video_data_http(): {video_id} | 에러: {e}")
+        return None
+
 # ---------- ⬇️ 크롤링된 유튜브 영상을 조회하고 수정하는 코드 ----------
 def update_youtube_data_to_db(dataframe: pd.DataFrame) -> int:
     if dataframe.empty:
@@ -803,8 +905,9 @@ def update_youtube_data_to_db(dataframe: pd.DataFrame) -> int:
 
 # ---------- ⬇️ 채널 이름을 YouTube 채널 페이지에서 가져옴 ----------
 def get_channel_name(driver, channel_url):
-    driver.get(channel_url)
-    driver.implicitly_wait(5)
+    throttled_get(driver, channel_url, expect_initial_data=True)
+    # implicitly_wait는 드라이버 전체의 find_elements를 느리게 만들어서 문서 로딩 완료만 기다림
+    wait_for_document_ready(driver, StepBudget().timeout("page_load"))
     try:
         title_element = driver.find_element("xpath", '//meta[@property="og:title"]')
         channel_name = title_element.get_attribute("content")
@@ -830,42 +933,295 @@ def validate_url(url: str) -> str:
         return ""
 
 
-# ---------- ⬇️ 유튜브 채널의 전체 크롤링을 실행하는 함수 ----------
-def crawl_channel_videos(channel_url: str, save_path: str):
-    with create_driver() as driver:
-        video_ids = get_all_video_ids(driver, channel_url)
+# ---------- ⬇️ 드라이버가 살아있는지 확인하는 함수 ----------
+def is_driver_alive(driver) -> bool:
+    try:
+        driver.execute_script("return 1;")
+        return True
+    except WebDriverException:
+        return False
 
-        total = len(video_ids)
-        if total == 0:
-            logger.warning("❌ 채널에서 수집된 영상 ID가 없습니다.")
-            return
-        
-        logger.info(f"총 {total}개 영상 크롤링 시작")
-        all_data = pd.DataFrame()
 
-        for i, video_id in enumerate(video_ids, start=1):
+# ---------- ⬇️ 처음 필요할 때만 풀에서 크롬을 빌려오는 드라이버 래퍼 ----------
+class LazyDriver:
+    """
+    워커가 영상 여러 개를 처리하는 동안 같은 세션을 계속 쓰고,
+    페이지 수/메모리 한도를 넘으면 영상 사이에서 새 세션으로 바꾼다.
+    """
+
+    def __init__(self):
+        self.driver = None
+
+    def get(self):
+        pool = get_pool()
+        if self.driver is not None and pool.needs_recycle(self.driver):
+            self.close(discard=True)
+        if self.driver is None:
+            self.driver = pool.acquire()
+        return self.driver
+
+    @property
+    def started(self) -> bool:
+        return self.driver is not None
+
+    def close(self, discard: bool = False):
+        if self.driver is not None:
             try:
-                logger.info(f"\n🔍 ({i}/{total}) 영상 크롤링 시작: {video_id}")
-                df = collect_video_data(driver, video_id)
-                if df is not None and not df.empty:
-                    all_data = pd.concat([all_data, df], ignore_index=True)
-                    save_to_db(df)
-                    logger.info(f"✅ ({i}/{total}) 영상 크롤링 완료: {video_id}")
+                get_pool().release(self.driver, discard=discard)
             except Exception as e:
-                logger.error(f"❌ ({i}/{total}) 영상 크롤링 중 에러 발생: {video_id}, 에러: {e}", exc_info=True)
+                logger.warning(f"⚠️ 드라이버 반납 중 에러: {e}")
+        self.driver = None
 
-        if not all_data.empty:
+
+# ---------- ⬇️ 워커 하나가 작업 큐에서 영상을 꺼내 크롤링하는 함수 ----------
+def crawl_worker(worker_id: int, video_queue: queue.Queue, result_queue: queue.Queue, total: int, max_retries: int, backend: str = "selenium", stop_event: threading.Event = None):
+    """
+    작업 큐가 빌 때까지 영상을 하나씩 꺼내 크롤링하고 결과를 result_queue에 넣는다.
+    드라이버가 죽으면 해당 영상을 큐에 다시 넣고 드라이버를 새로 띄운다.
+    http 백엔드는 Selenium 대체가 필요할 때만 크롬을 띄운다.
+    stop_event가 설정되면 남은 영상을 꺼내지 않고 끝낸다.
+    워커가 끝나면 result_queue에 None을 넣어 종료를 알린다.
+    """
+    max_restarts = max_retries + 1
+    restarts = 0
+    lazy_driver = LazyDriver()
+    try:
+        while restarts <= max_restarts and not (stop_event and stop_event.is_set()):
+            try:
+                index, video_id, attempt = video_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            logger.info(f"\n🔍 [worker-{worker_id}] ({index}/{total}) 영상 크롤링 시작: {video_id}")
+            crashed = False
             try:
-                # 채널명 가져오기
-                channel_name = get_channel_name(driver, channel_url)
-                
-                # CSV 저장
-                csv_path = save_to_csv(all_data, save_path, channel_name)
-                if csv_path:
-                    logger.info(f"✅ CSV 파일 저장 완료: {csv_path}")
+                with metrics.span("video_total", backend=backend):
+                    if backend == "http":
+                        df = collect_video_data_http(video_id, lazy_driver.get)
+                    else:
+                        df = collect_video_data(lazy_driver.get(), video_id)
+            except WebDriverException as e:
+                logger.warning(f"⚠️ [worker-{worker_id}] 드라이버 실행 실패: {e}")
+                df, crashed = None, True
+
+            # 결과가 비었는데 드라이버까지 죽었다면 영상을 다시 큐에 넣고 드라이버 재시작
+            if not crashed and (df is None or df.empty) and lazy_driver.started:
+                crashed = not is_driver_alive(lazy_driver.driver)
+            if crashed:
+                if attempt < max_retries:
+                    video_queue.put((index, video_id, attempt + 1))
+                    metrics.incr("video_retries_total")
+                    logger.warning(f"♻️ [worker-{worker_id}] 영상 재시도 예약 ({attempt + 1}/{max_retries}): {video_id}")
                 else:
-                    logger.error("❌ CSV 파일 저장 실패")
-            except Exception as e:
-                logger.error(f"❌ CSV 저장 중 에러 발생: {e}", exc_info=True)
-        else:
-            logger.warning("⚠️ 크롤링 결과 데이터 없음")
+                    metrics.incr("videos_failed_total")
+                    logger.error(f"❌ [worker-{worker_id}] 재시도 횟수 초과로 건너뜀: {video_id}")
+                metrics.incr("driver_restarts_total")
+                restarts += 1
+                logger.warning(f"♻️ [worker-{worker_id}] 드라이버 재시작 ({restarts}/{max_restarts})")
+                lazy_driver.close(discard=True)
+                continue
+
+            restarts = 0
+            metrics.incr("videos_crawled_total" if df is not None and not df.empty else "videos_empty_total")
+            result_queue.put((index, video_id, df))
+        if restarts > max_restarts:
+            logger.error(f"❌ [worker-{worker_id}] 드라이버 재시작 횟수 초과로 워커 종료")
+    finally:
+        lazy_driver.close()
+        result_queue.put(None)
+
+
+# ---------- ⬇️ 워커 풀을 돌리며 끝난 영상의 결과를 하나씩 내보내는 제너레이터 ----------
+def iter_video_records(video_ids: list[str], workers: int, backend: str, max_retries: int):
+    """
+    (순번, 영상 ID, DataFrame)을 영상이 끝나는 순서대로 yield 한다.
+    결과 큐 크기를 제한해서 싱크가 느리면 워커가 기다리므로, 메모리에는 영상 몇 개 분량만 머문다.
+    """
+    total = len(video_ids)
+    workers = max(1, min(workers, total))
+
+    # 워커들이 공유하는 작업 큐: (순번, 영상 ID, 재시도 횟수)
+    video_queue = queue.Queue()
+    for i, video_id in enumerate(video_ids, start=1):
+        video_queue.put((i, video_id, 0))
+    result_queue = queue.Queue(maxsize=workers * 2)
+    stop_event = threading.Event()
+
+    threads = [
+        threading.Thread(
+            target=metrics.bind(crawl_worker),
+            args=(worker_id, video_queue, result_queue, total, max_retries, backend, stop_event),
+            name=f"crawl-worker-{worker_id}",
+            daemon=True,
+        )
+        for worker_id in range(1, workers + 1)
+    ]
+    for thread in threads:
+        thread.start()
+
+    finished_workers = 0
+    try:
+        while finished_workers < workers:
+            result = result_queue.get()
+            if result is None:
+                finished_workers += 1
+                continue
+            index, video_id, df = result
+            if df is not None and not df.empty:
+                logger.info(f"✅ ({index}/{total}) 영상 크롤링 완료: {video_id}")
+                yield result
+    finally:
+        # 소비하는 쪽이 중간에 멈춰도 워커가 put()에서 막히지 않도록 큐를 비우며 종료를 기다림
+        stop_event.set()
+        while finished_workers < workers:
+            if result_queue.get() is None:
+                finished_workers += 1
+        for thread in threads:
+            thread.join()
+
+
+# ---------- ⬇️ 영상별 결과를 모든 싱크(DB, CSV 등)로 흘려보내는 함수 ----------
+def run_sinks(records, sinks: list) -> int:
+    """records의 DataFrame을 sink.write()로 하나씩 넘기고, 끝나면 sink.close()를 호출한다."""
+    written = 0
+    try:
+        for index, video_id, df in records:
+            write_record(sinks, index, video_id, df)
+            written += 1
+    finally:
+        close_sinks(sinks)
+    return written
+
+
+def write_record(sinks: list, index: int, video_id: str, df: pd.DataFrame):
+    """정규화는 한 번만 하고 모든 싱크가 같은 결과를 쓴다. 싱크 하나가 실패해도 나머지 싱크에는 저장한다."""
+    with metrics.span("normalize"):
+        df = normalize_frame(df)
+    for sink in sinks:
+        try:
+            with metrics.span("sink_write", sink=type(sink).__name__):
+                sink.write(df)
+        except Exception as e:
+            logger.error(f"❌ ({index}) {type(sink).__name__} 저장 중 에러 발생: {video_id}, 에러: {e}", exc_info=True)
+
+
+def close_sinks(sinks: list):
+    for sink in sinks:
+        try:
+            with metrics.span("sink_close", sink=type(sink).__name__):
+                sink.close()
+        except Exception as e:
+            logger.error(f"❌ {type(sink).__name__} 종료 중 에러 발생: {e}", exc_info=True)
+
+
+# ---------- ⬇️ 채널에서 크롤링할 영상 URL 목록과 채널명 ----------
+def discover_channel(channel_url: str, incremental: bool, limit: int = None, since: date = None) -> tuple[str, list[str]]:
+    """
+    영상 ID와 채널명은 HTTP로 받은 채널 페이지에서 같이 읽고,
+    DOM 방식으로 대체할 때만 드라이버 한 개를 빌려서 끝낸다.
+    증분 모드면 새 영상만 돌려주고, 오래된 영상은 여기서 가볍게 갱신한다.
+    크롤링할 영상이 없으면 빈 목록.
+    """
+    known_ids = KnownVideoIds() if incremental else None
+    lazy_driver = LazyDriver()
+    discard = False
+    try:
+        with metrics.span("discover_video_ids"):
+            collector = discover_videos(lazy_driver.get, channel_url, known_ids=known_ids, limit=limit, since=since)
+        video_ids = collector.video_urls
+        if not video_ids:
+            logger.warning("❌ 채널에서 수집된 영상 ID가 없습니다.")
+            return "", []
+        channel_name = collector.channel_name
+        if not channel_name:
+            with metrics.span("channel_name"):
+                channel_name = get_channel_name(lazy_driver.get(), channel_url)
+    except WebDriverException:
+        discard = True
+        raise
+    finally:
+        lazy_driver.close(discard=discard)
+
+    if incremental:
+        video_ids, refresh_ids = plan_incremental_crawl(video_ids)
+        with metrics.span("refresh_known_videos"):
+            refresh_known_videos(refresh_ids)
+        if not video_ids:
+            logger.info("✅ 새로 크롤링할 영상이 없습니다.")
+    return channel_name, video_ids
+
+
+# ---------- ⬇️ 영상 한 개 크롤링 (Celery 영상 태스크용) ----------
+def crawl_single_video(video_id: str, backend: str = None) -> pd.DataFrame:
+    """
+    워커 프로세스의 브라우저 풀에서 세션을 빌려 영상 한 개를 크롤링한다.
+    드라이버가 죽으면 세션을 버리고 WebDriverException을 그대로 올려서 태스크가 재시도하게 한다.
+    """
+    backend = backend or getattr(settings, "CRAWLER_BACKEND", "selenium")
+    lazy_driver = LazyDriver()
+    discard = False
+    try:
+        with metrics.span("video_total", backend=backend):
+            if backend == "http":
+                return collect_video_data_http(video_id, lazy_driver.get)
+            return collect_video_data(lazy_driver.get(), video_id)
+    except WebDriverException:
+        discard = True
+        raise
+    finally:
+        lazy_driver.close(discard=discard or (lazy_driver.started and not is_driver_alive(lazy_driver.driver)))
+
+
+# ---------- ⬇️ 유튜브 채널의 전체 크롤링을 실행하는 함수 ----------
+def crawl_channel_videos(channel_url: str, save_path: str, workers: int = None, backend: str = None, incremental: bool = None, checkpoints: bool = None, limit: int = None, since: date = None):
+    workers = workers or getattr(settings, "CRAWLER_WORKERS", 1)
+    backend = backend or getattr(settings, "CRAWLER_BACKEND", "selenium")
+    max_retries = getattr(settings, "CRAWLER_VIDEO_MAX_RETRIES", 2)
+    if incremental is None:
+        incremental = getattr(settings, "CRAWLER_INCREMENTAL", False)
+    if checkpoints is None:
+        checkpoints = getattr(settings, "CRAWLER_CHECKPOINTS", False)
+
+    run_metrics = metrics.start_run()
+    try:
+        with metrics.span("channel_total"):
+            _crawl_channel(channel_url, save_path, workers, backend, max_retries, incremental, checkpoints, limit, since)
+    finally:
+        metrics.dump_run(run_metrics, safe_channel_name(channel_url.rstrip("/").split("/")[-1]))
+
+
+def _crawl_channel(channel_url: str, save_path: str, workers: int, backend: str, max_retries: int, incremental: bool, checkpoints: bool, limit: int, since: date):
+    # 이전 실행이 중간에 끊긴 작업이 있으면 영상 ID 수집(스크롤)을 건너뛰고 이어서 진행
+    job = get_resumable_job(channel_url) if checkpoints else None
+    if job is not None:
+        channel_name = job.channel_name
+    else:
+        channel_name, video_ids = discover_channel(channel_url, incremental, limit, since)
+        if not video_ids:
+            return
+        if checkpoints:
+            job = create_job(channel_url, channel_name, [video_id_from_url(url) for url in video_ids])
+
+    owner = uuid.uuid4().hex
+    if job is not None:
+        video_ids = claim_videos(job, owner)
+        if not video_ids:
+            finish_run(job, [])
+            return
+
+    logger.info(f"총 {len(video_ids)}개 영상 크롤링 시작 (워커 {min(workers, len(video_ids))}개, 백엔드 {backend})")
+
+    # 영상이 끝날 때마다 DB(배치)/CSV(파티션 append)로 바로 흘려보내서 메모리 사용량이 영상 수와 무관하게 유지됨
+    # 싱크는 메인 스레드에서만 실행 (SQLite 쓰기 잠금 충돌 방지)
+    # 체크포인트는 DB 저장이 끝난 영상만 완료로 기록
+    on_flush = (lambda saved_ids: mark_done(job, saved_ids)) if job is not None else None
+    records = iter_video_records(video_ids, workers, backend, max_retries)
+    sinks = [DBBatchWriter(on_flush=on_flush), *build_export_sinks(save_path, channel_name)]
+    try:
+        with claim_heartbeat(job, owner) if job is not None else nullcontext():
+            crawled_count = run_sinks(records, sinks)
+    finally:
+        if job is not None:
+            finish_run(job, video_ids)
+    if crawled_count == 0:
+        logger.warning("⚠️ 크롤링 결과 데이터 없음")
@@ -0,0 +1,264 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling.longform_http_extractor import INITIAL_DATA_RE, extract_json_var, get_http_session, json_text
+from youtube_crawling.longform_readiness import POLL_INTERVAL, wait_for_document_ready
+from youtube_crawling.longform_ratelimit import throttled_get, throttled_request
+from youtube_crawling import longform_metrics as metrics
+# --------- 그 외 import한 목록 ---------------
+from datetime import date, timedelta
+from django.conf import settings
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+import requests
+from html import unescape
+import logging, json, re, urllib.parse
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+YTCFG_RE = re.compile(r'ytcfg\.set\(\s*(?=\{)')
+OG_TITLE_RE = re.compile(r'<meta\s+property="og:title"\s+content="([^"]*)"')
+
+# "3일 전", "2주 전", "1개월 전", "스트리밍 시간: 5시간 전", "3 days ago" 같은 상대 시간
+RELATIVE_TIME_RE = re.compile(
+    r'(\d+)\s*(초|분|시간|일|주|개월|달|년|seconds?|minutes?|hours?|days?|weeks?|months?|years?)\s*(?:전|ago)'
+)
+RELATIVE_UNIT_DAYS = {
+    "초": 0, "second": 0, "seconds": 0,
+    "분": 0, "minute": 0, "minutes": 0,
+    "시간": 0, "hour": 0, "hours": 0,
+    "일": 1, "day": 1, "days": 1,
+    "주": 7, "week": 7, "weeks": 7,
+    "개월": 30, "달": 30, "month": 30, "months": 30,
+    "년": 365, "year": 365, "years": 365,
+}
+
+
+# ---------- ⬇️ 상대 업로드 시간 → 대략적인 날짜 ----------
+def parse_published_text(text: str, today: date = None) -> date | None:
+    """개월/년 단위는 30일/365일로 계산하므로 그 단위만큼 오차가 있다"""
+    match = RELATIVE_TIME_RE.search(text or "")
+    if not match:
+        return None
+    amount, unit = int(match.group(1)), match.group(2)
+    return (today or date.today()) - timedelta(days=amount * RELATIVE_UNIT_DAYS[unit])
+
+
+# ---------- ⬇️ 수집한 영상 목록과 중단 조건(newest N / since / 증분) ----------
+class DiscoveryCollector:
+    """
+    영상은 최신순으로 들어온다고 가정한다.
+    - limit: 최신 영상 N개까지만
+    - since: 업로드일이 since보다 오래된 영상이 나오면 중단
+    - known_ids: 이미 저장된 영상이 stop_after_known개 연속으로 나오면 중단
+      (set 또는 prefetch(video_ids)로 한 페이지씩 DB에서 확인하는 객체)
+    add()/add_page()가 False를 반환하면 더 불러올 필요가 없다.
+    channel_name: HTTP로 읽은 채널 페이지에서 찾은 채널명 (DOM 방식이면 None)
+    """
+
+    def __init__(self, limit: int = None, since: date = None, known_ids: set = None, stop_after_known: int = None):
+        self.limit = limit
+        self.since = since
+        self.known_ids = known_ids
+        self.stop_after_known = stop_after_known
+        self.video_urls = []
+        self.seen_ids = set()
+        self.known_run = 0
+        self.stop_reason = None
+        self.channel_name = None
+
+    def add(self, video_id: str, published_text: str = None) -> bool:
+        if self.stop_reason:
+            return False
+        if not video_id or video_id in self.seen_ids:
+            return True
+        if self.since is not None:
+            published = parse_published_text(published_text)
+            if published is not None and published < self.since:
+                self.stop_reason = f"{self.since} 이전 영상 도달"
+                return False
+        self.seen_ids.add(video_id)
+        self.video_urls.append(f"https://www.youtube.com/watch?v={video_id}")
+
+        if self.known_ids and self.stop_after_known:
+            self.known_run = self.known_run + 1 if video_id in self.known_ids else 0
+            if self.known_run >= self.stop_after_known:
+                self.stop_reason = f"이미 저장된 영상 {self.known_run}개 연속"
+                return False
+        if self.limit and len(self.video_urls) >= self.limit:
+            self.stop_reason = f"최신 {self.limit}개 수집"
+            return False
+        return True
+
+    def add_page(self, items) -> bool:
+        """items: (video_id, 업로드 시간) 목록. 저장 여부는 페이지의 영상만 한 번에 조회한다."""
+        items = list(items)
+        if self.known_ids and self.stop_after_known and hasattr(self.known_ids, "prefetch"):
+            self.known_ids.prefetch([video_id for video_id, _ in items])
+        return all(self.add(video_id, published) for video_id, published in items)
+
+
+# ---------- ⬇️ 채널 목록 JSON에서 (video_id, 업로드 시간) 과 다음 continuation 토큰 ----------
+def parse_browse_items(data) -> tuple[list[tuple[str, str]], str | None]:
+    """
+    ytInitialData(첫 페이지) 와 browse 응답(continuation) 양쪽에서 같은 방식으로 읽는다.
+    화면 순서(최신순)를 지키기 위해 앞에서부터 순서대로 훑는다.
+    """
+    videos, token = [], None
+    stack = [data]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, list):
+            stack.extend(reversed(current))
+        elif isinstance(current, dict):
+            if "videoRenderer" in current:
+                renderer = current["videoRenderer"]
+                videos.append((renderer.get("videoId"), json_text(renderer.get("publishedTimeText"))))
+            elif "lockupViewModel" in current:
+                lockup = current["lockupViewModel"]
+                if lockup.get("contentType", "LOCKUP_CONTENT_TYPE_VIDEO") == "LOCKUP_CONTENT_TYPE_VIDEO":
+                    rows = lockup.get("metadata", {}).get("lockupMetadataViewModel", {}).get("metadata", {})
+                    texts = [
+                        part.get("text", {}).get("content", "")
+                        for row in rows.get("contentMetadataViewModel", {}).get("metadataRows", [])
+                        for part in row.get("metadataParts", [])
+                    ]
+                    videos.append((lockup.get("contentId"), next((t for t in texts if RELATIVE_TIME_RE.search(t)), "")))
+            elif "continuationCommand" in current:
+                token = current["continuationCommand"].get("token") or token
+            else:
+                stack.extend(reversed(list(current.values())))
+    return videos, token
+
+
+# ---------- ⬇️ 채널 페이지에서 채널명 (ytInitialData 메타데이터, 없으면 og:title) ----------
+def channel_title(initial: dict, html: str) -> str | None:
+    title = initial.get("metadata", {}).get("channelMetadataRenderer", {}).get("title")
+    if not title and (match := OG_TITLE_RE.search(html)):
+        title = urllib.parse.unquote(unescape(match.group(1)))
+    return title or None
+
+
+# ---------- ⬇️ 채널 페이지의 ytcfg (innertube API 키, 클라이언트 context) ----------
+def extract_ytcfg(html: str) -> dict:
+    config = {}
+    for match in YTCFG_RE.finditer(html):
+        try:
+            data, _ = json.JSONDecoder().raw_decode(html, match.end())
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            config.update(data)
+    return config
+
+
+def browse_endpoint(channel_url: str, api_key: str = None) -> str:
+    parsed = urllib.parse.urlsplit(channel_url)
+    endpoint = f"{parsed.scheme}://{parsed.netloc}/youtubei/v1/browse?prettyPrint=false"
+    return f"{endpoint}&key={api_key}" if api_key else endpoint
+
+
+# ---------- ⬇️ continuation 토큰을 따라가며 채널 영상 ID 수집 (브라우저 없음) ----------
+def discover_video_urls_http(channel_url: str, collector: DiscoveryCollector, max_pages: int = None) -> list[str] | None:
+    """
+    /videos 페이지의 ytInitialData로 첫 묶음을 읽고, browse API에 continuation 토큰을 보내서
+    다음 묶음(보통 30개)을 받는다. 첫 페이지에 ytInitialData가 없으면 None (DOM 방식으로 대체).
+    """
+    timeout = getattr(settings, "CRAWLER_HTTP_TIMEOUT", 10)
+    max_pages = max_pages or getattr(settings, "CRAWLER_DISCOVERY_MAX_PAGES", 500)
+    session = get_http_session()
+    try:
+        with metrics.span("discovery_page", source="html"):
+            response = throttled_request(session, "GET", channel_url.rstrip("/") + "/videos", expect_initial_data=True, timeout=timeout)
+            response.raise_for_status()
+            html = response.text
+    except requests.RequestException as e:
+        logger.warning(f"⚠️ 채널 페이지 요청 실패: {channel_url} - {e}")
+        return None
+
+    initial = extract_json_var(html, INITIAL_DATA_RE)
+    if not initial:
+        metrics.incr("discovery_fallback_total", reason="no_initial_data")
+        return None
+    collector.channel_name = channel_title(initial, html)
+    ytcfg = extract_ytcfg(html)
+    context = ytcfg.get("INNERTUBE_CONTEXT") or {"client": {"clientName": "WEB", "clientVersion": "2.20250101.00.00", "hl": "ko"}}
+    endpoint = browse_endpoint(channel_url, ytcfg.get("INNERTUBE_API_KEY"))
+
+    videos, token = parse_browse_items(initial)
+    pages = 1
+    while True:
+        if not collector.add_page(videos):
+            break
+        if not token:
+            break
+        if pages >= max_pages:
+            logger.warning(f"⚠️ continuation 페이지 수 제한({max_pages})에 도달")
+            break
+        try:
+            with metrics.span("discovery_page", source="browse"):
+                response = throttled_request(session, "POST", endpoint, json={"context": context, "continuation": token}, timeout=timeout)
+                response.raise_for_status()
+                data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            # 이미 받은 목록은 버리지 않음 (다음 실행 때 증분 모드로 이어짐)
+            metrics.incr("discovery_error_total")
+            logger.warning(f"⚠️ continuation 요청 실패, 지금까지 수집한 목록만 사용: {e}")
+            break
+        pages += 1
+        videos, token = parse_browse_items(data.get("onResponseReceivedActions", data))
+    logger.info(f"📜 continuation {pages}페이지에서 영상 {len(collector.video_urls)}개 수집")
+    return collector.video_urls
+
+
+# ---------- ⬇️ (대체 경로) 스크롤하면서 새로 붙은 노드만 읽기 ----------
+# arguments[0] 번째 이후의 링크만 돌려주므로 DOM 읽기 비용은 새로 붙은 영상 수에만 비례한다.
+NEW_LINKS_SCRIPT = """
+var links = document.querySelectorAll('a#video-title-link');
+var result = [];
+for (var i = arguments[0]; i < links.length; i++) {
+    var card = links[i].closest('ytd-rich-item-renderer, ytd-grid-video-renderer') || links[i].parentElement;
+    var spans = card ? card.querySelectorAll('#metadata-line span') : [];
+    result.push([links[i].href, spans.length ? spans[spans.length - 1].textContent.trim() : ""]);
+}
+return result;
+"""
+HAS_CONTINUATION_SCRIPT = "return !!document.querySelector('ytd-continuation-item-renderer');"
+LINK_COUNT_SCRIPT = "return document.querySelectorAll('a#video-title-link').length;"
+
+
+def discover_video_urls_dom(driver, channel_url: str, collector: DiscoveryCollector, idle_timeout: float = None) -> list[str]:
+    """
+    맨 아래로 스크롤한 뒤 링크 수가 늘어날 때까지만 기다린다 (고정 sleep 없음).
+    continuation 스피너가 없거나 idle_timeout 동안 새 영상이 안 붙으면 끝.
+    """
+    if idle_timeout is None:
+        idle_timeout = getattr(settings, "CRAWLER_DISCOVERY_IDLE_TIMEOUT", 5)
+    throttled_get(driver, channel_url.rstrip("/") + "/videos")
+    wait_for_document_ready(driver, 15)
+
+    read = 0
+    while True:
+        with metrics.span("discovery_page", source="dom"):
+            new_items = driver.execute_script(NEW_LINKS_SCRIPT, read)
+        read += len(new_items)
+        if not collector.add_page(
+            (urllib.parse.parse_qs(urllib.parse.urlsplit(href).query).get("v", [""])[0], published)
+            for href, published in new_items
+            if href and "watch?v=" in href
+        ):
+            break
+
+        driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
+        try:
+            WebDriverWait(driver, idle_timeout, poll_frequency=POLL_INTERVAL).until(
+                lambda d: d.execute_script(LINK_COUNT_SCRIPT) > read
+            )
+        except TimeoutException:
+            if not driver.execute_script(HAS_CONTINUATION_SCRIPT):
+                break
+            metrics.incr("wait_timeout_total", step="discovery")
+            logger.info(f"⏱️ {idle_timeout}초 동안 새 영상이 붙지 않아 스크롤 중단")
+            break
+    return collector.video_urls
@@ -0,0 +1,184 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling.longform_schema import ROW_COLUMNS
+# --------- 그 외 import한 목록 ---------------
+from django.core.exceptions import ImproperlyConfigured
+from datetime import datetime
+import pandas as pd
+import logging, os, urllib.parse
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow는 Parquet 내보내기를 쓸 때만 필요
+    pa = pq = None
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+
+# ---------- ⬇️ 파일/폴더 이름으로 쓸 수 있는 채널명 ----------
+def safe_channel_name(channel_name: str) -> str:
+    # URL 인코딩된 채널명을 디코딩
+    decoded_channel_name = urllib.parse.unquote(channel_name or "")
+    # 채널명에서 특수문자 제거하고 공백을 언더스코어로 변경
+    return "".join(c for c in decoded_channel_name.replace(" ", "_") if c.isalnum() or c in ('_',)).rstrip()
+
+
+# ---------- ⬇️ 추출일 값을 파티션 키(YYYYMMDD)로 ----------
+def partition_key(value) -> str:
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y%m%d")
+    return str(value or "unknown").replace("-", "")[:8]
+
+
+# ---------- ⬇️ 채널/추출일 단위로 나눠서 append만 하는 CSV 싱크 ----------
+class PartitionedCSVWriter:
+    """
+    {directory}/{채널명}/{YYYYMMDD}.csv 에 전처리된 row를 이어붙인다.
+    기존 파일을 읽거나 다시 쓰지 않으므로 저장 비용은 새로 쓰는 row 수에만 비례한다.
+    """
+
+    def __init__(self, directory: str, channel_name: str):
+        self.channel_dir = os.path.join(directory, safe_channel_name(channel_name))
+        os.makedirs(self.channel_dir, exist_ok=True)
+        self.rows_written = 0
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.channel_dir, f"{key}.csv")
+
+    def write(self, df: pd.DataFrame) -> list[str]:
+        if df is None or df.empty:
+            return []
+        df = df.reindex(columns=ROW_COLUMNS)
+        paths = []
+        for key, group in df.groupby(df["extracted_date"].map(partition_key), sort=False):
+            path = self.path_for(key)
+            write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+            # utf-8-sig 는 append 모드에서 파일 중간에 BOM을 다시 쓰지 않음
+            group.to_csv(path, mode="a", header=write_header, index=False, encoding="utf-8-sig")
+            paths.append(path)
+        self.rows_written += len(df)
+        return paths
+
+
+# ---------- ⬇️ 파티션 파일들을 예전 형식의 채널별 CSV 한 개로 합치기 (선택) ----------
+def compact_csv(directory: str, channel_name: str, output_path: str = None) -> str | None:
+    """
+    파티션을 추출일 내림차순으로 한 파일씩 이어붙여 {directory}/{채널명}.csv 를 만든다.
+    한 번에 파티션 하나만 메모리에 올린다.
+    """
+    name = safe_channel_name(channel_name)
+    channel_dir = os.path.join(directory, name)
+    if not os.path.isdir(channel_dir):
+        logger.warning(f"⚠️ 합칠 CSV 파티션이 없습니다: {channel_dir}")
+        return None
+    output_path = output_path or os.path.join(directory, f"{name}.csv")
+    partitions = sorted((f for f in os.listdir(channel_dir) if f.endswith(".csv")), reverse=True)
+
+    tmp_path = output_path + ".tmp"
+    write_header = True
+    for file_name in partitions:
+        for chunk in pd.read_csv(os.path.join(channel_dir, file_name), encoding="utf-8-sig", chunksize=50_000):
+            chunk.to_csv(tmp_path, mode="w" if write_header else "a", header=write_header, index=False, encoding="utf-8-sig")
+            write_header = False
+    if write_header:
+        return None
+    os.replace(tmp_path, output_path)
+    logger.info(f"🗜️ CSV 파티션 {len(partitions)}개 합치기 완료: {output_path}")
+    return output_path
+
+
+# ---------- ⬇️ Parquet 컬럼 타입: 반복되는 문자열은 dictionary, 숫자는 int64, 날짜는 date32 ----------
+INT_COLUMNS = ["subscribers", "view_count", "product_count", "product_price"]
+DATE_COLUMNS = ["upload_date", "extracted_date"]
+DICTIONARY_COLUMNS = ["youtube_id", "title", "channel_name", "video_url", "description", "product_merchant"]
+
+
+def parquet_schema():
+    if pa is None:
+        raise ImproperlyConfigured("Parquet 내보내기에는 pyarrow가 필요합니다. (pip install pyarrow)")
+    fields = []
+    for column in ROW_COLUMNS:
+        if column in INT_COLUMNS:
+            fields.append(pa.field(column, pa.int64()))
+        elif column in DATE_COLUMNS:
+            fields.append(pa.field(column, pa.date32()))
+        elif column in DICTIONARY_COLUMNS:
+            fields.append(pa.field(column, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(column, pa.string()))
+    return pa.schema(fields)
+
+
+# ---------- ⬇️ 전처리된 DataFrame을 Parquet 스키마 타입에 맞게 정리 ----------
+def to_arrow_table(df: pd.DataFrame, schema=None):
+    schema = schema or parquet_schema()
+    df = df.reindex(columns=ROW_COLUMNS)
+    columns = {}
+    for column in ROW_COLUMNS:
+        values = df[column]
+        if column in INT_COLUMNS:
+            columns[column] = pd.to_numeric(values, errors="coerce").fillna(0).astype("int64")
+        elif column in DATE_COLUMNS:
+            columns[column] = pd.to_datetime(values, errors="coerce").dt.date
+        else:
+            columns[column] = values.fillna("").astype(str)
+    return pa.Table.from_pandas(pd.DataFrame(columns), schema=schema, preserve_index=False)
+
+
+# ---------- ⬇️ channel=/dt= 폴더로 나눠 쓰는 Parquet 싱크 ----------
+class PartitionedParquetWriter:
+    """
+    {directory}/channel={채널명}/dt={YYYYMMDD}/part-{실행시각}.parquet
+    폴더 키를 extracted_date 로 하면 파일 안의 extracted_date(date32) 컬럼과 이름이 겹쳐서
+    pd.read_parquet(폴더)가 타입을 합치지 못하므로 dt 로 둔다.
+    파티션마다 파일 하나를 열어두고 row_group_rows 만큼 모일 때마다 row group을 쓴다.
+    close()를 호출해야 파일이 완성된다.
+    """
+
+    def __init__(self, directory: str, channel_name: str, row_group_rows: int = 10_000, compression: str = "zstd"):
+        self.schema = parquet_schema()
+        self.channel_dir = os.path.join(directory, f"channel={safe_channel_name(channel_name)}")
+        self.run_id = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        self.row_group_rows = row_group_rows
+        self.compression = compression
+        self.buffers = {}   # 파티션 키 -> 아직 안 쓴 DataFrame 목록
+        self.writers = {}   # 파티션 키 -> pq.ParquetWriter
+        self.rows_written = 0
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.channel_dir, f"dt={key}", f"part-{self.run_id}.parquet")
+
+    def write(self, df: pd.DataFrame):
+        if df is None or df.empty:
+            return
+        for key, group in df.groupby(df["extracted_date"].map(partition_key), sort=False):
+            buffer = self.buffers.setdefault(key, [])
+            buffer.append(group)
+            if sum(len(part) for part in buffer) >= self.row_group_rows:
+                self._flush_partition(key)
+
+    def _flush_partition(self, key: str):
+        buffer = self.buffers.pop(key, None)
+        if not buffer:
+            return
+        table = to_arrow_table(pd.concat(buffer, ignore_index=True), self.schema)
+        writer = self.writers.get(key)
+        if writer is None:
+            path = self.path_for(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            writer = pq.ParquetWriter(path, self.schema, compression=self.compression, use_dictionary=True)
+            self.writers[key] = writer
+        writer.write_table(table)
+        self.rows_written += table.num_rows
+
+    def close(self) -> list[str]:
+        for key in list(self.buffers):
+            self._flush_partition(key)
+        paths = [self.path_for(key) for key in self.writers]
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
+        return paths
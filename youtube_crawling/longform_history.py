@@ -0,0 +1,211 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling.models import YouTubeVideo, VideoSnapshot, ProductPriceSnapshot, ChannelDailyStats
+from youtube_crawling import longform_metrics as metrics
+# --------- 그 외 import한 목록 ---------------
+from datetime import date
+from django.conf import settings
+from django.db.models import Avg, Count, Max, Sum
+import pandas as pd
+import logging
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+# ---------- ⬇️ 조회수/구독자 수/가격 이력 ----------
+# YouTubeVideo / YouTubeProduct 는 크롤링할 때마다 덮어쓰므로, 같은 값을 (영상, 수집일)별로
+# VideoSnapshot / ProductPriceSnapshot 에 한 줄씩 쌓는다. 추세 조회는 CSV를 다시 읽지 않고
+# 채널/날짜별로 미리 집계해둔 ChannelDailyStats 를 읽는다.
+
+_to_date = YouTubeVideo._meta.get_field("extracted_date").to_python
+
+
+def history_enabled() -> bool:
+    return getattr(settings, "CRAWLER_HISTORY", True)
+
+
+# ---------- ⬇️ upsert 한 영상/제품으로 스냅샷 bulk 저장 (upsert 와 같은 트랜잭션 안에서 호출) ----------
+def write_snapshots(videos: dict, products: dict, pk_by_video_id: dict) -> set:
+    """
+    videos: {video_id: YouTubeVideo}, products: {(video_id, product_name): 제품 필드 dict}
+    (build_db_objects 반환값). 같은 날 다시 저장하면 그날 줄만 최신 값으로 바뀐다.
+    반환값: 집계를 다시 해야 하는 (channel_name, date) 목록
+    """
+    video_snapshots, touched = [], set()
+    for video_id in sorted(videos):
+        if video_id not in pk_by_video_id:
+            continue
+        video = videos[video_id]
+        extracted_date = _to_date(video.extracted_date)
+        video_snapshots.append(VideoSnapshot(
+            video_id=pk_by_video_id[video_id],
+            extracted_date=extracted_date,
+            view_count=video.view_count,
+            subscriber_count=video.subscriber_count,
+            product_count=video.product_count,
+        ))
+        touched.add((video.channel_name, extracted_date))
+
+    price_snapshots = [
+        ProductPriceSnapshot(
+            video_id=pk_by_video_id[video_id],
+            product_name=product_name,
+            extracted_date=_to_date(videos[video_id].extracted_date),
+            product_price=fields["product_price"],
+        )
+        for (video_id, product_name), fields in sorted(products.items())
+        if video_id in pk_by_video_id
+    ]
+
+    if video_snapshots:
+        VideoSnapshot.objects.bulk_create(
+            video_snapshots,
+            update_conflicts=True,
+            unique_fields=["video", "extracted_date"],
+            update_fields=["view_count", "subscriber_count", "product_count"],
+        )
+    if price_snapshots:
+        ProductPriceSnapshot.objects.bulk_create(
+            price_snapshots,
+            update_conflicts=True,
+            unique_fields=["video", "product_name", "extracted_date"],
+            update_fields=["product_price"],
+        )
+    metrics.incr("history_snapshots_total", len(video_snapshots), kind="video")
+    metrics.incr("history_snapshots_total", len(price_snapshots), kind="price")
+    return touched
+
+
+# ---------- ⬇️ DB에 저장된 현재 값으로 스냅샷 (refresh_known_videos 처럼 .update() 로 갱신한 경우) ----------
+def snapshot_saved_videos(video_ids: list[str]) -> set:
+    rows = YouTubeVideo.objects.filter(video_id__in=list(video_ids)).values(
+        "id", "channel_name", "extracted_date", "view_count", "subscriber_count", "product_count",
+    )
+    snapshots, touched = [], set()
+    for row in rows:
+        snapshots.append(VideoSnapshot(
+            video_id=row["id"],
+            extracted_date=row["extracted_date"],
+            view_count=row["view_count"],
+            subscriber_count=row["subscriber_count"],
+            product_count=row["product_count"],
+        ))
+        touched.add((row["channel_name"], row["extracted_date"]))
+    if snapshots:
+        VideoSnapshot.objects.bulk_create(
+            snapshots,
+            update_conflicts=True,
+            unique_fields=["video", "extracted_date"],
+            update_fields=["view_count", "subscriber_count", "product_count"],
+        )
+        metrics.incr("history_snapshots_total", len(snapshots), kind="video")
+    return touched
+
+
+# ---------- ⬇️ 채널/날짜별 집계 (ChannelDailyStats) 다시 계산 ----------
+def rollup_channel_daily(pairs=None, channels: list[str] = None, dates: list[date] = None) -> int:
+    """
+    pairs: (channel_name, date) 목록. 저장 직후에는 write_snapshots 가 돌려준 값을 넘긴다.
+    channels/dates 로 범위를 직접 줄 수도 있고, 아무것도 안 주면 전체 이력을 다시 집계한다.
+    워커 여러 개가 같은 채널/날짜를 동시에 저장해서 집계가 어긋나도 다시 호출하면 맞춰진다.
+    """
+    if pairs is not None:
+        pairs = set(pairs)
+        if not pairs:
+            return 0
+        channels = sorted({channel for channel, _ in pairs})
+        dates = sorted({day for _, day in pairs})
+
+    video_rows = VideoSnapshot.objects.all()
+    price_rows = ProductPriceSnapshot.objects.all()
+    if channels is not None:
+        video_rows = video_rows.filter(video__channel_name__in=channels)
+        price_rows = price_rows.filter(video__channel_name__in=channels)
+    if dates is not None:
+        video_rows = video_rows.filter(extracted_date__in=dates)
+        price_rows = price_rows.filter(extracted_date__in=dates)
+
+    avg_prices = {
+        (row["video__channel_name"], row["extracted_date"]): row["avg_price"]
+        for row in price_rows.values("video__channel_name", "extracted_date").annotate(avg_price=Avg("product_price"))
+    }
+    stats = [
+        ChannelDailyStats(
+            channel_name=row["video__channel_name"],
+            date=row["extracted_date"],
+            video_count=row["video_count"],
+            total_views=row["total_views"] or 0,
+            subscriber_count=row["subscriber_count"] or 0,
+            product_count=row["product_count"] or 0,
+            avg_product_price=round(avg_prices.get((row["video__channel_name"], row["extracted_date"])) or 0),
+        )
+        for row in video_rows.values("video__channel_name", "extracted_date").annotate(
+            video_count=Count("id"),
+            total_views=Sum("view_count"),
+            subscriber_count=Max("subscriber_count"),
+            product_count=Sum("product_count"),
+        ).order_by("video__channel_name", "extracted_date")
+    ]
+    if stats:
+        ChannelDailyStats.objects.bulk_create(
+            stats,
+            update_conflicts=True,
+            unique_fields=["channel_name", "date"],
+            update_fields=["video_count", "total_views", "subscriber_count", "product_count", "avg_product_price"],
+        )
+    return len(stats)
+
+
+# ---------- ⬇️ 추세 조회 ----------
+def _date_range(queryset, field: str, date_from: date = None, date_to: date = None):
+    if date_from:
+        queryset = queryset.filter(**{f"{field}__gte": date_from})
+    if date_to:
+        queryset = queryset.filter(**{f"{field}__lte": date_to})
+    return queryset
+
+
+def channel_trend(channel_name: str, date_from: date = None, date_to: date = None) -> list[dict]:
+    """채널의 날짜별 영상 수/총 조회수/구독자 수/제품 수/평균 가격 (미리 집계한 값)"""
+    queryset = _date_range(ChannelDailyStats.objects.filter(channel_name=channel_name), "date", date_from, date_to)
+    return list(queryset.order_by("date").values(
+        "date", "video_count", "total_views", "subscriber_count", "product_count", "avg_product_price",
+    ))
+
+
+def video_history(video_id: str, date_from: date = None, date_to: date = None) -> list[dict]:
+    """영상 하나의 날짜별 조회수/구독자 수/제품 수와 전날 대비 조회수 증가량"""
+    queryset = _date_range(VideoSnapshot.objects.filter(video__video_id=video_id), "extracted_date", date_from, date_to)
+    rows = list(queryset.order_by("extracted_date").values("extracted_date", "view_count", "subscriber_count", "product_count"))
+    previous = None
+    for row in rows:
+        row["view_delta"] = None if previous is None else row["view_count"] - previous
+        previous = row["view_count"]
+    return rows
+
+
+def price_history(video_id: str, product_name: str = None, date_from: date = None, date_to: date = None) -> list[dict]:
+    """영상에 달린 제품별 날짜별 가격"""
+    queryset = ProductPriceSnapshot.objects.filter(video__video_id=video_id)
+    if product_name:
+        queryset = queryset.filter(product_name=product_name)
+    queryset = _date_range(queryset, "extracted_date", date_from, date_to)
+    return list(queryset.order_by("product_name", "extracted_date").values("product_name", "extracted_date", "product_price"))
+
+
+# ---------- ⬇️ 예전 CSV 파티션에서 이력만 한 번 가져오기 ----------
+def backfill_from_csv(paths: list[str]) -> int:
+    """
+    이력 테이블이 생기기 전에 쌓인 채널/추출일별 CSV로 스냅샷을 채운다.
+    DB에 저장된 영상만 대상이며 YouTubeVideo/YouTubeProduct 의 현재 값은 건드리지 않는다.
+    """
+    from youtube_crawling.longform_crawler import build_db_objects
+
+    touched = set()
+    for path in paths:
+        videos, products = build_db_objects(pd.read_csv(path, dtype=str, keep_default_na=False))
+        pk_by_video_id = dict(YouTubeVideo.objects.filter(video_id__in=list(videos)).values_list("video_id", "id"))
+        touched |= write_snapshots(videos, products, pk_by_video_id)
+        logger.info(f"📈 이력 가져오기: {path} (영상 {len(pk_by_video_id)}개)")
+    return rollup_channel_daily(touched)
@@ -0,0 +1,228 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling.longform_schema import build_video_rows
+from youtube_crawling import longform_metrics as metrics
+from youtube_crawling.longform_ratelimit import throttled_request
+# --------- 그 외 import한 목록 ---------------
+from datetime import datetime
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import pandas as pd
+import requests
+import logging, json, re, threading
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+# 유럽 IP 등에서 뜨는 동의(consent) 페이지 우회용 쿠키
+CONSENT_COOKIES = {"CONSENT": "YES+cb", "SOCS": "CAI"}
+
+INITIAL_DATA_RE = re.compile(r'(?:var\s+ytInitialData|window\[["\']ytInitialData["\']\])\s*=\s*')
+PLAYER_RESPONSE_RE = re.compile(r'(?:var\s+ytInitialPlayerResponse|window\[["\']ytInitialPlayerResponse["\']\])\s*=\s*')
+
+_local = threading.local()
+
+
+# ---------- ⬇️ 스레드별로 커넥션 풀을 재사용하는 HTTP 세션 ----------
+def get_http_session() -> requests.Session:
+    session = getattr(_local, "session", None)
+    if session is None:
+        pool_size = getattr(settings, "CRAWLER_HTTP_POOL_SIZE", 10)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)),
+        )
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        session.cookies.update(CONSENT_COOKIES)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _local.session = session
+    return session
+
+
+# ---------- ⬇️ HTML에 박혀있는 JSON 변수 추출 ----------
+def extract_json_var(html: str, pattern: re.Pattern) -> dict | None:
+    match = pattern.search(html)
+    if not match:
+        return None
+    try:
+        data, _ = json.JSONDecoder().raw_decode(html, match.end())
+        return data if isinstance(data, dict) else None
+    except ValueError as e:
+        logger.warning(f"⚠️ 내장 JSON 파싱 실패: {e}")
+        return None
+
+
+# ---------- ⬇️ simpleText / runs 형식의 텍스트를 문자열로 ----------
+def json_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        if "simpleText" in value:
+            return value["simpleText"]
+        if "runs" in value:
+            return "".join(run.get("text", "") for run in value["runs"])
+        if "content" in value:
+            return value["content"]
+    return ""
+
+
+# ---------- ⬇️ 중첩된 JSON에서 특정 키를 가진 값을 모두 찾기 ----------
+def find_key(obj, key: str):
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            for k, v in current.items():
+                if k == key:
+                    yield v
+                elif isinstance(v, (dict, list)):
+                    stack.append(v)
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def first_key(obj, key: str, default=None):
+    return next(find_key(obj, key), default)
+
+
+# ---------- ⬇️ merch shelf(제품 섹션) JSON을 extract_products_from_dom 형식으로 변환 ----------
+def parse_merch_shelf(initial_data: dict) -> list[dict] | None:
+    """
+    제품 dict 목록. 제품 섹션이 JSON에 없으면 제품이 없는 영상이므로 [].
+    섹션에 항목이 있는데 하나도 읽지 못하면(JSON 구조가 바뀐 경우) None.
+    """
+    shelf = first_key(initial_data, "merchandiseShelfRenderer")
+    if shelf is None:
+        return []
+    items = shelf.get("items", [])
+    products = []
+    for item in items:
+        renderer = item.get("merchandiseItemRenderer")
+        if not renderer:
+            continue
+        title = json_text(renderer.get("title")).strip()
+        price = json_text(renderer.get("price")).strip()
+        if not title or not price:
+            continue
+        endpoint = renderer.get("navigationEndpoint", {})
+        url = (
+            endpoint.get("urlEndpoint", {}).get("url")
+            or endpoint.get("commandMetadata", {}).get("webCommandMetadata", {}).get("url", "")
+        )
+        thumbnails = renderer.get("thumbnail", {}).get("thumbnails", [])
+        products.append({
+            "title": title,
+            "price": price,
+            "url": url,
+            "imageUrl": thumbnails[-1].get("url", "") if thumbnails else "",
+            "merchant": json_text(renderer.get("vendorName")).replace("!", "").strip(),
+        })
+    if items and not products:
+        return None
+    return products
+
+
+# ---------- ⬇️ 시청 페이지 HTML → 영상 정보 dict ----------
+def parse_watch_html(html: str) -> dict | None:
+    """
+    ytInitialPlayerResponse / ytInitialData 로 영상 정보를 만든다.
+    JSON이 아예 없으면(동의 페이지, 차단 등) None.
+    반환값의 products가 None이면 제품 섹션은 있는데 읽지 못했다는 뜻 (parse_merch_shelf).
+    """
+    player = extract_json_var(html, PLAYER_RESPONSE_RE)
+    initial = extract_json_var(html, INITIAL_DATA_RE)
+    if not player or not initial:
+        return None
+
+    details = player.get("videoDetails", {})
+    microformat = player.get("microformat", {}).get("playerMicroformatRenderer", {})
+    owner = first_key(initial, "videoOwnerRenderer", {})
+    primary = first_key(initial, "videoPrimaryInfoRenderer", {})
+
+    publish_date = microformat.get("publishDate") or microformat.get("uploadDate") or ""
+    if publish_date:
+        upload_date = publish_date[:10].replace("-", "")  # YYYYMMDD
+    else:
+        upload_date = json_text(primary.get("dateText"))
+
+    view_count = details.get("viewCount") or json_text(
+        primary.get("viewCount", {}).get("videoViewCountRenderer", {}).get("viewCount")
+    )
+
+    products = parse_merch_shelf(initial)
+    return {
+        "title": details.get("title") or json_text(primary.get("title")) or "제목 없음",
+        "channel_name": details.get("author") or json_text(owner.get("title")) or "채널 없음",
+        "subscribers": json_text(owner.get("subscriberCountText")) or "구독자 수 없음",
+        "view_count": view_count or "조회수 없음",
+        "upload_date": upload_date or "날짜 없음",
+        "description": details.get("shortDescription") or "설명 없음",
+        "product_count": len(products or []),
+        "products": products,
+    }
+
+
+# ---------- ⬇️ 시청 페이지 HTML 가져오기 ----------
+def fetch_watch_html(video_url: str) -> str | None:
+    timeout = getattr(settings, "CRAWLER_HTTP_TIMEOUT", 10)
+    try:
+        response = throttled_request(get_http_session(), "GET", video_url, expect_initial_data=True, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+    except requests.RequestException as e:
+        logger.warning(f"⚠️ 시청 페이지 요청 실패: {video_url} - {e}")
+        return None
+
+
+# ---------- ⬇️ 시청 페이지 HTML → row 목록 (동기/비동기 HTTP 백엔드 공용) ----------
+def watch_html_rows(video_url: str, html: str | None, fallback_allowed: bool = False) -> tuple[list[dict], str | None]:
+    """
+    (row 목록, Selenium으로 대체해야 하는 이유)를 반환한다. 이유가 있으면 row 목록은 비어 있다.
+    JSON이 없으면 항상 'no_initial_data', 제품 섹션을 읽지 못했으면 fallback_allowed일 때만 'merch_shelf_unparsed'.
+    제품 섹션이 없는 영상은 대부분이므로 제품 0개로 보고 Selenium을 띄우지 않는다.
+    """
+    today_str = datetime.today().strftime('%Y%m%d')
+    video_id = video_url.split("v=")[-1]
+    info = parse_watch_html(html) if html else None
+    if info is None:
+        return [], "no_initial_data"
+    if info["products"] is None and fallback_allowed and getattr(settings, "CRAWLER_HTTP_SELENIUM_FALLBACK", True):
+        return [], "merch_shelf_unparsed"
+    products = info.pop("products") or []
+    return build_video_rows(video_id, video_url, info, products, today_str), None
+
+
+# ---------- ⬇️ HTTP(JSON) 백엔드로 영상 정보 수집 ----------
+def http_youtube_info(video_url: str, fallback=None) -> pd.DataFrame:
+    """
+    base_youtube_info 와 같은 row 스키마의 DataFrame을 반환한다.
+    JSON이 없거나 제품 섹션을 읽지 못했으면 fallback(video_url) (Selenium)을 호출한다.
+    """
+    logger.info("Crawling video (http): %s", video_url)
+    with metrics.span("http_fetch"):
+        html = fetch_watch_html(video_url)
+    with metrics.span("json_parse"):
+        rows, fallback_reason = watch_html_rows(video_url, html, fallback_allowed=fallback is not None)
+
+    if fallback_reason == "no_initial_data":
+        metrics.incr("http_fallback_total", reason=fallback_reason)
+        logger.warning(f"⚠️ ytInitialData 없음, Selenium으로 대체: {video_url}")
+        return fallback(video_url) if fallback else pd.DataFrame()
+    if fallback_reason == "merch_shelf_unparsed":
+        metrics.incr("http_fallback_total", reason=fallback_reason)
+        logger.warning(f"⚠️ 제품 섹션을 JSON에서 읽지 못해 Selenium으로 대체: {video_url}")
+        return fallback(video_url)
+
+    logger.info(f"📦 수집된 데이터 행 개수: {len(rows)}")
+    return pd.DataFrame(rows)
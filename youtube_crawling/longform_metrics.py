@@ -0,0 +1,187 @@
+# --------- 그 외 import한 목록 ---------------
+from contextlib import contextmanager
+from datetime import datetime
+from django.conf import settings
+import contextvars, functools, logging, json, os, threading, time
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# ---------- ⬇️ 단계별 시간(span)과 카운터를 모으는 저장소 ----------
+class CrawlMetrics:
+    """
+    span: 단계 이름(+라벨)별 호출 수, 누적 시간, 최대 시간
+    counter: 재시도, 셀렉터 실패 같은 이벤트 수
+    여러 워커 스레드에서 동시에 기록하므로 lock으로 보호한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+        self.spans = {}      # (stage, labels) -> {"count", "sum", "max"}
+        self.counters = {}   # (name, labels) -> value
+
+    def observe(self, stage: str, seconds: float, **labels):
+        key = (stage, _label_key(labels))
+        with self._lock:
+            stat = self.spans.setdefault(key, {"count": 0, "sum": 0.0, "max": 0.0})
+            stat["count"] += 1
+            stat["sum"] += seconds
+            stat["max"] = max(stat["max"], seconds)
+
+    def incr(self, name: str, value: int = 1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def merge(self, data: dict):
+        """다른 프로세스(Celery 태스크)에서 모은 to_dict() 결과를 더한다."""
+        if not data:
+            return
+        with self._lock:
+            self.started_at = min(self.started_at, datetime.fromisoformat(data["started_at"]))
+            for item in data.get("spans", []):
+                stat = self.spans.setdefault((item["stage"], _label_key(item["labels"])), {"count": 0, "sum": 0.0, "max": 0.0})
+                stat["count"] += item["count"]
+                stat["sum"] += item["sum"]
+                stat["max"] = max(stat["max"], item["max"])
+            for item in data.get("counters", []):
+                key = (item["name"], _label_key(item["labels"]))
+                self.counters[key] = self.counters.get(key, 0) + item["value"]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(),
+                "spans": [
+                    {"stage": stage, "labels": dict(labels), **stat}
+                    for (stage, labels), stat in sorted(self.spans.items())
+                ],
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+            }
+
+
+# ---------- ⬇️ 현재 실행 중인 크롤링의 저장소 ----------
+# 스레드/gevent 풀에서 여러 태스크가 동시에 돌아도 서로의 저장소를 덮어쓰지 않도록 context 별로 둔다.
+# asyncio 태스크, asyncio.to_thread, sync_to_async 는 context 를 물려받고,
+# 직접 만든 스레드나 스레드 풀에는 bind 로 감싼 함수를 넘긴다.
+_active = contextvars.ContextVar("crawl_metrics", default=CrawlMetrics())
+
+
+def current() -> CrawlMetrics:
+    return _active.get()
+
+
+def start_run() -> CrawlMetrics:
+    """크롤링 실행 한 번의 지표를 새로 모으기 시작 (현재 context 에서만)"""
+    run = CrawlMetrics()
+    _active.set(run)
+    return run
+
+
+def bind(func):
+    """지금 실행 중인 저장소에 기록하도록 묶은 func (다른 스레드에서 호출할 때)"""
+    run = current()
+
+    @functools.wraps(func)
+    def bound(*args, **kwargs):
+        token = _active.set(run)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _active.reset(token)
+    return bound
+
+
+@contextmanager
+def span(stage: str, **labels):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _active.get().observe(stage, time.perf_counter() - started, **labels)
+
+
+def incr(name: str, value: int = 1, **labels):
+    _active.get().incr(name, value, **labels)
+
+
+# ---------- ⬇️ 실행 결과를 JSON 파일로 저장 ----------
+def metrics_dir() -> str:
+    return str(getattr(settings, "CRAWLER_METRICS_DIR", "./crawling_metrics"))
+
+
+def dump_run(metrics: CrawlMetrics, run_name: str = "") -> str | None:
+    """run-<시각>-<이름>.json 과 latest.json 에 저장 (Celery 워커와 웹 서버가 다른 프로세스라서 파일로 공유)"""
+    directory = metrics_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        data = {"run": run_name, "finished_at": datetime.now().isoformat(), **metrics.to_dict()}
+        path = os.path.join(directory, f"run-{metrics.started_at:%Y%m%d%H%M%S}-{run_name}.json")
+        for target in (path, os.path.join(directory, "latest.json")):
+            tmp = target + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, target)
+        logger.info(f"📊 크롤링 지표 저장: {path}")
+        return path
+    except OSError as e:
+        logger.warning(f"⚠️ 크롤링 지표 저장 실패: {e}")
+        return None
+
+
+def load_latest_run() -> dict | None:
+    path = os.path.join(metrics_dir(), "latest.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------- ⬇️ Prometheus 텍스트 형식으로 변환 ----------
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items())) + "}"
+
+
+def to_prometheus(data: dict) -> str:
+    run_label = {"run": data.get("run", "")}
+    lines = [
+        "# HELP crawler_stage_seconds 크롤링 단계별 소요 시간",
+        "# TYPE crawler_stage_seconds summary",
+    ]
+    for s in data.get("spans", []):
+        labels = _labels({**run_label, "stage": s["stage"], **s["labels"]})
+        lines.append(f"crawler_stage_seconds_sum{labels} {s['sum']:.6f}")
+        lines.append(f"crawler_stage_seconds_count{labels} {s['count']}")
+    lines += [
+        "# HELP crawler_stage_seconds_max 크롤링 단계별 최대 소요 시간",
+        "# TYPE crawler_stage_seconds_max gauge",
+    ]
+    for s in data.get("spans", []):
+        labels = _labels({**run_label, "stage": s["stage"], **s["labels"]})
+        lines.append(f"crawler_stage_seconds_max{labels} {s['max']:.6f}")
+
+    seen = set()
+    for c in data.get("counters", []):
+        metric = f"crawler_{c['name']}"
+        if metric not in seen:
+            lines.append(f"# TYPE {metric} counter")
+            seen.add(metric)
+        lines.append(f"{metric}{_labels({**run_label, **c['labels']})} {c['value']}")
+    return "\n".join(lines) + "\n"
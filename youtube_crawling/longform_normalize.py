@@ -0,0 +1,135 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling.longform_numbers import (
+    COUNT_PATTERN, DATE_PATTERNS, PLACEHOLDER_RE, PRICE_PATTERN, UNIT_CLASS, UNIT_MULTIPLIERS, parse_count,
+)
+from youtube_crawling import longform_metrics as metrics
+# --------- 그 외 import한 목록 ---------------
+import numpy as np
+import pandas as pd
+import re
+
+
+# ---------- ⬇️ 크롤링 row 정규화 (CSV/Parquet/DB 싱크 공용) ----------
+# parse_view_count / parse_subscriber_count / parse_price / format_date / clean_description 을
+# row마다 호출하는 대신 컬럼 단위로 처리한다. 크롤링 결과는 영상 하나의 조회수/구독자 수/날짜/설명이
+# 제품 row 마다 반복되므로, 서로 다른 값만 골라서(factorize) 정규식 extract 한 번으로 파싱하고 다시 펼친다.
+# 단위 표와 정규식은 longform_numbers 와 같은 것을 쓴다.
+
+COUNT_COLUMNS = ["view_count", "subscribers"]
+DATE_COLUMNS = ["upload_date", "extracted_date"]
+NORMALIZED_FLAG = "normalized"
+
+# 첫 번째 숫자 덩어리 + 그 뒤에 단위가 붙은 숫자가 더 있는지 ("1억 2,345만" 처럼 드문 값은 parse_count 로 계산)
+COUNT_EXTRACT_RE = re.compile(rf'{COUNT_PATTERN}(?:.*?(\d\s*[{UNIT_CLASS}]))?', re.IGNORECASE | re.DOTALL)
+# DATE_PATTERNS 를 순서대로 시도하는 것과 같도록 각 형식 앞에 .*? 를 붙여서 맨 앞에 고정한 한 개의 정규식
+DATE_EXTRACT_RE = re.compile("^(?:" + "|".join(f".*?{pattern}" for pattern in DATE_PATTERNS) + ")", re.DOTALL)
+
+
+def _as_text(values: pd.Series) -> pd.Series:
+    return values.fillna("").astype(str)
+
+
+def _unique(values: pd.Series) -> tuple[np.ndarray, pd.Series]:
+    """(row별 코드, 서로 다른 값). None/NaN 도 한 값으로 묶는다."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return codes, pd.Series(uniques, dtype=object)
+
+
+def _expand(result: pd.Series, codes: np.ndarray, values: pd.Series) -> pd.Series:
+    return pd.Series(result.to_numpy().take(codes), index=values.index, name=values.name)
+
+
+# ---------- ⬇️ 실패한 값의 이유별 개수를 parse_failure_total 에 기록 ----------
+def _report_failures(field: str, text: pd.Series, failed: pd.Series, reason: str, rows: np.ndarray):
+    """text/failed 는 서로 다른 값 기준, rows 는 값마다 몇 row 에 나왔는지"""
+    if not failed.any():
+        return
+    rows = rows[failed.to_numpy()]
+    text = text[failed]
+    empty = (text.str.strip() == "").to_numpy()
+    placeholder = ~empty & text.str.contains(PLACEHOLDER_RE.pattern, regex=True).to_numpy()
+    for name, mask in (("empty", empty), ("placeholder", placeholder), (reason, ~empty & ~placeholder)):
+        if count := int(rows[mask].sum()):
+            metrics.incr("parse_failure_total", count, field=field, reason=name)
+
+
+# ---------- ⬇️ '조회수 1,234회', '구독자 1.2만명' -> int64 (숫자가 없으면 0) ----------
+def normalize_counts(values: pd.Series, field: str = "count") -> pd.Series:
+    if pd.api.types.is_numeric_dtype(values):
+        return values.fillna(0).astype("int64")
+    codes, uniques = _unique(values)
+    text = _as_text(uniques)
+    parts = text.str.extract(COUNT_EXTRACT_RE)
+    number = pd.to_numeric(parts[0].str.replace(",", "", regex=False), errors="coerce")
+    multiplier = parts[1].str.upper().map(UNIT_MULTIPLIERS).fillna(1)
+    _report_failures(field, text, number.isna(), "no_number", np.bincount(codes, minlength=len(uniques)))
+    # 1.2 * 1000 = 1199.999... 같은 부동소수점 오차 보정
+    counts = (number * multiplier + 1e-6).fillna(0).astype("int64")
+    compound = parts[2].notna()
+    if compound.any():
+        counts[compound] = text[compound].map(parse_count).astype("int64")
+    return _expand(counts, codes, values)
+
+
+# ---------- ⬇️ '₩12,000' -> 12000, '₩12,000 ~ ₩15,000' -> 12000 (parse_price 와 같음) ----------
+def normalize_prices(values: pd.Series, field: str = "product_price") -> pd.Series:
+    if pd.api.types.is_numeric_dtype(values):
+        return values.fillna(0).astype("int64")
+    codes, uniques = _unique(values)
+    text = _as_text(uniques)
+    number = pd.to_numeric(text.str.extract(PRICE_PATTERN, expand=False).str.replace(",", "", regex=False), errors="coerce")
+    _report_failures(field, text, number.isna(), "no_number", np.bincount(codes, minlength=len(uniques)))
+    return _expand(number.fillna(0).astype("int64"), codes, values)
+
+
+# ---------- ⬇️ 날짜 문자열 -> datetime64 ----------
+def normalize_dates(values: pd.Series, field: str = "date") -> pd.Series:
+    """형식에 맞지 않는 값(예: '날짜 없음')은 format_date 처럼 원래 값을 그대로 둔다."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    codes, uniques = _unique(values)
+    text = _as_text(uniques)
+    parts = text.str.extract(DATE_EXTRACT_RE)
+    # 형식마다 (년, 월, 일) 세 그룹이고, 맞은 형식의 그룹만 값이 있음 (아무것도 안 맞으면 전부 NaN)
+    groups = parts.to_numpy().reshape(len(parts), len(DATE_PATTERNS), 3)
+    matched = groups[np.arange(len(parts)), pd.notna(groups[:, :, 0]).argmax(axis=1)]
+    year, month, day = (pd.Series(matched[:, i], dtype=object) for i in range(3))
+    digits = year + month.str.zfill(2) + day.str.zfill(2)
+    parsed = pd.to_datetime(digits, format="%Y%m%d", errors="coerce")
+    _report_failures(field, text, parsed.isna(), "bad_date", np.bincount(codes, minlength=len(uniques)))
+    parsed = _expand(parsed, codes, values)
+    if parsed.notna().all():
+        return parsed
+    return parsed.astype(object).where(parsed.notna(), values)
+
+
+# ---------- ⬇️ 설명란의 빈 줄 제거 ----------
+def normalize_descriptions(values: pd.Series) -> pd.Series:
+    codes, uniques = _unique(values)
+    cleaned = _as_text(uniques).str.replace(r'\n\s*\n', '\n', regex=True).str.strip()
+    return _expand(cleaned, codes, values)
+
+
+# ---------- ⬇️ 크롤링 결과 DataFrame 전체 정규화 ----------
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    영상 결과마다 한 번 호출해서 모든 싱크가 같은 결과를 쓴다.
+    이미 정규화된 DataFrame은 그대로 돌려주고, 정규화된 컬럼을 다시 넣어도 값이 바뀌지 않는다.
+    """
+    if df.attrs.get(NORMALIZED_FLAG):
+        return df
+    df = df.copy()
+    for column in COUNT_COLUMNS:
+        if column in df:
+            df[column] = normalize_counts(df[column], field=column)
+    if "product_price" in df:
+        df["product_price"] = normalize_prices(df["product_price"])
+    if "product_count" in df:
+        df["product_count"] = pd.to_numeric(df["product_count"], errors="coerce").fillna(0).astype("int64")
+    if "description" in df:
+        df["description"] = normalize_descriptions(df["description"])
+    for column in DATE_COLUMNS:
+        if column in df:
+            df[column] = normalize_dates(df[column], field=column)
+    df.attrs[NORMALIZED_FLAG] = True
+    return df
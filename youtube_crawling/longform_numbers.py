@@ -0,0 +1,169 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling import longform_metrics as metrics
+# --------- 그 외 import한 목록 ---------------
+from datetime import datetime
+from functools import lru_cache
+import logging, re
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+
+# ---------- ⬇️ 숫자 단위 표 (조회수/구독자 수) ----------
+# 영어 UI("1.2K views", "3.4M subscribers")도 같은 표로 처리한다.
+UNIT_MULTIPLIERS = {
+    "천": 1_000,
+    "만": 10_000,
+    "억": 100_000_000,
+    "K": 1_000,
+    "M": 1_000_000,
+    "B": 1_000_000_000,
+}
+UNIT_CLASS = "".join(UNIT_MULTIPLIERS)
+
+# "1.2만", "1,234", "1억 2,345만" 의 각 덩어리
+COUNT_PATTERN = rf'(\d[\d,]*(?:\.\d+)?)\s*([{UNIT_CLASS}])?'
+COUNT_RE = re.compile(COUNT_PATTERN, re.IGNORECASE)
+# "₩12,000 ~ ₩15,000" 처럼 숫자가 여러 개면 첫 번째 가격만
+PRICE_PATTERN = r'(\d[\d,]*)'
+PRICE_RE = re.compile(PRICE_PATTERN)
+# 크롤러가 값을 못 찾았을 때 넣는 "조회수 없음", "구독자 수 없음", "날짜 없음"
+PLACEHOLDER_RE = re.compile(r'없음\s*$')
+
+# ---------- ⬇️ 날짜 형식 표: 위에서부터 먼저 맞는 형식을 쓴다 ----------
+DATE_PATTERNS = [
+    r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?',   # 2024. 1. 5.
+    r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',     # 2024년 1월 5일
+    r'(\d{4})-(\d{1,2})-(\d{1,2})',             # 2024-01-05 (microformat)
+    r'(\d{4})(\d{2})(\d{2})',                   # 20240105
+]
+DATE_RES = [re.compile(pattern) for pattern in DATE_PATTERNS]
+
+CACHE_SIZE = 4096
+
+
+# ---------- ⬇️ 파싱 실패 종류 ----------
+class KoreanParseError(ValueError):
+    """
+    reason:
+    - empty: 빈 값
+    - placeholder: 크롤러가 넣은 "... 없음"
+    - no_number: 숫자가 없음
+    - bad_date: 날짜 형식이 아니거나 존재하지 않는 날짜
+    """
+
+    def __init__(self, field: str, text, reason: str):
+        super().__init__(f"{field} 파싱 실패({reason}): {text!r}")
+        self.field = field
+        self.text = text
+        self.reason = reason
+
+
+def report_failure(error: KoreanParseError):
+    """엄격하지 않은 파서(parse_view_count 등)가 기본값을 쓸 때 원인을 지표로 남긴다."""
+    metrics.incr("parse_failure_total", field=error.field, reason=error.reason)
+    logger.debug(str(error))
+
+
+def _as_key(text) -> str | None:
+    """캐시 키로 쓸 문자열 (None, NaN은 None)"""
+    if text is None or text != text:
+        return None
+    return str(text)
+
+
+def _blank_reason(text: str | None) -> str | None:
+    if text is None or not text.strip():
+        return "empty"
+    if PLACEHOLDER_RE.search(text):
+        return "placeholder"
+    return None
+
+
+# ---------- ⬇️ 정수 부분/소수 부분을 나눠서 배수를 곱함 (부동소수점 오차 없음) ----------
+def _scaled(number: str, multiplier: int) -> int:
+    whole, _, fraction = number.replace(",", "").partition(".")
+    value = int(whole) * multiplier
+    if fraction:
+        value += int(fraction) * multiplier // 10 ** len(fraction)
+    return value
+
+
+# ---------- ⬇️ 캐시되는 실제 파싱: (값, 실패 이유) ----------
+@lru_cache(maxsize=CACHE_SIZE)
+def _count(text: str) -> tuple[int | None, str | None]:
+    if reason := _blank_reason(text):
+        return None, reason
+    matches = COUNT_RE.findall(text)
+    if not matches:
+        return None, "no_number"
+    # "1억 2,345만" 처럼 단위가 붙은 덩어리가 여러 개면 더하고, 아니면 첫 번째 숫자만
+    with_unit = [(number, unit) for number, unit in matches if unit]
+    if len(with_unit) > 1:
+        return sum(_scaled(number, UNIT_MULTIPLIERS[unit.upper()]) for number, unit in with_unit), None
+    number, unit = matches[0]
+    return _scaled(number, UNIT_MULTIPLIERS[unit.upper()] if unit else 1), None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _price(text: str) -> tuple[int | None, str | None]:
+    if reason := _blank_reason(text):
+        return None, reason
+    match = PRICE_RE.search(text)
+    if not match:
+        return None, "no_number"
+    return int(match.group(1).replace(",", "")), None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _date(text: str) -> tuple[datetime | None, str | None]:
+    if reason := _blank_reason(text):
+        return None, reason
+    for pattern in DATE_RES:
+        if match := pattern.search(text):
+            year, month, day = map(int, match.groups())
+            try:
+                return datetime(year, month, day), None
+            except ValueError:
+                return None, "bad_date"
+    return None, "bad_date"
+
+
+def _unwrap(result: tuple, field: str, text):
+    value, reason = result
+    if reason:
+        raise KoreanParseError(field, text, reason)
+    return value
+
+
+# ---------- ⬇️ 엄격한 파서: 실패하면 KoreanParseError ----------
+def parse_count(text, field: str = "count") -> int:
+    """'조회수 1,234회' -> 1234, '구독자 1.2만명' -> 12000, '1.2억' -> 120000000"""
+    if isinstance(text, int):
+        return text
+    return _unwrap(_count(_as_key(text)), field, text)
+
+
+def parse_krw(text, field: str = "price") -> int:
+    """'₩12,000' -> 12000, '₩12,000 ~ ₩15,000' -> 12000"""
+    if isinstance(text, int):
+        return text
+    return _unwrap(_price(_as_key(text)), field, text)
+
+
+def parse_korean_date(text, field: str = "date") -> datetime:
+    """'2024. 1. 5.', '2024년 1월 5일', '2024-01-05', '20240105' -> datetime"""
+    if isinstance(text, datetime):
+        return text
+    return _unwrap(_date(_as_key(text)), field, text)
+
+
+def cache_info() -> dict:
+    return {name: fn.cache_info() for name, fn in (("count", _count), ("price", _price), ("date", _date))}
+
+
+def cache_clear():
+    for fn in (_count, _price, _date):
+        fn.cache_clear()
@@ -0,0 +1,146 @@
+# --------- 그 외 import한 목록 ---------------
+from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+import logging
+
+try:
+    import lxml  # noqa: F401  (BeautifulSoup의 lxml 트리 빌더)
+except ImportError:  # lxml은 'lxml' 파서를 쓸 때만 필요
+    lxml = None
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:  # selectolax는 'selectolax' 파서를 쓸 때만 필요
+    SelectolaxParser = None
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+
+# ---------- ⬇️ 시청 페이지에서 실제로 읽는 영역 (subtree 모드에서 브라우저가 이 노드만 넘겨줌) ----------
+WATCH_SUBTREE_SELECTORS = [
+    "ytd-watch-metadata",                   # 제목, 채널명, 구독자 수, 조회수, 업로드일, 설명란
+    "ytd-video-primary-info-renderer",      # (구 레이아웃) 제목, 조회수, 업로드일
+    "ytd-video-secondary-info-renderer",    # (구 레이아웃) 채널명, 구독자 수, 설명란
+    "ytd-merch-shelf-renderer",             # 제품 섹션
+]
+
+# 선택된 노드 중 다른 노드 안에 들어있는 것은 빼고 outerHTML만 이어붙임
+SUBTREE_SCRIPT = """
+var roots = [];
+arguments[0].forEach(function (selector) {
+    document.querySelectorAll(selector).forEach(function (node) {
+        if (!roots.some(function (root) { return root.contains(node) || node.contains(root); })) {
+            roots.push(node);
+        }
+    });
+});
+return roots.map(function (node) { return node.outerHTML; }).join("");
+"""
+
+
+# ---------- ⬇️ 파서 종류와 상관없이 같은 방식으로 쓰는 노드 ----------
+class SoupNode:
+    """BeautifulSoup(html.parser / lxml) 노드"""
+
+    def __init__(self, node):
+        self.node = node
+
+    def select_one(self, selector: str):
+        found = self.node.select_one(selector)
+        return SoupNode(found) if found is not None else None
+
+    def select(self, selector: str) -> list:
+        return [SoupNode(found) for found in self.node.select(selector)]
+
+    def text(self, strip: bool = False) -> str:
+        return self.node.get_text(strip=True) if strip else self.node.get_text().strip()
+
+    def attr(self, name: str) -> str | None:
+        return self.node.get(name)
+
+
+class SelectolaxNode:
+    """selectolax(Lexbor) 노드"""
+
+    def __init__(self, node):
+        self.node = node
+
+    def select_one(self, selector: str):
+        found = self.node.css_first(selector)
+        return SelectolaxNode(found) if found is not None else None
+
+    def select(self, selector: str) -> list:
+        return [SelectolaxNode(found) for found in self.node.css(selector)]
+
+    def text(self, strip: bool = False) -> str:
+        return self.node.text(strip=True) if strip else self.node.text().strip()
+
+    def attr(self, name: str) -> str | None:
+        return self.node.attributes.get(name)
+
+
+def _parse_soup(html: str, features: str) -> SoupNode:
+    return SoupNode(BeautifulSoup(html, features))
+
+
+def _parse_lxml(html: str) -> SoupNode:
+    if lxml is None:
+        raise ImproperlyConfigured("'lxml' 파서에는 lxml이 필요합니다. (pip install lxml)")
+    return _parse_soup(html, "lxml")
+
+
+def _parse_selectolax(html: str) -> SelectolaxNode:
+    if SelectolaxParser is None:
+        raise ImproperlyConfigured("'selectolax' 파서에는 selectolax가 필요합니다. (pip install selectolax)")
+    return SelectolaxNode(SelectolaxParser(html).root)
+
+
+PARSERS = {
+    "html.parser": lambda html: _parse_soup(html, "html.parser"),
+    "lxml": _parse_lxml,
+    "selectolax": _parse_selectolax,
+}
+
+
+def default_parser() -> str:
+    """설치된 것 중 가장 빠른 파서"""
+    if SelectolaxParser is not None:
+        return "selectolax"
+    if lxml is not None:
+        return "lxml"
+    return "html.parser"
+
+
+# ---------- ⬇️ HTML 문자열을 설정된 파서로 파싱 ----------
+def parse_html(html: str, parser: str = None):
+    parser = parser or getattr(settings, "CRAWLER_HTML_PARSER", None) or default_parser()
+    if parser not in PARSERS:
+        raise ImproperlyConfigured(f"알 수 없는 HTML 파서입니다: {parser} (가능: {', '.join(PARSERS)})")
+    return PARSERS[parser](html)
+
+
+# ---------- ⬇️ 브라우저에서 필요한 영역만 꺼내오기 ----------
+def watch_page_html(driver, subtree: bool = None) -> str:
+    """
+    subtree 모드면 WATCH_SUBTREE_SELECTORS 노드의 outerHTML만 가져오고,
+    꺼내올 노드가 없거나 스크립트가 실패하면 전체 page_source를 쓴다.
+    """
+    if subtree is None:
+        subtree = getattr(settings, "CRAWLER_HTML_SUBTREE", True)
+    if subtree:
+        try:
+            fragment = driver.execute_script(SUBTREE_SCRIPT, WATCH_SUBTREE_SELECTORS)
+            if fragment:
+                return f"<html><body>{fragment}</body></html>"
+        except Exception as e:
+            logger.warning(f"⚠️ 필요한 영역만 가져오기 실패, 전체 페이지를 파싱합니다: {e}")
+    return driver.page_source
+
+
+# ---------- ⬇️ 시청 페이지를 가져와서 파싱 ----------
+def parse_watch_page(driver, parser: str = None, subtree: bool = None):
+    return parse_html(watch_page_html(driver, subtree), parser)
@@ -0,0 +1,451 @@
+# --------- 프로젝트에서 import한 목록 ---------------
+from youtube_crawling import longform_metrics as metrics
+# --------- 그 외 import한 목록 ---------------
+from contextlib import asynccontextmanager, contextmanager
+from django.conf import settings
+import asyncio, collections, logging, threading, time, urllib.parse, uuid, weakref
+
+try:
+    import redis
+except ImportError:  # redis가 없으면 프로세스 안에서만 제한
+    redis = None
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "crawler:rate"
+STATE_TTL = 24 * 60 * 60  # 한동안 안 쓰인 호스트 상태는 Redis에서 자동 삭제
+
+# 차단 신호: 429, 동의(consent) 페이지, ytInitialData 없는 HTML
+CONSENT_MARKERS = ("consent.youtube.com", "consent.google.com")
+BLOCK_STATUS_CODES = (429,)
+
+
+# ---------- ⬇️ 설정값 ----------
+def limiter_config() -> dict:
+    return {
+        "initial": float(getattr(settings, "CRAWLER_RATE_INITIAL", 2.0)),
+        "min": float(getattr(settings, "CRAWLER_RATE_MIN", 0.2)),
+        "max": float(getattr(settings, "CRAWLER_RATE_MAX", 20.0)),
+        "increase": float(getattr(settings, "CRAWLER_RATE_INCREASE", 0.1)),
+        "decrease": float(getattr(settings, "CRAWLER_RATE_DECREASE", 0.5)),
+        "cooldown": float(getattr(settings, "CRAWLER_RATE_BLOCK_COOLDOWN", 30)),
+        "max_in_flight": int(getattr(settings, "CRAWLER_RATE_MAX_IN_FLIGHT", 8)),
+        "lease": float(getattr(settings, "CRAWLER_RATE_LEASE_SECONDS", 120)),
+    }
+
+
+# ---------- ⬇️ Redis 백엔드: 모든 워커 프로세스/머신이 호스트별 상태를 공유 ----------
+# 시간은 Redis 서버의 TIME을 써서 머신 간 시계 차이에 영향받지 않는다.
+# Lua가 소수를 정수로 바꿔 돌려주므로 대기 시간은 문자열로 반환한다.
+ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local initial, ttl = tonumber(ARGV[1]), tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'rate', 'tokens', 'ts', 'cooldown_until')
+local rate = tonumber(state[1]) or initial
+local burst = math.max(1, rate)
+local tokens = tonumber(state[2]) or burst
+local ts = tonumber(state[3]) or now
+local cooldown_until = tonumber(state[4]) or 0
+if now < cooldown_until then
+    return tostring(cooldown_until - now)
+end
+tokens = math.min(burst, tokens + (now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'rate', rate, 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], ttl)
+return tostring(wait)
+"""
+
+# AIMD: 정상 응답이면 rate += increase / rate (초당 약 increase 만큼 증가), 차단 신호면 rate *= decrease 후 cooldown
+FEEDBACK_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local blocked = ARGV[1] == '1'
+local initial, increase, decrease = tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+local min_rate, max_rate, cooldown, ttl = tonumber(ARGV[5]), tonumber(ARGV[6]), tonumber(ARGV[7]), tonumber(ARGV[8])
+local rate = tonumber(redis.call('HGET', KEYS[1], 'rate')) or initial
+if blocked then
+    rate = math.max(min_rate, rate * decrease)
+    redis.call('HSET', KEYS[1], 'cooldown_until', now + cooldown, 'tokens', 0, 'ts', now + cooldown)
+else
+    rate = math.min(max_rate, rate + increase / rate)
+end
+redis.call('HSET', KEYS[1], 'rate', rate)
+redis.call('EXPIRE', KEYS[1], ttl)
+return tostring(rate)
+"""
+
+# 동시에 처리 중인 요청 수: lease가 지난 항목(죽은 워커)은 자동으로 빠진다
+ENTER_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[1])
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[3])))
+return 1
+"""
+
+
+class RedisLimiterBackend:
+    blocking = True  # 네트워크 호출이라 asyncio 에서는 스레드에서 실행
+
+    def __init__(self, client):
+        self.client = client
+        self._acquire = client.register_script(ACQUIRE_SCRIPT)
+        self._feedback = client.register_script(FEEDBACK_SCRIPT)
+        self._enter = client.register_script(ENTER_SCRIPT)
+
+    def try_acquire(self, host: str, config: dict) -> float:
+        return float(self._acquire(keys=[f"{KEY_PREFIX}:{host}"], args=[config["initial"], STATE_TTL]))
+
+    def feedback(self, host: str, blocked: bool, config: dict) -> float:
+        return float(self._feedback(
+            keys=[f"{KEY_PREFIX}:{host}"],
+            args=[
+                "1" if blocked else "0", config["initial"], config["increase"], config["decrease"],
+                config["min"], config["max"], config["cooldown"], STATE_TTL,
+            ],
+        ))
+
+    def enter(self, host: str, token: str, config: dict) -> bool:
+        return bool(self._enter(
+            keys=[f"{KEY_PREFIX}:{host}:in_flight"], args=[token, config["max_in_flight"], config["lease"]],
+        ))
+
+    def leave(self, host: str, token: str):
+        self.client.zrem(f"{KEY_PREFIX}:{host}:in_flight", token)
+
+
+# ---------- ⬇️ 로컬 백엔드: Redis를 못 쓸 때 같은 알고리즘을 프로세스 안에서만 ----------
+class LocalLimiterBackend:
+    blocking = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.states = {}     # host -> {"rate", "tokens", "ts", "cooldown_until"}
+        self.in_flight = {}  # host -> {token: lease 만료 시각}
+
+    def _state(self, host: str, config: dict, now: float) -> dict:
+        rate = config["initial"]
+        return self.states.setdefault(host, {"rate": rate, "tokens": max(1.0, rate), "ts": now, "cooldown_until": 0.0})
+
+    def try_acquire(self, host: str, config: dict) -> float:
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(host, config, now)
+            if now < state["cooldown_until"]:
+                return state["cooldown_until"] - now
+            state["tokens"] = min(max(1.0, state["rate"]), state["tokens"] + (now - state["ts"]) * state["rate"])
+            state["ts"] = now
+            if state["tokens"] >= 1:
+                state["tokens"] -= 1
+                return 0.0
+            return (1 - state["tokens"]) / state["rate"]
+
+    def feedback(self, host: str, blocked: bool, config: dict) -> float:
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(host, config, now)
+            if blocked:
+                state["rate"] = max(config["min"], state["rate"] * config["decrease"])
+                state["cooldown_until"] = now + config["cooldown"]
+                state["tokens"], state["ts"] = 0.0, now + config["cooldown"]
+            else:
+                state["rate"] = min(config["max"], state["rate"] + config["increase"] / state["rate"])
+            return state["rate"]
+
+    def enter(self, host: str, token: str, config: dict) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            holders = {t: expiry for t, expiry in self.in_flight.get(host, {}).items() if expiry > now}
+            if len(holders) >= config["max_in_flight"]:
+                self.in_flight[host] = holders
+                return False
+            holders[token] = now + config["lease"]
+            self.in_flight[host] = holders
+            return True
+
+    def leave(self, host: str, token: str):
+        with self._lock:
+            self.in_flight.get(host, {}).pop(token, None)
+
+
+# ---------- ⬇️ Redis가 중간에 끊겨도 요청이 실패하지 않도록 로컬 백엔드로 잠시 대체 ----------
+class FailoverLimiterBackend:
+    """
+    Redis 연결/타임아웃 에러가 나면 RETRY_SECONDS 동안은 프로세스 안에서만 제한하고,
+    그 뒤 다음 요청에서 Redis를 다시 시도한다.
+    """
+    RETRY_SECONDS = 30
+
+    def __init__(self, primary, fallback=None, down: bool = False):
+        self.primary = primary
+        self.fallback = fallback or LocalLimiterBackend()
+        self.down_until = time.monotonic() + self.RETRY_SECONDS if down else 0.0
+
+    def _primary_up(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    @property
+    def blocking(self) -> bool:
+        # Redis가 끊긴 동안은 로컬 백엔드만 쓰므로 스레드로 넘길 필요가 없다
+        return self._primary_up()
+
+    def _call(self, name: str, *args):
+        if self._primary_up():
+            try:
+                return getattr(self.primary, name)(*args)
+            except (redis.ConnectionError, redis.TimeoutError) as e:
+                self.down_until = time.monotonic() + self.RETRY_SECONDS
+                metrics.incr("rate_limit_backend_errors_total")
+                logger.warning(f"⚠️ Redis 연결 실패, {self.RETRY_SECONDS}초 동안 프로세스 안에서만 요청 속도를 제한합니다: {e}")
+        return getattr(self.fallback, name)(*args)
+
+    def try_acquire(self, host: str, config: dict) -> float:
+        return self._call("try_acquire", host, config)
+
+    def feedback(self, host: str, blocked: bool, config: dict) -> float:
+        return self._call("feedback", host, blocked, config)
+
+    def enter(self, host: str, token: str, config: dict) -> bool:
+        return self._call("enter", host, token, config)
+
+    def leave(self, host: str, token: str):
+        # 자리를 어느 백엔드에서 받았는지 모르므로 둘 다 반환 (Redis 자리는 못 지워도 lease 가 지나면 빠짐)
+        self.fallback.leave(host, token)
+        if self._primary_up():
+            try:
+                self.primary.leave(host, token)
+            except (redis.ConnectionError, redis.TimeoutError):
+                pass
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+# ---------- ⬇️ 프로세스당 한 번 백엔드 결정 ----------
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _connect_backend()
+    return _backend
+
+
+def _connect_backend():
+    url = getattr(settings, "CRAWLER_RATE_REDIS_URL", None) or getattr(settings, "CELERY_BROKER_URL", None)
+    if redis is not None and url:
+        try:
+            client = redis.Redis.from_url(url, socket_timeout=2, socket_connect_timeout=2)
+        except ValueError as e:
+            logger.warning(f"⚠️ Redis URL이 올바르지 않아 프로세스 안에서만 요청 속도를 제한합니다: {e}")
+            return LocalLimiterBackend()
+        try:
+            client.ping()
+            logger.info(f"🚦 호스트별 요청 속도 제한을 Redis로 공유: {url}")
+            return FailoverLimiterBackend(RedisLimiterBackend(client))
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ Redis 연결 실패, 다시 연결될 때까지 프로세스 안에서만 요청 속도를 제한합니다: {e}")
+            return FailoverLimiterBackend(RedisLimiterBackend(client), down=True)
+    return LocalLimiterBackend()
+
+
+def host_of(url: str) -> str:
+    return urllib.parse.urlsplit(url).netloc or "unknown"
+
+
+# ---------- ⬇️ 요청 한 번의 결과를 limiter에 알려주는 객체 ----------
+class Feedback:
+    def __init__(self):
+        self.reason = None
+        self.reported = False
+
+    def ok(self):
+        self.reported = True
+
+    def blocked(self, reason: str):
+        self.reason = reason
+        self.reported = True
+
+
+# ---------- ⬇️ 모든 페이지 요청이 거쳐가는 관문 ----------
+@contextmanager
+def throttle(url: str):
+    """
+    동시 요청 수에 자리가 나고 토큰이 생길 때까지 기다린 뒤 요청을 허용한다.
+    블록 안에서 feedback.blocked(reason)을 부르면 해당 호스트의 속도를 줄이고 잠시 멈춘다.
+    정상적으로 끝나면 속도를 조금씩 올리고, 예외가 나면(네트워크 오류 등) 속도는 그대로 둔다.
+    """
+    if not getattr(settings, "CRAWLER_RATE_LIMIT", True):
+        yield Feedback()
+        return
+
+    config = limiter_config()
+    backend = get_backend()
+    host = host_of(url)
+    token = uuid.uuid4().hex
+    with metrics.span("rate_limit_slot_wait", host=host):
+        while not backend.enter(host, token, config):
+            time.sleep(0.1)
+    try:
+        with metrics.span("rate_limit_wait", host=host):
+            while (wait := backend.try_acquire(host, config)) > 0:
+                time.sleep(min(wait, 1.0))
+        feedback = Feedback()
+        yield feedback
+        report_feedback(backend, host, feedback, config)
+    finally:
+        backend.leave(host, token)
+
+
+# ---------- ⬇️ asyncio 크롤링용 관문 (대기 중에 이벤트 루프를 막지 않음) ----------
+@asynccontextmanager
+async def athrottle(url: str):
+    """
+    throttle 과 같은 규칙. 대기는 asyncio.sleep 으로 하고,
+    Redis 호출처럼 블로킹되는 백엔드 호출은 asyncio.to_thread 로 이벤트 루프 밖에서 실행한다.
+    자리 얻기 + 첫 토큰, 결과 보고 + 자리 반납을 한 번에 보내서 요청 하나에 스레드 왕복은 보통 두 번이다.
+    로컬 백엔드는 잠깐 락만 잡으므로 이벤트 루프에서 바로 부른다.
+    """
+    if not getattr(settings, "CRAWLER_RATE_LIMIT", True):
+        yield Feedback()
+        return
+
+    config = limiter_config()
+    backend = get_backend()
+    host = host_of(url)
+    token = uuid.uuid4().hex
+    with metrics.span("rate_limit_slot_wait", host=host):
+        while (wait := await _offload(backend, enter_and_acquire, backend, host, token, config)) is None:
+            await _wait_for_slot(host)
+    left = False
+    try:
+        with metrics.span("rate_limit_wait", host=host):
+            while wait > 0:
+                await asyncio.sleep(min(wait, 1.0))
+                wait = await _offload(backend, backend.try_acquire, host, config)
+        feedback = Feedback()
+        yield feedback
+        left = True  # report_and_leave 가 실패하거나 취소돼도 자리는 그 안에서 반납
+        await _offload(backend, report_and_leave, backend, host, token, feedback, config)
+    finally:
+        if not left:
+            await _offload(backend, backend.leave, host, token)
+        _wake_slot_waiter(host)
+
+
+async def _offload(backend, func, *args):
+    if getattr(backend, "blocking", True):
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+def enter_and_acquire(backend, host: str, token: str, config: dict) -> float | None:
+    """자리를 못 얻으면 None, 얻었으면 첫 토큰까지 기다릴 시간"""
+    if not backend.enter(host, token, config):
+        return None
+    try:
+        return backend.try_acquire(host, config)
+    except BaseException:
+        backend.leave(host, token)
+        raise
+
+
+def report_and_leave(backend, host: str, token: str, feedback: Feedback, config: dict):
+    try:
+        report_feedback(backend, host, feedback, config)
+    finally:
+        backend.leave(host, token)
+
+
+# ---------- ⬇️ 자리가 날 때까지 기다리는 코루틴들 (이벤트 루프별, 호스트별 FIFO) ----------
+# 같은 루프에서 자리를 반납하면 바로 깨우고, 다른 프로세스/스레드가 반납한 자리는 SLOT_RECHECK_SECONDS 마다 다시 확인
+SLOT_RECHECK_SECONDS = 0.5
+_slot_waiters = weakref.WeakKeyDictionary()  # loop -> {host: deque[Future]}
+
+
+async def _wait_for_slot(host: str):
+    loop = asyncio.get_running_loop()
+    waiters = _slot_waiters.setdefault(loop, {}).setdefault(host, collections.deque())
+    waiter = loop.create_future()
+    waiters.append(waiter)
+    try:
+        await asyncio.wait_for(waiter, SLOT_RECHECK_SECONDS)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        if waiter in waiters:
+            waiters.remove(waiter)
+
+
+def _wake_slot_waiter(host: str):
+    waiters = _slot_waiters.get(asyncio.get_running_loop(), {}).get(host)
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+
+
+def report_feedback(backend, host: str, feedback: Feedback, config: dict):
+    rate = backend.feedback(host, feedback.reason is not None, config)
+    if feedback.reason:
+        metrics.incr("rate_limit_blocked_total", host=host, reason=feedback.reason)
+        logger.warning(f"🛑 차단 신호({feedback.reason}) - {host} 요청 속도를 초당 {rate:.2f}회로 낮추고 {config['cooldown']:.0f}초 대기")
+
+
+# ---------- ⬇️ 응답이 차단 신호인지 판단 ----------
+def block_reason(status_code: int, final_url: str, has_initial_data: bool = None) -> str | None:
+    """has_initial_data가 None이면 ytInitialData는 확인하지 않는다 (JSON 응답 등)"""
+    if status_code in BLOCK_STATUS_CODES:
+        return f"http_{status_code}"
+    if any(marker in (final_url or "") for marker in CONSENT_MARKERS):
+        return "consent"
+    if has_initial_data is False:
+        return "no_initial_data"
+    return None
+
+
+# ---------- ⬇️ requests 세션 요청을 limiter를 거쳐서 보내기 ----------
+def throttled_request(session, method: str, url: str, expect_initial_data: bool = False, **kwargs):
+    with throttle(url) as feedback:
+        response = session.request(method, url, **kwargs)
+        has_data = "ytInitialData" in response.text if expect_initial_data and response.ok else None
+        if reason := block_reason(response.status_code, response.url, has_data):
+            feedback.blocked(reason)
+        return response
+
+
+# ---------- ⬇️ httpx.AsyncClient 요청을 limiter를 거쳐서 보내기 ----------
+async def athrottled_request(client, method: str, url: str, expect_initial_data: bool = False, **kwargs):
+    async with athrottle(url) as feedback:
+        response = await client.request(method, url, **kwargs)
+        has_data = "ytInitialData" in response.text if expect_initial_data and response.is_success else None
+        if reason := block_reason(response.status_code, str(response.url), has_data):
+            feedback.blocked(reason)
+        return response
+
+
+# ---------- ⬇️ Selenium driver.get 을 limiter를 거쳐서 보내기 ----------
+def throttled_get(driver, url: str, expect_initial_data: bool = False):
+    with throttle(url) as feedback:
+        driver.get(url)
+        has_data = None
+        if expect_initial_data:
+            has_data = bool(driver.execute_script("return typeof window.ytInitialData !== 'undefined' && !!window.ytInitialData;"))
+        if reason := block_reason(200, driver.current_url, has_data):
+            feedback.blocked(reason)
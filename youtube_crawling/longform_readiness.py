@@ -0,0 +1,145 @@
+# --------- selenium에서 import한 목록 ---------------
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+# --------- 그 외 import한 목록 ---------------
+from django.conf import settings
+import logging, time
+
+
+# ---------- ⬇️ logging 설정 ----------
+
+logger = logging.getLogger(__name__)
+
+# ---------- ⬇️ 단계별 기본 최대 대기 시간(초) ----------
+DEFAULT_STEP_TIMEOUTS = {
+    "page_load": 15,    # document.readyState == complete
+    "metadata": 10,     # 제목/채널 영역 렌더링
+    "scroll": 10,       # 설명란/제품 섹션 lazy-load 스크롤
+    "expand": 5,        # 더보기 클릭 후 네트워크 안정화
+    "merch_shelf": 3,   # 제품 섹션 (없는 영상이 많아서 짧게)
+}
+POLL_INTERVAL = 0.2
+
+
+# ---------- ⬇️ 영상 한 개에 쓸 수 있는 대기 시간 예산 ----------
+class StepBudget:
+    """
+    영상 한 개를 크롤링할 때 쓸 수 있는 전체 대기 시간과 단계별 최대 대기 시간.
+    각 단계는 min(단계별 최대 대기 시간, 남은 전체 예산) 만큼만 기다린다.
+    """
+
+    def __init__(self, total: float = None, step_timeouts: dict = None):
+        self.total = total if total is not None else getattr(settings, "CRAWLER_PAGE_BUDGET", 40)
+        self.step_timeouts = {
+            **DEFAULT_STEP_TIMEOUTS,
+            **(step_timeouts or getattr(settings, "CRAWLER_WAIT_TIMEOUTS", {})),
+        }
+        self.started = time.monotonic()
+
+    def remaining(self) -> float:
+        return max(0.0, self.total - (time.monotonic() - self.started))
+
+    def timeout(self, step: str) -> float:
+        return min(self.step_timeouts.get(step, self.total), self.remaining())
+
+
+# ---------- ⬇️ 문서 로딩 완료 대기 ----------
+def wait_for_document_ready(driver, timeout: float) -> bool:
+    if timeout <= 0:
+        return False
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        return True
+    except TimeoutException:
+        logger.info(f"⏱️ 문서 로딩 대기 시간 초과 ({timeout:.1f}초)")
+        return False
+
+
+# ---------- ⬇️ 셀렉터 중 하나라도 나타날 때까지 대기 ----------
+def wait_for_any(driver, selectors: list[str], timeout: float, clickable: bool = False):
+    """셀렉터 중 먼저 나타난 요소를 반환하고, 시간 안에 못 찾으면 None"""
+    if timeout <= 0:
+        return None
+
+    def _find(d):
+        for selector in selectors:
+            for elem in d.find_elements(By.CSS_SELECTOR, selector):
+                if not clickable or (elem.is_displayed() and elem.is_enabled()):
+                    return elem
+        return False
+
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=POLL_INTERVAL,
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(_find)
+    except TimeoutException:
+        return None
+
+
+# ---------- ⬇️ 네트워크 요청이 잠잠해질 때까지 대기 ----------
+def wait_for_network_idle(driver, timeout: float, idle_time: float = 0.5) -> bool:
+    """리소스 요청 수가 idle_time 동안 늘지 않으면 네트워크가 안정됐다고 판단"""
+    if timeout <= 0:
+        return False
+    state = {"count": -1, "since": time.monotonic()}
+
+    def _idle(d):
+        count = d.execute_script("return performance.getEntriesByType('resource').length;")
+        now = time.monotonic()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return now - state["since"] >= idle_time
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(_idle)
+        return True
+    except TimeoutException:
+        logger.info(f"⏱️ 네트워크 안정화 대기 시간 초과 ({timeout:.1f}초)")
+        return False
+
+
+# ---------- ⬇️ lazy-load 영역이 나타날 때까지 조금씩 스크롤 ----------
+def scroll_until_present(driver, selectors: list[str], timeout: float, step: int = 500, max_scroll: int = 2500) -> bool:
+    """
+    step 픽셀씩 스크롤하면서 셀렉터 중 하나가 DOM에 생기면 True.
+    페이지 끝이나 max_scroll에 닿으면 더 스크롤하지 않고 False.
+    """
+    if timeout <= 0:
+        return False
+    state = {"scrolled": 0}
+
+    def _present(d):
+        for selector in selectors:
+            if d.find_elements(By.CSS_SELECTOR, selector):
+                return "found"
+        if state["scrolled"] >= max_scroll:
+            return "limit"
+        at_bottom = d.execute_script(
+            "window.scrollBy(0, arguments[0]);"
+            "return window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 2;",
+            step,
+        )
+        state["scrolled"] += step
+        return "bottom" if at_bottom else False
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(_present) == "found"
+    except TimeoutException:
+        return False
+
+
+# ---------- ⬇️ 클릭 가능한 요소를 찾아서 클릭 ----------
+def click_first_clickable(driver, selectors: list[str], timeout: float) -> bool:
+    elem = wait_for_any(driver, selectors, timeout, clickable=True)
+    if elem is None:
+        return False
+    try:
+        driver.execute_script("arguments[0].click();", elem)
+        return True
+    except StaleElementReferenceException:
+        return False
@@ -0,0 +1,60 @@
+# ---------- ⬇️ 크롤링 결과 row 스키마 (Selenium / HTTP 백엔드 공용) ----------
+
+ROW_COLUMNS = [
+    "youtube_id",
+    "title",
+    "channel_name",
+    "subscribers",
+    "view_count",
+    "upload_date",
+    "extracted_date",
+    "video_url",
+    "description",
+    "product_count",
+    "product_name",
+    "product_price",
+    "product_image_url",
+    "product_merchant_url",
+    "product_merchant",
+]
+
+
+# ---------- ⬇️ 영상 정보 + 제품 목록을 제품별 row 목록으로 변환 ----------
+def build_video_rows(video_id: str, video_url: str, info: dict, products: list[dict], extracted_date: str) -> list[dict]:
+    """
+    info: title, channel_name, subscribers, view_count, upload_date, description, product_count
+    products: extract_products_from_dom 형식의 dict 목록 (title, price, imageUrl, url, merchant)
+    제품이 없으면 영상 기본 정보만 담은 row 한 개를 만든다.
+    """
+    base = {
+        "youtube_id": video_id,
+        "title": info.get("title", ""),
+        "channel_name": info.get("channel_name", ""),
+        "subscribers": info.get("subscribers", ""),
+        "view_count": info.get("view_count", ""),
+        "upload_date": info.get("upload_date", ""),
+        "extracted_date": extracted_date,
+        "video_url": video_url,
+        "description": info.get("description", ""),
+        "product_count": info.get("product_count", 0),
+    }
+    if not products:
+        return [{
+            **base,
+            "product_name": "",
+            "product_price": "",
+            "product_image_url": "",
+            "product_merchant_url": "",
+            "product_merchant": "",
+        }]
+    return [
+        {
+            **base,
+            "product_name": product.get("title", ""),
+            "product_price": product.get("price", ""),
+            "product_image_url": product.get("imageUrl", ""),
+            "product_merchant_url": product.get("url", ""),
+            "product_merchant": product.get("merchant", ""),
+        }
+        for product in products
+    ]
@@ -1,33 +1,154 @@
-from celery import shared_task
-from youtube_crawling.longform_crawler import crawl_channel_videos
-import logging, time, os
+from celery import shared_task, chord, group
+from celery.signals import worker_process_init, worker_process_shutdown
+from django.conf import settings
+from selenium.common.exceptions import WebDriverException
+from youtube_crawling.longform_crawler import (
+    DBBatchWriter, build_export_sinks, crawl_single_video, discover_channel, run_sinks, video_id_from_url,
+)
+from youtube_crawling.longform_export import safe_channel_name
+from youtube_crawling.longform_checkpoints import get_resumable_job, create_job, claim_videos, claim_heartbeat, heartbeat, mark_done, finish_run
+from youtube_crawling.longform_browser import get_pool, close_pool
+from youtube_crawling.models import CrawlJob
+from youtube_crawling import longform_metrics as metrics
+from datetime import date
+import pandas as pd
+import logging, os, uuid
 
 logger = logging.getLogger(__name__)
 
-@shared_task
-def crawl_channels_task():
-    channel_urls = [
-        "https://www.youtube.com/@%EC%B9%A1%EC%B4%89",
-    ]
-    export_dir = "./crawling_result_csv/"
-    os.makedirs(export_dir, exist_ok=True)
+DEFAULT_EXPORT_DIR = "./crawling_result_csv/"
 
-    for url in channel_urls:
+
+# ---------- ⬇️ 워커 프로세스가 뜰 때 크롬 세션을 미리 띄우고, 내려갈 때 정리 ----------
+@worker_process_init.connect
+def warm_browser_pool(**kwargs):
+    count = getattr(settings, "CRAWLER_BROWSER_WARM_SESSIONS", 0)
+    if count:
         try:
-            logger.info(f"🚀 채널 시작: {url}")
-            
-            # 크롤링 시작 전 충분한 대기 시간 확보
-            logger.info("⏳ 페이지 로딩 대기 중...")
-            time.sleep(5)  # 5초로 증가
-            
-            crawl_channel_videos(url, export_dir)
-            
-            logger.info(f"✅ 채널 완료: {url}")
-            
-            # 다음 채널 크롤링 전 대기
-            logger.info("⏳ 다음 채널 크롤링 전 대기 중...")
-            time.sleep(5)  # 5초로 증가
-            
+            get_pool().warm(count)
+            logger.info(f"🔥 크롬 세션 {count}개 미리 실행")
         except Exception as e:
-            logger.error(f"❌ 오류 발생 - {url}: {e}")
-            logger.error("상세 에러:", exc_info=True)
+            logger.warning(f"⚠️ 크롬 세션 미리 실행 실패: {e}")
+
+
+@worker_process_shutdown.connect
+def shutdown_browser_pool(**kwargs):
+    close_pool()
+
+
+def run_name(channel_url: str) -> str:
+    return safe_channel_name(channel_url.rstrip("/").split("/")[-1])
+
+
+# ---------- ⬇️ 1단계: 채널 영상 ID 수집 후 영상별 태스크로 나눠서 실행 ----------
+@shared_task(acks_late=True)
+def discover_channel_task(channel_url: str, save_path: str = DEFAULT_EXPORT_DIR, incremental: bool = None,
+                          limit: int = None, since: str = None, backend: str = None):
+    """
+    영상 ID를 수집해서 CrawlJob(체크포인트)에 기록하고
+    chord(영상별 crawl_video_task) -> finalize_channel_task 를 실행한다.
+    같은 채널의 진행 중인 작업이 있으면 수집을 건너뛰고 남은 영상만 이어서 실행한다.
+    since: YYYY-MM-DD (JSON 직렬화 때문에 문자열로 받음)
+    """
+    if incremental is None:
+        incremental = getattr(settings, "CRAWLER_INCREMENTAL", False)
+    backend = backend or getattr(settings, "CRAWLER_BACKEND", "selenium")
+
+    # 실행 지표는 여기서 시작해서 finalize_channel_task 가 영상 태스크 지표와 합쳐 저장 (/metrics)
+    run_metrics = metrics.start_run()
+    with metrics.span("discover_channel"):
+        job = get_resumable_job(channel_url)
+        if job is None:
+            channel_name, video_urls = discover_channel(
+                channel_url, incremental, limit, date.fromisoformat(since) if since else None
+            )
+            if not video_urls:
+                metrics.dump_run(run_metrics, run_name(channel_url))
+                return {"channel_url": channel_url, "videos": 0}
+            job = create_job(channel_url, channel_name, [video_id_from_url(url) for url in video_urls])
+
+        owner = uuid.uuid4().hex
+        video_ids = claim_videos(job, owner)
+    if not video_ids:
+        finish_run(job, [])
+        metrics.dump_run(run_metrics, run_name(channel_url))
+        return {"channel_url": channel_url, "job_id": job.id, "videos": 0}
+
+    os.makedirs(save_path, exist_ok=True)
+    chord(
+        group(crawl_video_task.s(video_id, backend, job.id, owner) for video_id in video_ids)
+    )(finalize_channel_task.s(job.id, video_ids, save_path, run_metrics.to_dict(), owner))
+    logger.info(f"🚚 영상 태스크 {len(video_ids)}개 분배: {channel_url}")
+    return {"channel_url": channel_url, "job_id": job.id, "videos": len(video_ids)}
+
+
+# ---------- ⬇️ 2단계: 영상 한 개 크롤링 (여러 워커 노드에 분산) ----------
+@shared_task(bind=True, acks_late=True)
+def crawl_video_task(self, video_id: str, backend: str = None, job_id: int = None, owner: str = None) -> dict:
+    """
+    결과 row를 JSON으로 돌려주고 저장은 finalize_channel_task 가 한 번에 한다.
+    드라이버가 죽으면 CRAWLER_VIDEO_MAX_RETRIES 번까지 재시도하고,
+    그래도 실패하면 chord 전체가 멈추지 않도록 빈 결과를 돌려준다 (finish_run이 재시도 예약).
+    시작할 때마다 이번 실행이 가져간 영상 전체에 heartbeat 를 보내서, 영상 태스크가 진행되는 동안은 lease 가 끝나지 않는다.
+    """
+    if job_id is not None and owner:
+        heartbeat(job_id, owner)
+    # 영상 태스크 하나의 지표만 따로 모아서 결과와 함께 finalize_channel_task 로 넘김
+    task_metrics = metrics.start_run()
+    try:
+        df = crawl_single_video(video_id, backend)
+    except WebDriverException as e:
+        if self.request.retries < getattr(settings, "CRAWLER_VIDEO_MAX_RETRIES", 2):
+            metrics.incr("video_retries_total")
+            raise self.retry(exc=e, countdown=5)
+        metrics.incr("videos_failed_total")
+        logger.error(f"❌ 재시도 횟수 초과로 건너뜀: {video_id} - {e}")
+        return {"video_id": video_id, "rows": [], "metrics": task_metrics.to_dict()}
+    except Exception as e:
+        metrics.incr("videos_failed_total")
+        logger.error(f"❌ 영상 크롤링 중 에러 발생: {video_id} - {e}", exc_info=True)
+        return {"video_id": video_id, "rows": [], "metrics": task_metrics.to_dict()}
+
+    rows = df.to_dict("records") if df is not None and not df.empty else []
+    metrics.incr("videos_crawled_total" if rows else "videos_empty_total")
+    return {"video_id": video_id, "rows": rows, "metrics": task_metrics.to_dict()}
+
+
+# ---------- ⬇️ 3단계: 영상별 결과를 DB/CSV(Parquet)로 합쳐서 저장 ----------
+@shared_task(acks_late=True)
+def finalize_channel_task(results: list[dict], job_id: int, claimed_ids: list[str], save_path: str = DEFAULT_EXPORT_DIR,
+                          discover_metrics: dict = None, owner: str = "") -> int:
+    """
+    DB 쓰기를 이 태스크 하나에서만 하므로 SQLite 쓰기 잠금이 겹치지 않는다.
+    discover_metrics 와 영상 태스크별 지표를 합쳐서 실행 한 번의 지표로 저장한다.
+    """
+    run_metrics = metrics.start_run()
+    run_metrics.merge(discover_metrics)
+    for result in results or []:
+        if result:
+            run_metrics.merge(result.get("metrics"))
+    job = CrawlJob.objects.get(pk=job_id)
+    records = (
+        (index, result["video_id"], pd.DataFrame(result["rows"]))
+        for index, result in enumerate(results or [], start=1)
+        if result and result.get("rows")
+    )
+    sinks = [DBBatchWriter(on_flush=lambda saved_ids: mark_done(job, saved_ids)), *build_export_sinks(save_path, job.channel_name)]
+    try:
+        with metrics.span("finalize_channel"), claim_heartbeat(job, owner):
+            written = run_sinks(records, sinks)
+    finally:
+        finish_run(job, claimed_ids)
+        metrics.dump_run(run_metrics, run_name(job.channel_url))
+    logger.info(f"✅ 채널 저장 완료: {job.channel_url} (영상 {written}개)")
+    return written
+
+
+# ---------- ⬇️ 등록된 채널 전체를 채널별 파이프라인으로 동시에 시작 ----------
+@shared_task(acks_late=True)
+def crawl_channels_task(incremental: bool = None):
+    channel_urls = [
+        "https://www.youtube.com/@%EC%B9%A1%EC%B4%89",
+    ]
+    group(discover_channel_task.s(url, DEFAULT_EXPORT_DIR, incremental) for url in channel_urls).apply_async()
+    logger.info(f"🚀 채널 {len(channel_urls)}개 크롤링 파이프라인 시작")
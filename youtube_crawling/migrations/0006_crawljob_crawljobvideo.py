@@ -0,0 +1,46 @@
+# Generated by Django 4.2.21 on 2025-06-02 10:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('youtube_crawling', '0005_alter_youtubeproduct_product_image_link_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel_url', models.CharField(max_length=500)),
+                ('channel_name', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('running', '진행 중'), ('done', '완료'), ('abandoned', '중단')], default='running', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['channel_url', 'status'], name='youtube_cra_channel_6a20d4_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='CrawlJobVideo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('video_id', models.CharField(max_length=255)),
+                ('position', models.IntegerField(default=0)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='videos', to='youtube_crawling.crawljob')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['job', 'status'], name='youtube_cra_job_id_94fe74_idx')],
+                'unique_together': {('job', 'video_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.21 on 2025-06-03 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('youtube_crawling', '0006_crawljob_crawljobvideo'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='youtubevideo',
+            index=models.Index(fields=['extracted_date', 'id'], name='youtube_cra_extract_7d7d20_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='youtubevideo',
+            index=models.Index(fields=['channel_name', 'extracted_date'], name='youtube_cra_channel_0a79b4_idx'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.21 on 2026-10-17 17:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('youtube_crawling', '0007_youtubevideo_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChannelDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel_name', models.CharField(max_length=255)),
+                ('date', models.DateField()),
+                ('video_count', models.IntegerField(default=0)),
+                ('total_views', models.BigIntegerField(default=0)),
+                ('subscriber_count', models.BigIntegerField(default=0)),
+                ('product_count', models.IntegerField(default=0)),
+                ('avg_product_price', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date'], name='youtube_cra_date_ac74f0_idx')],
+                'unique_together': {('channel_name', 'date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='VideoSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('extracted_date', models.DateField()),
+                ('view_count', models.BigIntegerField(default=0)),
+                ('subscriber_count', models.BigIntegerField(default=0)),
+                ('product_count', models.IntegerField(default=0)),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='youtube_crawling.youtubevideo')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['extracted_date'], name='youtube_cra_extract_577e06_idx')],
+                'unique_together': {('video', 'extracted_date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductPriceSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_name', models.CharField(max_length=500)),
+                ('extracted_date', models.DateField()),
+                ('product_price', models.BigIntegerField(default=0)),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='price_snapshots', to='youtube_crawling.youtubevideo')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['extracted_date'], name='youtube_cra_extract_3f4d8d_idx')],
+                'unique_together': {('video', 'product_name', 'extracted_date')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.21 on 2026-10-17 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('youtube_crawling', '0008_history_snapshots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='youtubeproduct',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='youtubevideo',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=32),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-17 17:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('youtube_crawling', '0009_content_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='crawljobvideo',
+            name='status',
+            field=models.CharField(choices=[('pending', '대기'), ('running', '크롤링 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-17 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('youtube_crawling', '0010_crawljobvideo_running_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crawljobvideo',
+            name='claimed_by',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+    ]
@@ -11,12 +11,16 @@ class YouTubeVideo(models.Model):
     video_url = models.URLField(max_length=500, unique=True)
     product_count = models.IntegerField(default=0)
     description = models.TextField(blank=True)
+    content_hash = models.CharField(max_length=32, blank=True)  # 조회수/구독자 수/추출일을 뺀 필드 해시 (바뀐 영상만 다시 저장)
 
     class Meta:
         indexes = [
             models.Index(fields=['extracted_date']),
             models.Index(fields=['upload_date']),
             models.Index(fields=['channel_name']),
+            # 목록 API 수집일 범위 필터와 채널 필터용
+            models.Index(fields=['extracted_date', 'id']),
+            models.Index(fields=['channel_name', 'extracted_date']),
         ]
 
     def __str__(self):
@@ -30,6 +34,7 @@ class YouTubeProduct(models.Model):
     product_image_link = models.URLField(max_length=500, blank=True)
     product_merchant = models.CharField(max_length=255, blank=True)
     product_merchant_link = models.URLField(max_length=500, blank=True)
+    content_hash = models.CharField(max_length=32, blank=True)  # 가격/이미지/판매처 해시 (바뀐 제품만 다시 저장)
 
     class Meta:
         unique_together = ('video', 'product_name')
@@ -39,4 +44,115 @@ class YouTubeProduct(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.product_name} (₩{self.product_price:,})"
\ No newline at end of file
+        return f"{self.product_name} (₩{self.product_price:,})"
+
+# ---------- ⬇️ 조회수/구독자 수/가격 이력 (크롤링할 때마다 쌓고 지우거나 고치지 않음) ----------
+class VideoSnapshot(models.Model):
+    video = models.ForeignKey(YouTubeVideo, on_delete=models.CASCADE, related_name='snapshots')
+    extracted_date = models.DateField()
+    view_count = models.BigIntegerField(default=0)
+    subscriber_count = models.BigIntegerField(default=0)
+    product_count = models.IntegerField(default=0)
+
+    class Meta:
+        # 하루에 영상당 한 줄 (같은 날 다시 크롤링하면 그날 값만 최신으로 바뀜)
+        unique_together = ('video', 'extracted_date')
+        indexes = [
+            models.Index(fields=['extracted_date']),
+        ]
+
+    def __str__(self):
+        return f"{self.video_id} {self.extracted_date} (조회수 {self.view_count:,})"
+
+
+class ProductPriceSnapshot(models.Model):
+    video = models.ForeignKey(YouTubeVideo, on_delete=models.CASCADE, related_name='price_snapshots')
+    product_name = models.CharField(max_length=500)
+    extracted_date = models.DateField()
+    product_price = models.BigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('video', 'product_name', 'extracted_date')
+        indexes = [
+            models.Index(fields=['extracted_date']),
+        ]
+
+    def __str__(self):
+        return f"{self.product_name} {self.extracted_date} (₩{self.product_price:,})"
+
+
+class ChannelDailyStats(models.Model):
+    """VideoSnapshot/ProductPriceSnapshot 을 채널/날짜별로 미리 집계한 값 (longform_history.rollup_channel_daily)"""
+    channel_name = models.CharField(max_length=255)
+    date = models.DateField()
+    video_count = models.IntegerField(default=0)
+    total_views = models.BigIntegerField(default=0)
+    subscriber_count = models.BigIntegerField(default=0)
+    product_count = models.IntegerField(default=0)
+    avg_product_price = models.BigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('channel_name', 'date')
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+    def __str__(self):
+        return f"{self.channel_name} {self.date}"
+
+
+class CrawlJob(models.Model):
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_ABANDONED = 'abandoned'
+    STATUS_CHOICES = [
+        (STATUS_RUNNING, '진행 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_ABANDONED, '중단'),
+    ]
+
+    channel_url = models.CharField(max_length=500)
+    channel_name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_RUNNING)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['channel_url', 'status']),
+        ]
+
+    def __str__(self):
+        return f"{self.channel_name or self.channel_url} ({self.status})"
+
+
+class CrawlJobVideo(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '크롤링 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    job = models.ForeignKey(CrawlJob, on_delete=models.CASCADE, related_name='videos')
+    video_id = models.CharField(max_length=255)
+    position = models.IntegerField(default=0)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+    claimed_by = models.CharField(max_length=32, blank=True, default='')  # 가져간 실행의 ID (heartbeat 대상)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('job', 'video_id')
+        indexes = [
+            models.Index(fields=['job', 'status']),
+        ]
+
+    def __str__(self):
+        return f"{self.video_id} ({self.status}, {self.attempts}회)"
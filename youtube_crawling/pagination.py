@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+# ---------- ⬇️ 크롤링 영상 목록용 커서 페이지네이션 ----------
+class VideoCursorPagination(CursorPagination):
+    # DRF 커서는 첫 번째 정렬 필드 값만 기억하므로, 값이 겹치는 extracted_date 로 정렬하면 같은 날짜 row 수만큼
+    # OFFSET 이 붙고 다시 크롤링할 때 값이 바뀌어 row 가 빠지거나 중복된다. 유일하고 바뀌지 않는 id 로만 정렬해서
+    # WHERE id < 커서 + LIMIT 로 조회한다 (최근에 처음 저장된 영상부터).
+    ordering = ('-id',)
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
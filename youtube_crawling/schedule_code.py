@@ -42,7 +42,7 @@ def setup_periodic_tasks():
             name=task_name,
             defaults={
                 'crontab': schedule,
-                'task': 'youtube_crawling.tasks.crawl_channels_task',
+                'task': 'youtube_crawling.longform_tasks.crawl_channels_task',
                 'enabled': True,
             }
         )
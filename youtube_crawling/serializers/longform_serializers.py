@@ -1,14 +1,26 @@
 from rest_framework import serializers
 from youtube_crawling.models import YouTubeVideo, YouTubeProduct
 
+
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """fields=[...] 인자로 응답에 포함할 필드만 골라서 직렬화"""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
 class ProductSerializer(serializers.ModelSerializer):
     class Meta:
         model = YouTubeProduct
-        fields = '__all__'
+        exclude = ['content_hash']  # 저장할 때 비교용 내부 값
 
-class YouTubeVideoSerializer(serializers.ModelSerializer):
+class YouTubeVideoSerializer(DynamicFieldsModelSerializer):
     products = ProductSerializer(many=True, read_only=True)
 
     class Meta:
         model = YouTubeVideo
-        fields = '__all__'
+        exclude = ['content_hash']
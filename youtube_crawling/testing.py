@@ -0,0 +1,199 @@
+"""
+테스트와 벤치마크가 같이 쓰는 합성 데이터
+
+- synthetic_video_frames: 크롤링 결과와 같은 스키마의 영상별 DataFrame
+- watch_initial_json / watch_page_html: 시청 페이지의 ytInitialData 와 합성 HTML
+- channel_browse_items / channel_browse_response: 채널 /videos 목록 JSON (continuation 포함)
+- legacy_preprocess_df: 벡터화 전 row 단위 정규화 (normalize_frame 비교용)
+
+Django 설정 없이 import 할 수 있도록 프로젝트 모듈은 함수 안에서 import 한다.
+"""
+import pandas as pd
+import html, json, random
+
+
+# ---------- ⬇️ 크롤링 결과와 같은 스키마의 합성 DataFrame (영상 하나당 하나) ----------
+def synthetic_video_frames(n_videos: int, products_per_video: int = 5, seed: int = 0, id_prefix: str = "vid") -> list[pd.DataFrame]:
+    rng = random.Random(seed)
+    frames = []
+    for v in range(n_videos):
+        video_id = f"{id_prefix}{v:08d}"
+        base = {
+            "youtube_id": video_id,
+            "title": f"테스트 영상 {v}",
+            "channel_name": "벤치마크채널",
+            "subscribers": f"구독자 {rng.randint(1, 999)}.{rng.randint(0, 9)}만명",
+            "view_count": f"조회수 {rng.randint(1000, 9_999_999):,}회",
+            "upload_date": f"2024. {rng.randint(1, 12)}. {rng.randint(1, 28)}.",
+            "extracted_date": "20250601",
+            "video_url": f"https://www.youtube.com/watch?v={video_id}",
+            "description": "설명\n\n" * 20,
+            "product_count": products_per_video,
+        }
+        rows = [
+            {
+                **base,
+                "product_name": f"제품 {v}-{p}",
+                "product_price": f"₩{rng.randint(1000, 500000):,}",
+                "product_image_url": f"https://i.ytimg.com/merch/{video_id}/{p}.jpg",
+                "product_merchant_url": f"https://shop.example.com/{video_id}/{p}",
+                "product_merchant": "example.com",
+            }
+            for p in range(products_per_video)
+        ]
+        frames.append(pd.DataFrame(rows))
+    return frames
+
+
+# ---------- ⬇️ 시청 페이지의 ytInitialPlayerResponse / ytInitialData ----------
+def watch_initial_json(video_id: str, meta: dict, products: list[dict]) -> tuple[dict, dict]:
+    player = {
+        "videoDetails": {
+            "videoId": video_id,
+            "title": meta["title"],
+            "author": meta["channel_name"],
+            "viewCount": str(meta["views"]),
+            "shortDescription": meta["description"],
+        },
+        "microformat": {"playerMicroformatRenderer": {"publishDate": meta["publish_date"]}},
+    }
+    contents = [
+        {"videoPrimaryInfoRenderer": {"title": {"runs": [{"text": meta["title"]}]}}},
+        {"videoSecondaryInfoRenderer": {"owner": {"videoOwnerRenderer": {
+            "title": {"runs": [{"text": meta["channel_name"]}]},
+            "subscriberCountText": {"simpleText": meta["subscribers"]},
+        }}}},
+    ]
+    if products:
+        contents.append({"merchandiseShelfRenderer": {"items": [
+            {"merchandiseItemRenderer": {
+                "title": p["title"],
+                "price": p["price"],
+                "vendorName": p["merchant"],
+                "thumbnail": {"thumbnails": [{"url": p["image"]}]},
+                "navigationEndpoint": {"urlEndpoint": {"url": p["url"]}},
+            }}
+            for p in products
+        ]}})
+    initial = {"contents": {"twoColumnWatchNextResults": {"results": {"results": {"contents": contents}}}}}
+    return player, initial
+
+
+# ---------- ⬇️ 합성 시청 페이지 ----------
+def watch_page_html(video_id: str, products_per_video: int, rng: random.Random) -> str:
+    year, month, day = 2024, rng.randint(1, 12), rng.randint(1, 28)
+    meta = {
+        "title": f"벤치마크 영상 {video_id}",
+        "channel_name": "벤치마크채널",
+        "subscribers": f"구독자 {rng.randint(1, 99)}.{rng.randint(0, 9)}만명",
+        "views": rng.randint(1_000, 5_000_000),
+        "publish_date": f"{year}-{month:02d}-{day:02d}",
+        "description": "영상 설명입니다.\n\n" * 30,
+    }
+    products = [
+        {
+            "title": f"제품 {video_id}-{i}",
+            "price": f"₩{rng.randint(1_000, 300_000):,}",
+            "merchant": "example.com!",
+            "image": f"https://i.ytimg.com/merch/{video_id}/{i}.jpg",
+            "url": f"https://shop.example.com/{video_id}/{i}",
+        }
+        for i in range(products_per_video)
+    ]
+    player, initial = watch_initial_json(video_id, meta, products)
+    e = html.escape
+
+    items = "".join(
+        f"""
+        <ytd-merch-shelf-item-renderer>
+          <a class="yt-simple-endpoint" href="{e(p['url'])}">
+            <yt-img-shadow data-src="{e(p['image'])}"></yt-img-shadow>
+            <div class="product-item-title">{e(p['title'])}</div>
+            <div class="product-item-price">{e(p['price'])}</div>
+            <div class="product-item-merchant-text">{e(p['merchant'])}</div>
+          </a>
+        </ytd-merch-shelf-item-renderer>"""
+        for p in products
+    )
+    # 실제 시청 페이지처럼 추천 영상 썸네일, 웹폰트, 자동재생 영상 스트림을 붙여둠 (리소스 차단 벤치마크용)
+    thumbnails = "".join(
+        f'<ytd-compact-video-renderer><img src="/static/thumb_{video_id}_{i}.jpg"></ytd-compact-video-renderer>'
+        for i in range(20)
+    )
+    shelf = f"""
+      <ytd-merch-shelf-renderer>
+        <yt-formatted-string id="info">{len(products)}개 제품</yt-formatted-string>
+        <div id="items">{items}</div>
+      </ytd-merch-shelf-renderer>""" if products else ""
+
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8">
+<meta property="og:title" content="{e(meta['channel_name'])}">
+<title>{e(meta['title'])}</title>
+<style>
+  @font-face {{ font-family: "YouTube Sans"; src: url("/static/youtube_sans.woff2") format("woff2"); }}
+  body {{ font-family: "YouTube Sans", sans-serif; }}
+</style></head>
+<body>
+<video id="movie_player" src="/static/stream_{video_id}.mp4" autoplay muted></video>
+<ytd-watch-metadata>
+  <div id="title"><h1><yt-formatted-string>{e(meta['title'])}</yt-formatted-string></h1></div>
+  <ytd-channel-name><a href="/@bench">{e(meta['channel_name'])}</a></ytd-channel-name>
+  <yt-formatted-string id="owner-sub-count">{e(meta['subscribers'])}</yt-formatted-string>
+  <div id="info-strings"><yt-formatted-string>{year}. {month}. {day}.</yt-formatted-string></div>
+  <span class="view-count">조회수 {meta['views']:,}회</span>
+  <ytd-expander id="description"><yt-formatted-string>{e(meta['description'])}</yt-formatted-string></ytd-expander>
+  <tp-yt-paper-button id="expand">...더보기</tp-yt-paper-button>
+</ytd-watch-metadata>
+<div style="height:1500px"></div>
+{shelf}
+<div style="height:1500px"></div>
+<div id="related">{thumbnails}</div>
+<ytd-comments id="comments"></ytd-comments>
+<script>
+  document.querySelectorAll('yt-img-shadow').forEach(function (host) {{
+    var root = host.attachShadow({{mode: 'open'}});
+    root.innerHTML = '<img id="img" src="' + host.dataset.src + '">';
+  }});
+</script>
+<script>var ytInitialPlayerResponse = {json.dumps(player, ensure_ascii=False)};</script>
+<script>var ytInitialData = {json.dumps(initial, ensure_ascii=False)};</script>
+</body></html>"""
+
+
+# ---------- ⬇️ 채널 목록 JSON 한 묶음 (ytInitialData / browse continuation 응답 공용) ----------
+def channel_browse_items(video_ids: list[str], offset: int, batch: int = 30) -> list[dict]:
+    items = [
+        {"richItemRenderer": {"content": {"videoRenderer": {
+            "videoId": video_id,
+            "publishedTimeText": {"simpleText": f"{offset + i + 1}일 전"},
+        }}}}
+        for i, video_id in enumerate(video_ids[offset:offset + batch])
+    ]
+    if offset + batch < len(video_ids):
+        items.append({"continuationItemRenderer": {"continuationEndpoint": {
+            "continuationCommand": {"token": str(offset + batch)},
+        }}})
+    return items
+
+
+def channel_browse_response(video_ids: list[str], token: str, batch: int = 30) -> dict:
+    items = channel_browse_items(video_ids, int(token or 0), batch)
+    return {"onResponseReceivedActions": [{"appendContinuationItemsAction": {"continuationItems": items}}]}
+
+
+# ---------- ⬇️ 벡터화 전의 preprocess_df ----------
+def legacy_preprocess_df(df: pd.DataFrame) -> pd.DataFrame:
+    """normalize_frame 결과 비교용 (row마다 parse_* 를 호출)"""
+    from youtube_crawling.longform_crawler import (
+        parse_view_count, parse_subscriber_count, parse_price, format_date, clean_description,
+    )
+
+    df = df.copy()
+    df['view_count'] = df['view_count'].apply(parse_view_count)
+    df['subscribers'] = df['subscribers'].apply(parse_subscriber_count)
+    df['product_price'] = df['product_price'].apply(parse_price)
+    df['description'] = df['description'].apply(clean_description)
+    df['upload_date'] = df['upload_date'].apply(format_date)
+    df['extracted_date'] = df['extracted_date'].apply(format_date)
+    return df
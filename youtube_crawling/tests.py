@@ -1,3 +1,1002 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+from unittest import mock
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+import asyncio, json, os, random, tempfile, threading
+import pandas as pd
+import requests
 
 # Create your tests here.
+from youtube_crawling.testing import channel_browse_items, channel_browse_response, synthetic_video_frames, watch_initial_json, watch_page_html, legacy_preprocess_df
+from youtube_crawling.longform_crawler import (
+    save_to_db, upsert_frames, DBBatchWriter, KnownVideoIds, discover_channel, preprocess_df, parse_view_count, format_date,
+    extract_products_from_dom, extract_products_from_html, select_first_text, MERCH_ITEMS_SCRIPT, MERCH_ITEM_SELECTORS,
+)
+from youtube_crawling import longform_parser
+from youtube_crawling.longform_browser import BrowserPool, PooledChrome
+from youtube_crawling.longform_export import PartitionedCSVWriter, PartitionedParquetWriter, compact_csv
+from youtube_crawling.longform_http_extractor import parse_merch_shelf, watch_html_rows
+from youtube_crawling.longform_normalize import normalize_counts, normalize_dates, normalize_frame
+from youtube_crawling.longform_checkpoints import (
+    claim_heartbeat, claim_lease, create_job, claim_videos, get_resumable_job, heartbeat, mark_done, finish_run,
+)
+from youtube_crawling import longform_checkpoints
+from youtube_crawling.longform_metrics import CrawlMetrics
+from youtube_crawling import longform_metrics
+from youtube_crawling.longform_tasks import finalize_channel_task
+from youtube_crawling import longform_ratelimit, longform_numbers
+from youtube_crawling.longform_numbers import KoreanParseError, parse_count, parse_krw, parse_korean_date
+from youtube_crawling.longform_discovery import DiscoveryCollector, discover_video_urls_http, parse_browse_items, parse_published_text
+from youtube_crawling.models import YouTubeVideo, YouTubeProduct, CrawlJob, CrawlJobVideo
+from datetime import date, datetime, timedelta
+from django.utils import timezone
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError, connection
+from django.test.utils import CaptureQueriesContext
+
+
+# ---------- ⬇️ DB 저장 (bulk upsert) ----------
+class SaveToDbTests(TestCase):
+    def test_bad_upload_date_skips_only_that_video(self):
+        good, bad = synthetic_video_frames(2, products_per_video=2)
+        bad["upload_date"] = "날짜 없음"
+
+        saved = save_to_db([good, bad])
+
+        self.assertEqual(saved, 2)
+        self.assertEqual(list(YouTubeVideo.objects.values_list("video_id", flat=True)), ["vid00000000"])
+        self.assertEqual(YouTubeProduct.objects.count(), 2)
+
+    def test_batch_writer_reports_saved_ids_when_a_video_is_invalid(self):
+        good, bad = synthetic_video_frames(2)
+        bad["upload_date"] = "날짜 없음"
+        flushed = []
+
+        with DBBatchWriter(batch_size=10, on_flush=flushed.extend) as writer:
+            writer.write(good)
+            writer.write(bad)
+
+        self.assertEqual(flushed, ["vid00000000"])
+
+    @mock.patch("youtube_crawling.longform_crawler.rollup_channel_daily", side_effect=OperationalError("deadlock detected"))
+    def test_rollup_failure_does_not_hide_saved_videos(self, rollup):
+        frames = synthetic_video_frames(2, products_per_video=2)
+
+        self.assertEqual(upsert_frames(frames), (["vid00000000", "vid00000001"], 4))
+        rollup.assert_called_once()
+        self.assertEqual(YouTubeVideo.objects.count(), 2)
+
+
+
+# ---------- ⬇️ 크롤링 트리거 API ----------
+class ChannelCrawlTriggerViewTests(APITestCase):
+    URL = "/api/v1/crawl/longform/"
+    CHANNEL = "https://www.youtube.com/@example"
+
+    @mock.patch("youtube_crawling.views.longform_api_views.discover_channel_task")
+    def test_post_starts_pipeline_for_valid_channel(self, task):
+        response = self.client.post(self.URL, {"channel_url": [self.CHANNEL]}, format="json")
+
+        self.assertEqual(response.status_code, 202)
+        task.delay.assert_called_once_with(self.CHANNEL, "./crawling_result_csv")
+
+    @mock.patch("youtube_crawling.views.longform_api_views.discover_channel_task")
+    def test_put_recrawls_everything(self, task):
+        response = self.client.put(self.URL, {"channel_url": [self.CHANNEL]}, format="json")
+
+        self.assertEqual(response.status_code, 202)
+        task.delay.assert_called_once_with(self.CHANNEL, "./crawling_result_csv", incremental=False)
+
+    @mock.patch("youtube_crawling.views.longform_api_views.discover_channel_task")
+    def test_post_rejects_non_youtube_url(self, task):
+        response = self.client.post(self.URL, {"channel_url": ["https://example.com/@x"]}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        task.delay.assert_not_called()
+
+
+# ---------- ⬇️ 영상 목록 조회 API (필터, fields, 커서 페이지네이션) ----------
+class VideoListViewTests(APITestCase):
+    URL = "/api/v1/crawl/longform/"
+
+    def make_video(self, n: int, channel: str = "채널A", upload: str = "2024-01-01", extracted: str = "2025-06-01", prices=()):
+        video = YouTubeVideo.objects.create(
+            video_id=f"v{n:05d}", extracted_date=extracted, upload_date=upload, channel_name=channel,
+            title=f"영상 {n}", video_url=f"https://www.youtube.com/watch?v=v{n:05d}", product_count=len(prices),
+        )
+        for i, price in enumerate(prices):
+            YouTubeProduct.objects.create(video=video, product_name=f"제품 {i}", product_price=price)
+        return video
+
+    def ids(self, response) -> list[str]:
+        return [row["video_id"] for row in response.data["results"]]
+
+    def test_filters(self):
+        self.make_video(1, "채널A", upload="2024-01-05", prices=[10_000, 12_000])
+        self.make_video(2, "채널A", upload="2024-03-01", prices=[50_000])
+        self.make_video(3, "채널B", upload="2024-01-10", prices=[])
+
+        cases = {
+            "channel_name=채널A": ["v00002", "v00001"],
+            "upload_date_from=2024-01-06&upload_date_to=2024-02-01": ["v00003"],
+            # 조건에 맞는 제품이 두 개여도 영상은 한 번만
+            "price_min=9000&price_max=20000": ["v00001"],
+            "channel_name=채널A&price_min=20000": ["v00002"],
+        }
+        for query, expected in cases.items():
+            with self.subTest(query=query):
+                response = self.client.get(f"{self.URL}?{query}")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(self.ids(response), expected)
+
+        for query in ("upload_date_from=2024-13-01", "extracted_date_to=어제", "price_min=-1"):
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(f"{self.URL}?{query}").status_code, 400)
+
+    def test_fields_selects_response_keys(self):
+        self.make_video(1, prices=[1_000])
+
+        response = self.client.get(f"{self.URL}?fields=video_id,title")
+        self.assertEqual(response.data["results"], [{"video_id": "v00001", "title": "영상 1"}])
+
+        response = self.client.get(f"{self.URL}?fields=video_id,products")
+        self.assertEqual(set(response.data["results"][0]), {"video_id", "products"})
+        self.assertEqual(response.data["results"][0]["products"][0]["product_price"], 1_000)
+
+        self.assertEqual(self.client.get(f"{self.URL}?fields=video_id,password").status_code, 400)
+
+    def test_cursor_pages_by_id_without_offset(self):
+        # 한 번 크롤링하면 같은 extracted_date 가 여러 row 에 들어감
+        videos = [self.make_video(n) for n in range(120)]
+        expected = [video.video_id for video in reversed(videos)]
+
+        seen, url, sql = [], f"{self.URL}?page_size=50&fields=video_id", []
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            sql += [query["sql"] for query in queries.captured_queries]
+            seen += self.ids(response)
+            url = response.data["next"]
+            if len(seen) == 50:
+                # 페이지를 넘기는 사이에 다시 크롤링되어 수집일이 바뀌어도 빠지거나 중복되는 row 가 없어야 함
+                YouTubeVideo.objects.update(extracted_date="2025-06-02")
+
+        self.assertEqual(seen, expected)
+        self.assertFalse([q for q in sql if "OFFSET" in q.upper()])
+
+
+# ---------- ⬇️ Celery 파이프라인 실행 지표 ----------
+class FinalizeChannelMetricsTests(TestCase):
+    def test_finalize_merges_discover_and_video_metrics_into_latest_run(self):
+        frame, = synthetic_video_frames(1, products_per_video=2)
+        job = create_job("https://www.youtube.com/@example", "example", ["vid00000000"])
+        discover = CrawlMetrics()
+        discover.observe("discover_channel", 1.5)
+        video = CrawlMetrics()
+        video.incr("videos_crawled_total")
+        results = [{"video_id": "vid00000000", "rows": frame.to_dict("records"), "metrics": video.to_dict()}]
+
+        with tempfile.TemporaryDirectory() as tmp, override_settings(CRAWLER_METRICS_DIR=tmp, CRAWLER_EXPORT_FORMATS=["csv"]):
+            written = finalize_channel_task(results, job.id, ["vid00000000"], os.path.join(tmp, "csv"), discover.to_dict())
+            with open(os.path.join(tmp, "latest.json"), encoding="utf-8") as f:
+                data = json.load(f)
+
+        self.assertEqual(written, 1)
+        self.assertEqual(data["run"], "example")
+        stages = {span["stage"] for span in data["spans"]}
+        self.assertTrue({"discover_channel", "finalize_channel"} <= stages)
+        self.assertIn({"name": "videos_crawled_total", "labels": {}, "value": 1}, data["counters"])
+
+
+# ---------- ⬇️ 실행 지표: 동시에 도는 태스크끼리 저장소를 덮어쓰지 않음 ----------
+class MetricsContextTests(TestCase):
+    def test_concurrent_runs_keep_their_own_metrics(self):
+        started = threading.Barrier(2)
+        runs = {}
+
+        def task(name):
+            run = longform_metrics.start_run()
+            started.wait()  # 두 태스크가 모두 start_run 한 뒤에 기록
+            longform_metrics.incr("videos_crawled_total", task=name)
+            runs[name] = run
+
+        threads = [threading.Thread(target=task, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for name, run in runs.items():
+            self.assertEqual([c["labels"] for c in run.to_dict()["counters"]], [{"task": name}])
+
+    def test_bound_worker_threads_record_into_the_callers_run(self):
+        run = longform_metrics.start_run()
+        worker = threading.Thread(target=longform_metrics.bind(longform_metrics.incr), args=("videos_crawled_total",))
+        worker.start()
+        worker.join()
+
+        self.assertEqual(run.to_dict()["counters"], [{"name": "videos_crawled_total", "labels": {}, "value": 1}])
+
+    def test_asyncio_tasks_keep_their_own_metrics(self):
+        async def task(name):
+            run = longform_metrics.start_run()
+            await asyncio.sleep(0)
+            await asyncio.to_thread(longform_metrics.incr, "videos_crawled_total", task=name)
+            return run
+
+        async def main():
+            return await asyncio.gather(task("a"), task("b"))
+
+        first, second = asyncio.run(main())
+        self.assertEqual([c["labels"] for c in first.to_dict()["counters"]], [{"task": "a"}])
+        self.assertEqual([c["labels"] for c in second.to_dict()["counters"]], [{"task": "b"}])
+
+
+# ---------- ⬇️ 체크포인트: 영상 가져가기 ----------
+class ClaimVideosTests(TestCase):
+    def setUp(self):
+        self.job = create_job("https://www.youtube.com/@example", "example", ["a", "b", "c"])
+
+    def test_claimed_videos_are_not_claimed_again(self):
+        self.assertEqual(claim_videos(self.job), ["a", "b", "c"])
+        self.assertEqual(claim_videos(self.job), [])
+        self.assertEqual(set(self.job.videos.values_list("status", flat=True)), {CrawlJobVideo.STATUS_RUNNING})
+
+    def test_stale_running_videos_are_claimed_again_after_lease(self):
+        claim_videos(self.job)
+        self.job.videos.filter(video_id="b").update(updated_at=timezone.now() - claim_lease() - timedelta(seconds=1))
+
+        self.assertEqual(claim_videos(self.job), ["b"])
+        self.assertEqual(self.job.videos.get(video_id="b").attempts, 2)
+
+    def test_resume_after_crash_reclaims_the_dead_runs_videos(self):
+        claim_videos(self.job, "run-1")
+        mark_done(self.job, ["a"])
+        # 실행이 finish_run 없이 죽고 heartbeat 가 끊긴 채로 lease 가 지남
+        self.job.videos.update(updated_at=timezone.now() - claim_lease() - timedelta(seconds=1))
+
+        resumed = get_resumable_job(self.job.channel_url)
+        self.assertEqual(resumed, self.job)
+        self.assertEqual(claim_videos(resumed, "run-2"), ["b", "c"])
+        self.assertEqual(set(self.job.videos.filter(status=CrawlJobVideo.STATUS_RUNNING).values_list("claimed_by", flat=True)), {"run-2"})
+
+        mark_done(resumed, ["b", "c"])
+        finish_run(resumed, ["b", "c"])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, CrawlJob.STATUS_DONE)
+
+    def test_heartbeat_keeps_a_live_runs_videos(self):
+        claim_videos(self.job, "run-1")
+        self.job.videos.update(updated_at=timezone.now() - claim_lease() - timedelta(seconds=1))
+
+        self.assertEqual(heartbeat(self.job.id, "run-1"), 3)
+        self.assertEqual(heartbeat(self.job.id, "run-2"), 0)
+        self.assertEqual(claim_videos(self.job, "run-2"), [])
+
+    @override_settings(CRAWLER_CLAIM_LEASE_MINUTES=0.001)
+    def test_claim_heartbeat_beats_while_the_run_is_alive(self):
+        beaten = threading.Event()
+        with mock.patch.object(longform_checkpoints, "heartbeat", side_effect=lambda *args: beaten.set()) as beat:
+            with claim_heartbeat(self.job, "run-1"):
+                self.assertTrue(beaten.wait(5))
+        beat.assert_called_with(self.job.id, "run-1")
+
+    def test_job_stays_running_while_another_run_is_in_flight(self):
+        claim_videos(self.job)
+        self.job.videos.filter(video_id="c").update(status=CrawlJobVideo.STATUS_PENDING)
+        first = ["a", "b"]
+        second = claim_videos(self.job)
+        mark_done(self.job, first)
+
+        finish_run(self.job, first)
+        self.job.refresh_from_db()
+        self.assertEqual(second, ["c"])
+        self.assertEqual(self.job.status, CrawlJob.STATUS_RUNNING)
+
+        mark_done(self.job, second)
+        finish_run(self.job, second)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, CrawlJob.STATUS_DONE)
+
+
+# ---------- ⬇️ Parquet 내보내기 ----------
+class PartitionedParquetWriterTests(TestCase):
+    def test_partitioned_directory_reads_back(self):
+        frames = synthetic_video_frames(3, products_per_video=2)
+        frames[2]["extracted_date"] = "20250602"
+        df = preprocess_df(pd.concat(frames, ignore_index=True))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = PartitionedParquetWriter(tmp, "example")
+            writer.write(df)
+            paths = writer.close()
+            result = pd.read_parquet(tmp)
+
+        self.assertEqual(len(paths), 2)
+        self.assertEqual(len(result), 6)
+        self.assertEqual(sorted(result["extracted_date"].astype(str).unique()), ["2025-06-01", "2025-06-02"])
+        self.assertEqual(sorted(result["dt"].astype(str).unique()), ["20250601", "20250602"])
+        self.assertEqual(result["view_count"].dtype, "int64")
+
+
+# ---------- ⬇️ CSV 내보내기: 추출일 파티션에 append, 필요하면 채널 CSV 하나로 합치기 ----------
+class PartitionedCSVWriterTests(TestCase):
+    def frames(self):
+        frames = synthetic_video_frames(3, products_per_video=2)
+        frames[2]["extracted_date"] = "20250602"
+        return [preprocess_df(df) for df in frames]
+
+    def test_batches_are_appended_to_date_partitions_with_one_header(self):
+        first, second, third = self.frames()
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = PartitionedCSVWriter(tmp, "예시 채널!")
+            writer.write(first)
+            writer.write(pd.concat([second, third], ignore_index=True))
+            writer.write(pd.DataFrame())
+
+            channel_dir = os.path.join(tmp, "예시_채널")
+            self.assertEqual(sorted(os.listdir(channel_dir)), ["20250601.csv", "20250602.csv"])
+            with open(os.path.join(channel_dir, "20250601.csv"), "rb") as f:
+                raw = f.read()
+            june_first = pd.read_csv(os.path.join(channel_dir, "20250601.csv"), encoding="utf-8-sig")
+
+        self.assertEqual(writer.rows_written, 6)
+        self.assertEqual(raw.count("\ufeff".encode("utf-8")), 1)  # BOM은 파일 맨 앞에만
+        self.assertEqual(raw.count(b"youtube_id"), 1)
+        self.assertEqual(june_first["youtube_id"].tolist(), ["vid00000000"] * 2 + ["vid00000001"] * 2)
+
+    def test_compact_joins_partitions_newest_first(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(compact_csv(tmp, "example"))
+
+            writer = PartitionedCSVWriter(tmp, "example")
+            for df in self.frames():
+                writer.write(df)
+            path = compact_csv(tmp, "example")
+            result = pd.read_csv(path, encoding="utf-8-sig")
+            leftovers = [name for name in os.listdir(tmp) if name.endswith(".tmp")]
+
+        self.assertEqual(path, os.path.join(tmp, "example.csv"))
+        self.assertEqual(result["youtube_id"].tolist(), ["vid00000002"] * 2 + ["vid00000000"] * 2 + ["vid00000001"] * 2)
+        self.assertEqual(leftovers, [])
+
+
+# ---------- ⬇️ HTTP 백엔드: 제품 섹션과 Selenium 대체 ----------
+class WatchHtmlRowsTests(TestCase):
+    URL = "https://www.youtube.com/watch?v=abc"
+    META = {
+        "title": "영상", "channel_name": "채널", "subscribers": "구독자 1.2만명", "views": 1234,
+        "publish_date": "2024-05-01", "description": "설명",
+    }
+    PRODUCT = {"title": "제품", "price": "₩12,000", "merchant": "shop!", "image": "https://i/1.jpg", "url": "https://shop/1"}
+
+    def html(self, products, initial_patch=None):
+        player, initial = watch_initial_json("abc", self.META, products)
+        if initial_patch:
+            initial_patch(initial)
+        return (
+            f"<script>var ytInitialPlayerResponse = {json.dumps(player, ensure_ascii=False)};</script>"
+            f"<script>var ytInitialData = {json.dumps(initial, ensure_ascii=False)};</script>"
+        )
+
+    def test_no_shelf_is_zero_products_without_fallback(self):
+        rows, reason = watch_html_rows(self.URL, self.html([]), fallback_allowed=True)
+
+        self.assertIsNone(reason)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["product_name"], "")
+        self.assertEqual(rows[0]["product_count"], 0)
+
+    def test_shelf_products_are_parsed(self):
+        rows, reason = watch_html_rows(self.URL, self.html([self.PRODUCT]), fallback_allowed=True)
+
+        self.assertIsNone(reason)
+        self.assertEqual([(row["product_name"], row["product_price"]) for row in rows], [("제품", "₩12,000")])
+
+    def test_unparseable_shelf_falls_back(self):
+        def drop_prices(initial):
+            shelf = initial["contents"]["twoColumnWatchNextResults"]["results"]["results"]["contents"][-1]
+            for item in shelf["merchandiseShelfRenderer"]["items"]:
+                del item["merchandiseItemRenderer"]["price"]
+
+        html = self.html([self.PRODUCT], drop_prices)
+
+        self.assertEqual(watch_html_rows(self.URL, html, fallback_allowed=True), ([], "merch_shelf_unparsed"))
+        self.assertIsNone(watch_html_rows(self.URL, html, fallback_allowed=False)[1])
+
+    def test_missing_initial_data_always_falls_back(self):
+        self.assertEqual(watch_html_rows(self.URL, "<html></html>"), ([], "no_initial_data"))
+
+
+class ParseMerchShelfTests(TestCase):
+    def item(self, title="제품", price="₩12,000") -> dict:
+        return {"merchandiseItemRenderer": {
+            "title": {"simpleText": title},
+            "price": {"simpleText": price},
+            "vendorName": {"simpleText": "shop.com!"},
+            "thumbnail": {"thumbnails": [{"url": "https://i/small.jpg"}, {"url": "https://i/large.jpg"}]},
+            "navigationEndpoint": {"commandMetadata": {"webCommandMetadata": {"url": "https://shop/1"}}},
+        }}
+
+    def shelf(self, *items) -> dict:
+        return {"contents": [{"videoPrimaryInfoRenderer": {}}, {"merchandiseShelfRenderer": {"items": list(items)}}]}
+
+    def test_no_shelf_or_empty_shelf_is_an_empty_list(self):
+        self.assertEqual(parse_merch_shelf({"contents": [{"videoPrimaryInfoRenderer": {}}]}), [])
+        self.assertEqual(parse_merch_shelf(self.shelf()), [])
+
+    def test_unreadable_items_are_none(self):
+        self.assertIsNone(parse_merch_shelf(self.shelf(self.item(price=""), {"unknownRenderer": {}})))
+
+    def test_readable_items_are_kept_when_some_are_not(self):
+        products = parse_merch_shelf(self.shelf(self.item(price=""), self.item()))
+
+        self.assertEqual(products, [{
+            "title": "제품", "price": "₩12,000", "url": "https://shop/1", "imageUrl": "https://i/large.jpg", "merchant": "shop.com",
+        }])
+
+
+# ---------- ⬇️ 요청 속도 제한: Redis 장애 ----------
+@override_settings(CRAWLER_RATE_LIMIT=True)
+class RedisFailoverThrottleTests(TestCase):
+    URL = "https://www.youtube.com/watch?v=abc"
+
+    def setUp(self):
+        self.primary = mock.Mock()
+        for name in ("enter", "try_acquire", "feedback", "leave"):
+            getattr(self.primary, name).side_effect = longform_ratelimit.redis.ConnectionError("down")
+        self.backend = longform_ratelimit.FailoverLimiterBackend(self.primary)
+        patcher = mock.patch.object(longform_ratelimit, "_backend", self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_throttle_degrades_to_local_bucket_when_redis_is_down(self):
+        with longform_ratelimit.throttle(self.URL) as feedback:
+            feedback.ok()
+        with longform_ratelimit.throttle(self.URL):
+            pass
+
+        # 한 번 실패한 뒤에는 RETRY_SECONDS 동안 Redis를 다시 부르지 않는다
+        self.primary.enter.assert_called_once()
+        self.assertIn("www.youtube.com", self.backend.fallback.states)
+        self.assertEqual(self.backend.fallback.in_flight["www.youtube.com"], {})
+
+    def test_redis_is_retried_after_the_outage_window(self):
+        with longform_ratelimit.throttle(self.URL):
+            pass
+        self.primary.reset_mock(side_effect=True)
+        self.primary.enter.return_value = True
+        self.primary.try_acquire.return_value = 0.0
+        self.primary.feedback.return_value = 1.0
+        self.backend.down_until = 0.0
+
+        with longform_ratelimit.throttle(self.URL):
+            pass
+
+        self.primary.enter.assert_called_once()
+        self.primary.leave.assert_called_once()
+
+    def test_athrottle_calls_redis_off_the_event_loop(self):
+        threads = set()
+
+        def record(result):
+            def call(*args):
+                threads.add(threading.get_ident())
+                return result
+            return call
+
+        self.primary.enter.side_effect = record(True)
+        self.primary.try_acquire.side_effect = record(0.0)
+        self.primary.feedback.side_effect = record(1.0)
+        self.primary.leave.side_effect = record(None)
+
+        async def fetch():
+            async with longform_ratelimit.athrottle(self.URL) as feedback:
+                feedback.ok()
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(fetch())
+
+        self.assertEqual(self.primary.leave.call_count, 1)
+        self.assertTrue(threads)
+        self.assertNotIn(loop_thread, threads)
+
+    def test_athrottle_skips_threads_while_redis_is_down(self):
+        self.backend.down_until = float("inf")
+
+        async def fetch():
+            async with longform_ratelimit.athrottle(self.URL) as feedback:
+                feedback.ok()
+
+        with mock.patch.object(longform_ratelimit.asyncio, "to_thread", side_effect=AssertionError("스레드로 넘김")):
+            asyncio.run(fetch())
+        self.primary.enter.assert_not_called()
+
+
+# ---------- ⬇️ asyncio 관문: 로컬 백엔드는 루프에서 바로, 자리가 나면 바로 깨움 ----------
+class AsyncThrottleTests(TestCase):
+    URL = "https://www.youtube.com/watch?v=abc"
+
+    def setUp(self):
+        self.backend = longform_ratelimit.LocalLimiterBackend()
+        config = dict(longform_ratelimit.limiter_config(), initial=1000.0, max_in_flight=1)
+        for patcher in (
+            mock.patch.object(longform_ratelimit, "_backend", self.backend),
+            mock.patch.object(longform_ratelimit, "limiter_config", return_value=config),
+            mock.patch.object(longform_ratelimit, "SLOT_RECHECK_SECONDS", 30),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_local_backend_is_called_on_the_event_loop(self):
+        async def fetch():
+            async with longform_ratelimit.athrottle(self.URL) as feedback:
+                feedback.ok()
+
+        with mock.patch.object(longform_ratelimit.asyncio, "to_thread", side_effect=AssertionError("스레드로 넘김")):
+            asyncio.run(fetch())
+        self.assertEqual(self.backend.in_flight["www.youtube.com"], {})
+
+    def test_waiting_request_wakes_when_a_slot_is_released(self):
+        order = []
+
+        async def fetch(name, hold):
+            async with longform_ratelimit.athrottle(self.URL) as feedback:
+                order.append(name)
+                await asyncio.sleep(hold)
+                feedback.ok()
+
+        async def main():
+            # 다시 확인하는 주기(30초)를 기다렸다면 wait_for 가 먼저 끝난다
+            await asyncio.wait_for(asyncio.gather(fetch("first", 0.05), fetch("second", 0)), 5)
+
+        asyncio.run(main())
+        self.assertEqual(order, ["first", "second"])
+        self.assertEqual(self.backend.in_flight["www.youtube.com"], {})
+
+
+# ---------- ⬇️ 조회수/구독자 수/가격/날짜 파싱 ----------
+class KoreanNumberParsingTests(TestCase):
+    def setUp(self):
+        longform_numbers.cache_clear()
+
+    def test_counts_with_korean_and_english_units(self):
+        cases = {
+            "조회수 1,234회": 1234,
+            "구독자 1.2만명": 12_000,
+            "3.4억": 340_000_000,
+            "1억 2,345만": 123_450_000,
+            "구독자 5천명": 5_000,
+            "1.2K views": 1_200,
+            "3.45M subscribers": 3_450_000,
+            "0.5만": 5_000,
+            "1.25만": 12_500,
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_count(text), expected)
+        self.assertEqual(parse_count(42), 42)
+
+    def test_count_failures_have_a_reason(self):
+        cases = {"조회수 없음": "placeholder", "구독자 수 없음": "placeholder", "": "empty", None: "empty", "조회수": "no_number"}
+        for text, reason in cases.items():
+            with self.subTest(text=text), self.assertRaises(KoreanParseError) as raised:
+                parse_count(text, field="view_count")
+            self.assertEqual((raised.exception.field, raised.exception.reason), ("view_count", reason))
+
+    def test_lenient_parsers_default_and_count_failures(self):
+        metrics = longform_metrics.start_run()
+        self.assertEqual(parse_view_count("조회수 없음"), 0)
+        self.assertEqual(format_date("날짜 없음"), "날짜 없음")
+
+        self.assertEqual(
+            sorted((c["labels"]["field"], c["labels"]["reason"]) for c in metrics.to_dict()["counters"] if c["name"] == "parse_failure_total"),
+            [("date", "placeholder"), ("view_count", "placeholder")],
+        )
+
+    def test_prices(self):
+        self.assertEqual(parse_krw("₩12,000"), 12_000)
+        self.assertEqual(parse_krw("₩12,000 ~ ₩15,000"), 12_000)
+        with self.assertRaises(KoreanParseError):
+            parse_krw("가격 없음")
+
+    def test_absolute_dates(self):
+        for text in ("2024. 1. 5.", "2024년 1월 5일", "2024-01-05", "20240105", "최초 공개: 2024. 1. 5."):
+            with self.subTest(text=text):
+                self.assertEqual(parse_korean_date(text), datetime(2024, 1, 5))
+        for text in ("2024. 2. 30.", "3일 전", "날짜 없음"):
+            with self.subTest(text=text), self.assertRaises(KoreanParseError):
+                parse_korean_date(text)
+
+    def test_relative_dates(self):
+        today = date(2025, 6, 10)
+        cases = {
+            "3일 전": date(2025, 6, 7),
+            "2주 전": date(2025, 5, 27),
+            "1개월 전": date(2025, 5, 11),
+            "스트리밍 시간: 5시간 전": today,
+            "3 days ago": date(2025, 6, 7),
+            "2024. 1. 5.": None,
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_published_text(text, today=today), expected)
+
+    def test_repeated_values_are_served_from_cache(self):
+        for _ in range(3):
+            parse_count("구독자 1.2만명")
+            with self.assertRaises(KoreanParseError):
+                parse_count("조회수 없음")
+
+        info = longform_numbers.cache_info()["count"]
+        self.assertEqual((info.misses, info.hits), (2, 4))
+
+        longform_numbers.cache_clear()
+        self.assertEqual(longform_numbers.cache_info()["count"].currsize, 0)
+
+
+# ---------- ⬇️ 컬럼 단위 정규화가 예전 row 단위 preprocess_df 와 같은 값을 내는지 ----------
+class NormalizeFrameParityTests(TestCase):
+    MALFORMED = {
+        "view_count": ["조회수 없음", "", None, "조회수 1억 2,345만회", "1.2K views", "조회수", "조회수 1.2만회", "조회수 0회"],
+        "subscribers": ["구독자 수 없음", None, "구독자 3.4억명", "구독자 1.25만명", "3.45M subscribers", "구독자", "", "구독자 5천명"],
+        "product_price": ["무료", "", None, "₩12,000 ~ ₩15,000", "가격 없음", "₩0", "₩1,234", "12000"],
+        "upload_date": ["날짜 없음", "", "2024. 2. 30.", "2024년 1월 5일", "2024-01-05", "3일 전", "20240105", None],
+        "extracted_date": ["20250601"] * 7 + ["2025. 6. 1."],
+        "description": ["a\n\n\nb", "", None, "  x  ", "y", "z\n \nw", "q", "r"],
+    }
+
+    def assertSameAsLegacy(self, df):
+        legacy, vectorized = legacy_preprocess_df(df), normalize_frame(df)
+        for column in ("view_count", "subscribers", "product_price", "description", "upload_date", "extracted_date"):
+            with self.subTest(column=column):
+                self.assertEqual(vectorized[column].tolist(), legacy[column].tolist())
+        return vectorized
+
+    def test_synthetic_rows_match_legacy(self):
+        df = pd.concat(synthetic_video_frames(20, products_per_video=3), ignore_index=True)
+
+        normalized = self.assertSameAsLegacy(df)
+        self.assertEqual(normalized["view_count"].dtype, "int64")
+        self.assertEqual(normalized["upload_date"].dtype, "datetime64[ns]")
+
+    def test_malformed_counts_prices_and_dates_match_legacy(self):
+        df = pd.concat(synthetic_video_frames(4, products_per_video=2), ignore_index=True)
+        for column, values in self.MALFORMED.items():
+            df[column] = values
+
+        normalized = self.assertSameAsLegacy(df)
+        self.assertEqual(normalized["view_count"].tolist(), [0, 0, 0, 123_450_000, 1_200, 0, 12_000, 0])
+        self.assertEqual(normalized["upload_date"][2], "2024. 2. 30.")
+
+    def test_failures_are_counted_per_row(self):
+        run = longform_metrics.start_run()
+        normalize_counts(pd.Series(["조회수 없음"] * 3 + ["조회수", "조회수 1회"]), field="view_count")
+
+        counters = {c["labels"]["reason"]: c["value"] for c in run.to_dict()["counters"] if c["name"] == "parse_failure_total"}
+        self.assertEqual(counters, {"placeholder": 3, "no_number": 1})
+
+    def test_date_formats_are_tried_in_pattern_order(self):
+        # parse_korean_date 처럼 앞의 형식이 문자열 어디에서든 맞으면 그 형식을 쓴다
+        text = "20240105 업로드, 최초 공개: 2024. 2. 3."
+
+        self.assertEqual(normalize_dates(pd.Series([text]))[0], parse_korean_date(text))
+        self.assertEqual(parse_korean_date(text), datetime(2024, 2, 3))
+
+    def test_normalizing_twice_keeps_values(self):
+        df = pd.concat(synthetic_video_frames(3), ignore_index=True)
+        once = normalize_frame(df)
+        again = once.copy()
+        again.attrs.clear()  # 이미 정규화됐다는 표시를 지워서 실제로 다시 정규화하게 함
+        twice = normalize_frame(again)
+
+        pd.testing.assert_frame_equal(once, twice)
+
+
+# ---------- ⬇️ 다시 크롤링할 때 content_hash 가 같으면 쓰기 건너뛰기 ----------
+@override_settings(CRAWLER_SKIP_UNCHANGED=True, CRAWLER_HISTORY=False)
+class SkipUnchangedWriteTests(TestCase):
+    def save(self, frames) -> dict:
+        """upsert_frames 한 번의 db_rows_* 카운터 {(이름, table, fields): 개수}"""
+        run = longform_metrics.start_run()
+        upsert_frames([df.copy() for df in frames])
+        return {
+            (c["name"].removeprefix("db_rows_").removesuffix("_total"), c["labels"]["table"], c["labels"].get("fields")): c["value"]
+            for c in run.to_dict()["counters"]
+            if c["name"].startswith("db_rows_") and c["value"]
+        }
+
+    def test_write_counts_for_new_unchanged_and_changed_rows(self):
+        frames = synthetic_video_frames(3, products_per_video=2)
+
+        self.assertEqual(self.save(frames), {("written", "video", "all"): 3, ("written", "product", "all"): 6})
+        self.assertEqual(self.save(frames), {("unchanged", "video", None): 3, ("unchanged", "product", None): 6})
+
+        frames[0]["view_count"] = "조회수 1회"                # 조회수만 바뀜
+        frames[1]["title"] = "제목 바뀜"                       # 내용이 바뀜
+        frames[2].loc[0, "product_price"] = "₩1"              # 제품 하나의 가격만 바뀜
+        self.assertEqual(self.save(frames), {
+            ("written", "video", "counts"): 1,
+            ("written", "video", "all"): 1,
+            ("unchanged", "video", None): 1,
+            ("written", "product", "all"): 1,
+            ("unchanged", "product", None): 5,
+        })
+
+        self.assertEqual(YouTubeVideo.objects.get(video_id="vid00000000").view_count, 1)
+        self.assertEqual(YouTubeVideo.objects.get(video_id="vid00000001").title, "제목 바뀜")
+        self.assertEqual(YouTubeProduct.objects.get(product_name="제품 2-0").product_price, 1)
+
+    @override_settings(CRAWLER_SKIP_UNCHANGED=False)
+    def test_every_row_is_written_when_skipping_is_off(self):
+        frames = synthetic_video_frames(2, products_per_video=2)
+        self.save(frames)
+
+        self.assertEqual(self.save(frames), {("written", "video", "all"): 2, ("written", "product", "all"): 4})
+
+
+# ---------- ⬇️ 증분 수집: 이미 저장된 영상 확인 ----------
+class KnownVideoIdsTests(TestCase):
+    def setUp(self):
+        save_to_db(synthetic_video_frames(2, products_per_video=1))  # vid00000000, vid00000001
+
+    def test_only_the_page_candidates_are_looked_up(self):
+        collector = DiscoveryCollector(known_ids=KnownVideoIds(), stop_after_known=2)
+        page = [("new0", "1일 전"), ("vid00000000", "2일 전"), ("vid00000001", "3일 전"), ("old0", "4일 전")]
+
+        with self.assertNumQueries(1):
+            self.assertFalse(collector.add_page(page))
+
+        self.assertEqual(collector.known_ids.checked, {"new0": False, "vid00000000": True, "vid00000001": True, "old0": False})
+        self.assertEqual(len(collector.video_urls), 3)
+        self.assertEqual(collector.stop_reason, "이미 저장된 영상 2개 연속")
+
+    def test_ids_already_checked_are_not_queried_again(self):
+        known = KnownVideoIds()
+        known.prefetch(["vid00000000", "new0"])
+
+        with self.assertNumQueries(1):
+            self.assertIn("vid00000000", known)
+            self.assertNotIn("new0", known)
+            self.assertIn("vid00000001", known)
+
+
+# ---------- ⬇️ 채널 목록 JSON: videoRenderer / lockupViewModel 과 continuation ----------
+class BrowseItemsTests(TestCase):
+    CHANNEL = "https://www.youtube.com/@example"
+    VIDEO_IDS = [f"vid{i:08d}" for i in range(70)]
+
+    def lockup(self, video_id: str, content_type: str = "LOCKUP_CONTENT_TYPE_VIDEO") -> dict:
+        rows = [{"metadataParts": [{"text": {"content": "조회수 1.2만회"}}, {"text": {"content": "3주 전"}}]}]
+        return {"richItemRenderer": {"content": {"lockupViewModel": {
+            "contentId": video_id,
+            "contentType": content_type,
+            "metadata": {"lockupMetadataViewModel": {"metadata": {"contentMetadataViewModel": {"metadataRows": rows}}}},
+        }}}}
+
+    def test_reads_both_renderers_in_page_order(self):
+        items = channel_browse_items(["a"], 0) + [self.lockup("b"), self.lockup("PL1", "LOCKUP_CONTENT_TYPE_PLAYLIST")]
+        items += channel_browse_items(["c"], 0)
+        items.append({"continuationItemRenderer": {"continuationEndpoint": {"continuationCommand": {"token": "next"}}}})
+
+        videos, token = parse_browse_items({"contents": {"tabs": [{"content": items}]}})
+
+        self.assertEqual(videos, [("a", "1일 전"), ("b", "3주 전"), ("c", "1일 전")])
+        self.assertEqual(token, "next")
+
+    def test_last_page_has_no_token(self):
+        videos, token = parse_browse_items(channel_browse_response(["a", "b"], "0")["onResponseReceivedActions"])
+
+        self.assertEqual([video_id for video_id, _ in videos], ["a", "b"])
+        self.assertIsNone(token)
+
+    def discover(self, collector: DiscoveryCollector, browse_error: Exception = None):
+        html = f"<script>var ytInitialData = {json.dumps({'contents': channel_browse_items(self.VIDEO_IDS, 0)})};</script>"
+        tokens = []
+
+        def fake_request(session, method, url, json=None, **kwargs):
+            if method == "GET":
+                return mock.Mock(text=html, status_code=200)
+            tokens.append(json["continuation"])
+            if browse_error:
+                raise browse_error
+            return mock.Mock(status_code=200, json=mock.Mock(return_value=channel_browse_response(self.VIDEO_IDS, json["continuation"])))
+
+        with mock.patch("youtube_crawling.longform_discovery.throttled_request", side_effect=fake_request):
+            video_urls = discover_video_urls_http(self.CHANNEL, collector)
+        return video_urls, tokens
+
+    def test_follows_continuations_to_the_last_page(self):
+        video_urls, tokens = self.discover(DiscoveryCollector())
+
+        self.assertEqual(tokens, ["30", "60"])
+        self.assertEqual(video_urls, [f"https://www.youtube.com/watch?v={video_id}" for video_id in self.VIDEO_IDS])
+
+    def test_stops_requesting_once_the_limit_is_reached(self):
+        video_urls, tokens = self.discover(DiscoveryCollector(limit=40))
+
+        self.assertEqual(tokens, ["30"])
+        self.assertEqual(len(video_urls), 40)
+
+    def test_continuation_error_keeps_the_first_page(self):
+        video_urls, tokens = self.discover(DiscoveryCollector(), browse_error=requests.ConnectionError("끊김"))
+
+        self.assertEqual(tokens, ["30"])
+        self.assertEqual(len(video_urls), 30)
+
+
+# ---------- ⬇️ 채널 영상 ID/채널명 수집: HTTP로 끝나면 브라우저를 띄우지 않음 ----------
+@override_settings(CRAWLER_DISCOVERY="http", CRAWLER_RATE_LIMIT=False)
+class DiscoverChannelTests(TestCase):
+    CHANNEL = "https://www.youtube.com/@example"
+
+    def discover(self, initial: dict, head: str = ""):
+        html = f"<html><head>{head}</head><body><script>var ytInitialData = {json.dumps(initial, ensure_ascii=False)};</script></body></html>"
+        response = mock.Mock(text=html, status_code=200, url=self.CHANNEL + "/videos")
+        with mock.patch("youtube_crawling.longform_discovery.throttled_request", return_value=response), \
+                mock.patch("youtube_crawling.longform_crawler.get_pool") as get_pool:
+            result = discover_channel(self.CHANNEL, incremental=False)
+        get_pool.assert_not_called()
+        return result
+
+    def test_channel_name_comes_from_initial_data(self):
+        initial = {"metadata": {"channelMetadataRenderer": {"title": "예시 채널"}}, "contents": channel_browse_items(["a", "b"], 0)}
+
+        name, video_urls = self.discover(initial, head='<meta property="og:title" content="다른 이름">')
+
+        self.assertEqual(name, "예시 채널")
+        self.assertEqual(video_urls, ["https://www.youtube.com/watch?v=a", "https://www.youtube.com/watch?v=b"])
+
+    def test_channel_name_falls_back_to_og_title(self):
+        name, video_urls = self.discover({"contents": channel_browse_items(["a"], 0)}, head='<meta property="og:title" content="예시 &amp; 채널">')
+
+        self.assertEqual(name, "예시 & 채널")
+        self.assertEqual(len(video_urls), 1)
+
+
+# ---------- ⬇️ HTML 파서 백엔드: 어떤 파서로 읽어도 같은 값 ----------
+class ParserBackendTests(TestCase):
+    HTML = watch_page_html("vid00000000", 2, random.Random(0))
+
+    def read(self, parser: str) -> dict:
+        doc = longform_parser.parse_html(self.HTML, parser)
+        return {
+            "title": select_first_text(doc, ["#title yt-formatted-string"]),
+            "views": select_first_text(doc, ["#view-count", "span.view-count"]),
+            "channel_link": doc.select_one("ytd-channel-name a").attr("href"),
+            "missing": doc.select_one("#does-not-exist"),
+            "products": extract_products_from_html(doc),
+        }
+
+    def test_every_parser_reads_the_same_fields(self):
+        expected = self.read("html.parser")
+        self.assertEqual(expected["title"], "벤치마크 영상 vid00000000")
+        self.assertEqual(expected["channel_link"], "/@bench")
+        self.assertIsNone(expected["missing"])
+        self.assertEqual([p["title"] for p in expected["products"]], ["제품 vid00000000-0", "제품 vid00000000-1"])
+
+        for parser in ("lxml", "selectolax"):
+            with self.subTest(parser=parser):
+                try:
+                    self.assertEqual(self.read(parser), expected)
+                except ImproperlyConfigured:
+                    self.skipTest(f"{parser} 미설치")
+
+    def test_unknown_or_missing_parser_is_a_configuration_error(self):
+        with self.assertRaises(ImproperlyConfigured):
+            longform_parser.parse_html(self.HTML, "html5lib")
+        with mock.patch.object(longform_parser, "SelectolaxParser", None), self.assertRaises(ImproperlyConfigured):
+            longform_parser.parse_html(self.HTML, "selectolax")
+
+    def test_default_parser_prefers_the_fastest_installed(self):
+        with mock.patch.object(longform_parser, "SelectolaxParser", None), mock.patch.object(longform_parser, "lxml", None):
+            self.assertEqual(longform_parser.default_parser(), "html.parser")
+        with mock.patch.object(longform_parser, "SelectolaxParser", object()):
+            self.assertEqual(longform_parser.default_parser(), "selectolax")
+
+    def test_subtree_html_falls_back_to_page_source(self):
+        driver = mock.Mock(page_source="<html>전체</html>")
+        driver.execute_script.return_value = "<ytd-watch-metadata></ytd-watch-metadata>"
+        self.assertEqual(longform_parser.watch_page_html(driver, subtree=True), "<html><body><ytd-watch-metadata></ytd-watch-metadata></body></html>")
+
+        driver.execute_script.return_value = ""  # 꺼내올 노드가 없음
+        self.assertEqual(longform_parser.watch_page_html(driver, subtree=True), "<html>전체</html>")
+
+        driver.execute_script.side_effect = Exception("스크립트 실패")
+        self.assertEqual(longform_parser.watch_page_html(driver, subtree=True), "<html>전체</html>")
+
+
+# ---------- ⬇️ 브라우저 풀: 페이지를 많이 연 세션은 반납할 때 교체 ----------
+class FakeDriver:
+    def __init__(self):
+        self.pages_loaded = 0
+        self.quit_called = False
+
+    def get(self, url):
+        self.pages_loaded += 1
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class BrowserPoolRecycleTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch("youtube_crawling.longform_browser.launch_driver", side_effect=FakeDriver)
+        self.launch_driver = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = BrowserPool(max_idle=2, max_pages=3, max_rss_mb=0)
+        self.addCleanup(self.pool.close)
+
+    def browse(self, pages: int):
+        driver = self.pool.acquire()
+        for i in range(pages):
+            driver.get(f"https://www.youtube.com/watch?v={i}")
+        self.pool.release(driver)
+        return driver
+
+    def test_session_is_reused_until_it_reaches_max_pages(self):
+        first = self.browse(2)
+        second = self.browse(1)
+
+        self.assertIs(first, second)
+        self.assertTrue(second.quit_called)
+        self.assertIsNot(self.browse(1), first)
+        self.assertEqual(self.launch_driver.call_count, 2)
+
+    def test_zero_max_pages_never_recycles(self):
+        self.pool.max_pages = 0
+        driver = self.browse(50)
+
+        self.assertFalse(driver.quit_called)
+        self.assertIs(self.pool.acquire(), driver)
+
+    def test_pooled_chrome_counts_page_loads(self):
+        with mock.patch.object(webdriver.Chrome, "__init__", return_value=None), \
+                mock.patch.object(webdriver.Chrome, "get") as chrome_get:
+            driver = PooledChrome()
+            driver.get("https://www.youtube.com/watch?v=a")
+            driver.get("https://www.youtube.com/watch?v=b")
+
+        self.assertEqual(driver.pages_loaded, 2)
+        self.assertEqual(chrome_get.call_count, 2)
+        self.assertTrue(self.pool.needs_recycle(mock.Mock(pages_loaded=3)))
+
+
+# ---------- ⬇️ merch shelf: 스크립트 한 번으로 추출, 실패하면 HTML 파싱 ----------
+class MerchScriptTests(TestCase):
+    RAW_ITEMS = [
+        {"title": " 제품 A ", "price": "₩12,000", "merchant": "shop.com!", "url": "https://shop/a", "imageUrl": "https://i/a.jpg"},
+        {"title": "가격 없는 제품", "price": "", "merchant": "", "url": "", "imageUrl": ""},
+        {"title": "제품 B", "price": "₩3,000", "merchant": "", "url": "", "imageUrl": ""},
+    ]
+
+    def test_all_items_come_from_one_script_call(self):
+        driver = mock.Mock(execute_script=mock.Mock(return_value=self.RAW_ITEMS))
+        run = longform_metrics.start_run()
+
+        products = extract_products_from_dom(driver, doc=None)
+
+        driver.execute_script.assert_called_once_with(MERCH_ITEMS_SCRIPT, MERCH_ITEM_SELECTORS)
+        self.assertEqual(products, [
+            {"title": "제품 A", "price": "₩12,000", "imageUrl": "https://i/a.jpg", "url": "https://shop/a", "merchant": "shop.com"},
+            {"title": "제품 B", "price": "₩3,000", "imageUrl": ""},
+        ])
+        self.assertIn({"name": "shadow_image_miss_total", "labels": {}, "value": 1}, run.to_dict()["counters"])
+
+    def test_script_failure_falls_back_to_parsed_html(self):
+        driver = mock.Mock(execute_script=mock.Mock(side_effect=WebDriverException("script timeout")))
+        doc = longform_parser.parse_html(watch_page_html("vid00000000", 2, random.Random(0)))
+
+        products = extract_products_from_dom(driver, doc)
+
+        self.assertEqual([p["title"] for p in products], ["제품 vid00000000-0", "제품 vid00000000-1"])
+
+    def test_no_shelf_is_an_empty_list(self):
+        driver = mock.Mock(execute_script=mock.Mock(return_value=[]))
+        doc = longform_parser.parse_html("<html><body><div id='description'></div></body></html>")
+
+        self.assertEqual(extract_products_from_dom(driver, doc), [])
@@ -1,6 +1,8 @@
 from django.urls import path
-from youtube_crawling.views.longform_api_views import ChannelCrawlTriggerView
+from youtube_crawling.views.longform_api_views import ChannelCrawlTriggerView, CrawlMetricsView, CrawlTrendView
 
 urlpatterns = [
     path('', ChannelCrawlTriggerView.as_view()), # 유튜브 채널에 있는 영상 크롤링 (POST,GET,PUT,DELETE)
+    path('metrics/', CrawlMetricsView.as_view()), # 최근 크롤링 실행의 단계별 시간/카운터 (Prometheus 텍스트)
+    path('trends/', CrawlTrendView.as_view()), # 채널 일간 집계 / 영상별 조회수·가격 이력
 ]
\ No newline at end of file
@@ -1,22 +1,68 @@
 # ---------- DRF 관련 라이브러리 ----------
-from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 # ---------- Swagger 관련 라이브러리 ----------
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 # ---------- 프로젝트 모델 ----------
-from ..models import YouTubeVideo
+from ..models import YouTubeVideo, YouTubeProduct
 # ---------- 프로젝트 시리얼라이저 ----------
 from youtube_crawling.serializers.longform_serializers import YouTubeVideoSerializer
+# ---------- 프로젝트 페이지네이션 ----------
+from youtube_crawling.pagination import VideoCursorPagination
 # ---------- 프로젝트 태스크 ----------
-from youtube_crawling.longform_crawler import crawl_channel_videos
+from youtube_crawling.longform_tasks import discover_channel_task
+from youtube_crawling.longform_metrics import load_latest_run, to_prometheus
+from youtube_crawling.longform_history import channel_trend, price_history, video_history
 # ---------- 그 외 라이브러리 ----------
+from django.http import HttpResponse
+from django.utils.dateparse import parse_date
 from urllib.parse import urlparse
 
 
+# ---------- 영상 목록 필터 (쿼리 파라미터 -> ORM lookup) ----------
+DATE_FILTERS = [
+    ("upload_date_from", "upload_date__gte"),
+    ("upload_date_to", "upload_date__lte"),
+    ("extracted_date_from", "extracted_date__gte"),
+    ("extracted_date_to", "extracted_date__lte"),
+]
+PRICE_FILTERS = [
+    ("price_min", "product_price__gte"),
+    ("price_max", "product_price__lte"),
+]
+
+
+def filter_videos(queryset, params):
+    """쿼리 파라미터로 영상 목록을 필터링한다. 값 형식이 잘못되면 ValueError"""
+    if channel_name := params.get("channel_name"):
+        queryset = queryset.filter(channel_name=channel_name)
+
+    for param, lookup in DATE_FILTERS:
+        if value := params.get(param):
+            try:
+                parsed = parse_date(value)
+            except ValueError:
+                parsed = None
+            if parsed is None:
+                raise ValueError(f"{param}는 YYYY-MM-DD 형식이어야 합니다.")
+            queryset = queryset.filter(**{lookup: parsed})
+
+    price_lookups = {}
+    for param, lookup in PRICE_FILTERS:
+        if value := params.get(param):
+            if not value.isdigit():
+                raise ValueError(f"{param}는 0 이상의 정수여야 합니다.")
+            price_lookups[lookup] = int(value)
+    if price_lookups:
+        # JOIN 대신 서브쿼리로 걸러서 영상이 중복되지 않게 함
+        queryset = queryset.filter(id__in=YouTubeProduct.objects.filter(**price_lookups).values("video_id"))
+    return queryset
+
+
 # ------------------------------------- ⬇️ 크롤링 자동화 딸깍 클래스 -------------------------------
 class ChannelCrawlTriggerView(APIView):
+    @staticmethod
     def is_valid_youtube_channel_url(url):
         parsed = urlparse(url)
         return parsed.scheme in ['http', 'https'] and "youtube.com" in parsed.netloc
@@ -51,19 +97,49 @@ class ChannelCrawlTriggerView(APIView):
 
         for url in channel_urls:
             save_dir = "./crawling_result_csv"
-            crawl_channel_videos.delay(url, save_dir) # <- 크롤링 태스크 실행
+            discover_channel_task.delay(url, save_dir) # <- 채널 영상 수집 -> 영상별 크롤링 -> 저장 파이프라인 실행
 
         return Response({"message": f"{len(channel_urls)}개의 크롤링이 시작되었습니다."}, status=202)
     
-    # ---------- 크롤링한 유튜브 영상 전체 조회 ----------
+    # ---------- 크롤링한 유튜브 영상 목록 조회 (커서 페이지네이션 + 필터) ----------
     @swagger_auto_schema(
-        operation_summary="크롤링한 유튜브 영상 전체 조회")
+        operation_summary="크롤링한 유튜브 영상 목록 조회",
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, description='다음/이전 페이지 커서 (응답의 next, previous 링크 사용)', type=openapi.TYPE_STRING),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description='페이지 크기 (기본 50, 최대 200)', type=openapi.TYPE_INTEGER),
+            openapi.Parameter('channel_name', openapi.IN_QUERY, description='채널명', type=openapi.TYPE_STRING),
+            openapi.Parameter('upload_date_from', openapi.IN_QUERY, description='업로드일 시작 (YYYY-MM-DD)', type=openapi.TYPE_STRING),
+            openapi.Parameter('upload_date_to', openapi.IN_QUERY, description='업로드일 끝 (YYYY-MM-DD)', type=openapi.TYPE_STRING),
+            openapi.Parameter('extracted_date_from', openapi.IN_QUERY, description='수집일 시작 (YYYY-MM-DD)', type=openapi.TYPE_STRING),
+            openapi.Parameter('extracted_date_to', openapi.IN_QUERY, description='수집일 끝 (YYYY-MM-DD)', type=openapi.TYPE_STRING),
+            openapi.Parameter('price_min', openapi.IN_QUERY, description='제품 최소 가격', type=openapi.TYPE_INTEGER),
+            openapi.Parameter('price_max', openapi.IN_QUERY, description='제품 최대 가격', type=openapi.TYPE_INTEGER),
+            openapi.Parameter('fields', openapi.IN_QUERY, description='응답에 포함할 필드 (쉼표로 구분, 예: video_id,title,products)', type=openapi.TYPE_STRING),
+        ])
     
     def get(self, request):
-        """전체 영상 목록 조회"""
-        queryset = YouTubeVideo.objects.all().order_by('-extracted_date')
-        serializer = YouTubeVideoSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        """영상 목록 조회"""
+        fields = [f.strip() for f in request.query_params.get("fields", "").split(",") if f.strip()]
+        unknown_fields = set(fields) - set(YouTubeVideoSerializer().fields)
+        if unknown_fields:
+            return Response({"error": f"알 수 없는 필드가 있습니다: {sorted(unknown_fields)}"}, status=400)
+
+        try:
+            queryset = filter_videos(YouTubeVideo.objects.all(), request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+        if fields:
+            # 필요한 컬럼만 조회 (커서 정렬에 쓰는 id는 항상 포함)
+            columns = {f.name for f in YouTubeVideo._meta.concrete_fields} & set(fields)
+            queryset = queryset.only("id", *columns)
+        if not fields or "products" in fields:
+            queryset = queryset.prefetch_related("products")  # 영상마다 제품 쿼리가 나가는 N+1 방지
+
+        paginator = VideoCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = YouTubeVideoSerializer(page, many=True, fields=fields or None)
+        return paginator.get_paginated_response(serializer.data)
     
 
     # ---------- 크롤링한 유튜브 영상 전체 갱신(재크롤링) ----------
@@ -96,7 +172,7 @@ class ChannelCrawlTriggerView(APIView):
 
         for url in channel_urls:
             save_dir = "./crawling_result_csv"
-            crawl_channel_videos.delay(url, save_dir)
+            discover_channel_task.delay(url, save_dir, incremental=False) # <- 저장된 영상도 전부 다시 크롤링
 
         return Response({"message": f"{len(channel_urls)}개의 크롤링이 재시작되었습니다."}, status=202)
 
@@ -138,3 +214,61 @@ class ChannelCrawlTriggerView(APIView):
             deleted_count += count
 
         return Response({"message": f"총 {deleted_count}개의 영상 및 관련 제품 정보가 삭제되었습니다."}, status=200)
+
+
+# ---------- 마지막 크롤링 실행의 단계별 시간/카운터 ----------
+class CrawlMetricsView(APIView):
+    @swagger_auto_schema(
+        operation_summary="크롤링 지표 조회",
+        operation_description="가장 최근 크롤링 실행의 단계별 소요 시간과 재시도/셀렉터 실패 카운터를 Prometheus 텍스트 형식으로 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter('output', openapi.IN_QUERY, description="json 이면 JSON으로 반환", type=openapi.TYPE_STRING),
+        ],
+        responses={200: "Prometheus 텍스트 또는 JSON", 404: "크롤링 기록 없음"},
+    )
+    def get(self, request):
+        data = load_latest_run()
+        if data is None:
+            return Response({"error": "아직 기록된 크롤링 실행이 없습니다."}, status=404)
+        if request.query_params.get("output") == "json":
+            return Response(data, status=200)
+        return HttpResponse(to_prometheus(data), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+# ---------- 조회수/구독자 수/가격 추세 (이력 테이블 조회) ----------
+class CrawlTrendView(APIView):
+    @swagger_auto_schema(
+        operation_summary="채널/영상 추세 조회",
+        operation_description="channel_name 이면 채널의 일간 집계, video_id 이면 영상의 날짜별 조회수/구독자 수와 제품 가격 이력을 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter('channel_name', openapi.IN_QUERY, description='채널명', type=openapi.TYPE_STRING),
+            openapi.Parameter('video_id', openapi.IN_QUERY, description='영상 ID', type=openapi.TYPE_STRING),
+            openapi.Parameter('date_from', openapi.IN_QUERY, description='수집일 시작 (YYYY-MM-DD)', type=openapi.TYPE_STRING),
+            openapi.Parameter('date_to', openapi.IN_QUERY, description='수집일 끝 (YYYY-MM-DD)', type=openapi.TYPE_STRING),
+        ],
+        responses={200: "날짜별 추세", 400: "잘못된 파라미터"},
+    )
+    def get(self, request):
+        channel_name = request.query_params.get("channel_name")
+        video_id = request.query_params.get("video_id")
+        if bool(channel_name) == bool(video_id):
+            return Response({"error": "channel_name 또는 video_id 중 하나만 입력해주세요."}, status=400)
+
+        date_range = {}
+        for param in ("date_from", "date_to"):
+            if value := request.query_params.get(param):
+                try:
+                    parsed = parse_date(value)
+                except ValueError:
+                    parsed = None
+                if parsed is None:
+                    return Response({"error": f"{param}는 YYYY-MM-DD 형식이어야 합니다."}, status=400)
+                date_range[param] = parsed
+
+        if channel_name:
+            return Response({"channel_name": channel_name, "daily": channel_trend(channel_name, **date_range)}, status=200)
+        return Response({
+            "video_id": video_id,
+            "daily": video_history(video_id, **date_range),
+            "prices": price_history(video_id, **date_range),
+        }, status=200)